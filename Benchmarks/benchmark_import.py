@@ -0,0 +1,68 @@
+# Start cost of a frame generation process: imports of every process before (FluidFrames.py re-imported by every
+# spawn process) vs after the module split (launcher + engine, onnxruntime imported with the first AI model)
+# The "before" cases run in a git worktree of the commit before the module split (or of the given revision)
+#
+# python Benchmarks/benchmark_import.py [before revision]
+
+import sys
+from os.path    import dirname, abspath, join
+from subprocess import run as subprocess_run
+from statistics import median
+from tempfile   import mkdtemp
+from shutil     import rmtree as remove_directory
+from timeit     import default_timer as timer
+
+REPOSITORY_PATH = dirname(dirname(abspath(__file__)))
+
+# Every spawn process ran FluidFrames.py as __mp_main__ (module level code only)
+BEFORE_WORKER_STATEMENT = "import runpy; runpy.run_path('FluidFrames.py', run_name = '__mp_main__')"
+
+STARTUP_CASES = {
+    "interpreter":                   ("after",  "pass"),
+    "before: worker (FluidFrames)":  ("before", BEFORE_WORKER_STATEMENT),
+    "after: worker (engine)":        ("after",  "import fluidframes.engine"),
+    "after: worker first AI model":  ("after",  "import fluidframes.engine, onnxruntime"),
+    "after: command line":           ("after",  "import fluidframes.cli"),
+}
+ITERATIONS = 10
+
+
+
+def run_git(*arguments: str) -> str:
+    return subprocess_run([ "git", *arguments ], cwd = REPOSITORY_PATH, check = True, capture_output = True, text = True).stdout.strip()
+
+def get_before_revision() -> str:
+    # Parent of the commit that moved the GUI out of FluidFrames.py
+    split_commit = run_git("log", "--diff-filter=A", "--format=%H", "--", "fluidframes/gui.py").split()[-1]
+    return f"{split_commit}^"
+
+def measure(statement: str, working_directory: str) -> float:
+    elapsed_times = []
+
+    for _ in range(ITERATIONS):
+        start_timer = timer()
+        subprocess_run([sys.executable, "-c", statement], cwd = working_directory, check = True, capture_output = True)
+        elapsed_times.append(timer() - start_timer)
+
+    return median(elapsed_times) * 1000
+
+
+
+if __name__ == "__main__":
+    before_revision = sys.argv[1] if len(sys.argv) > 1 else get_before_revision()
+    worktree_parent = mkdtemp()
+    worktree_path   = join(worktree_parent, "before")
+    run_git("worktree", "add", "--detach", worktree_path, before_revision)
+
+    try:
+        working_directories = { "before": worktree_path, "after": REPOSITORY_PATH }
+        interpreter_time    = measure("pass", REPOSITORY_PATH)
+
+        print(f"Before: {run_git('log', '-1', '--format=%h %s', before_revision)}")
+        print(f"{'Process':<32}{'start ms':>12}{'imports ms':>12}")
+        for case_name, (tree, statement) in STARTUP_CASES.items():
+            start_time = measure(statement, working_directories[tree]) if statement != "pass" else interpreter_time
+            print(f"{case_name:<32}{start_time:>12.1f}{start_time - interpreter_time:>12.1f}")
+    finally:
+        run_git("worktree", "remove", "--force", worktree_path)
+        remove_directory(worktree_parent, ignore_errors = True)
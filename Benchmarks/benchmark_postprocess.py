@@ -0,0 +1,91 @@
+# Per-frame cost of the AI output postprocess: legacy chain of numpy passes vs fused postprocess into pooled buffers
+# Small frames (540p) fit the CPU caches, there the fused postprocess is only as fast as the legacy chain
+# and the gain is the memory, the speedup grows with the frame size
+#
+# python Benchmarks/benchmark_postprocess.py
+
+import sys
+from os.path    import dirname, abspath
+from timeit     import default_timer as timer
+from tracemalloc import (
+    start        as tracemalloc_start,
+    stop         as tracemalloc_stop,
+    reset_peak   as tracemalloc_reset_peak,
+    get_traced_memory
+)
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from numpy import (
+    ndarray   as numpy_ndarray,
+    squeeze   as numpy_squeeze,
+    clip      as numpy_clip,
+    transpose as numpy_transpose,
+    copyto    as numpy_copyto,
+    empty_like as numpy_empty_like,
+    float32,
+    uint8
+)
+from numpy.random import default_rng
+
+from fluidframes.engine import FrameBufferPool, postprocess_output_into
+
+RESOLUTIONS = {
+    "540p":  (540,  960),
+    "1080p": (1080, 1920),
+    "4K":    (2160, 3840),
+}
+ITERATIONS = 20
+
+
+
+def legacy_postprocess(onnx_output: numpy_ndarray) -> numpy_ndarray:
+    onnx_output = numpy_squeeze(onnx_output, axis=0)
+    onnx_output = numpy_clip(onnx_output, 0, 1)
+    onnx_output = numpy_transpose(onnx_output, (1, 2, 0))
+    onnx_output = onnx_output.astype(float32)
+    return (onnx_output * 255).astype(uint8)
+
+def fused_postprocess(onnx_output: numpy_ndarray, frame_buffer_pool: FrameBufferPool) -> numpy_ndarray:
+    _, channels, height, width = onnx_output.shape
+    output_buffer = frame_buffer_pool.acquire((height, width, channels), uint8)
+    postprocess_output_into(onnx_output[0], output_buffer)
+    frame_buffer_pool.release(output_buffer)    # writer consumed the frame
+    return output_buffer
+
+def measure(function, onnx_output: numpy_ndarray, *args) -> tuple[float, float]:
+    scratch_output = numpy_empty_like(onnx_output)
+    elapsed_time   = 0.0
+    peak_memory    = 0
+
+    for _ in range(ITERATIONS):
+        numpy_copyto(scratch_output, onnx_output)
+
+        tracemalloc_reset_peak()
+        start_memory, _ = get_traced_memory()
+        start_timer     = timer()
+        function(scratch_output, *args)
+        elapsed_time   += timer() - start_timer
+        _, peak         = get_traced_memory()
+        peak_memory     = max(peak_memory, peak - start_memory)
+
+    return elapsed_time / ITERATIONS * 1000, peak_memory / (1024 * 1024)
+
+
+
+if __name__ == "__main__":
+    random_generator  = default_rng(0)
+    frame_buffer_pool = FrameBufferPool()
+
+    tracemalloc_start()
+
+    print(f"{'Resolution':<12}{'legacy ms':>12}{'fused ms':>12}{'legacy MB':>12}{'fused MB':>12}{'speedup':>10}")
+    for resolution_name, (height, width) in RESOLUTIONS.items():
+        onnx_output = random_generator.uniform(-0.05, 1.05, (1, 3, height, width)).astype(float32)
+
+        legacy_time, legacy_memory = measure(legacy_postprocess, onnx_output)
+        fused_time,  fused_memory  = measure(fused_postprocess,  onnx_output, frame_buffer_pool)
+
+        print(f"{resolution_name:<12}{legacy_time:>12.2f}{fused_time:>12.2f}{legacy_memory:>12.1f}{fused_memory:>12.1f}{legacy_time / fused_time:>9.2f}x")
+
+    tracemalloc_stop()
@@ -0,0 +1 @@
+# FluidFrames frame generation engine (fluidframes.engine) and headless command line (python -m fluidframes)
@@ -0,0 +1,8 @@
+import sys
+from multiprocessing import freeze_support as multiprocessing_freeze_support
+
+from fluidframes.cli import main
+
+if __name__ == "__main__":
+    multiprocessing_freeze_support()
+    sys.exit(main())
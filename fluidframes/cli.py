@@ -0,0 +1,257 @@
+# Standard library imports
+import sys
+from argparse   import ArgumentParser, Namespace
+from time       import sleep
+from timeit     import default_timer as timer
+from queue      import Empty as QueueEmpty
+from json       import dumps as json_dumps
+from multiprocessing import (
+    Process,
+    Queue as multiprocessing_Queue
+)
+
+from os import (
+    cpu_count  as os_cpu_count,
+    makedirs   as os_makedirs,
+    dup2       as os_dup2
+)
+
+from os.path import (
+    abspath    as os_path_abspath,
+    isfile     as os_path_isfile,
+    splitext   as os_path_splitext
+)
+
+# Shared settings, the engine (numpy, opencv, onnxruntime) is imported by the frame generation processes only
+from fluidframes.config import (
+    app_name,
+    version,
+    MENU_LIST_SEPARATOR,
+    AI_models_list,
+    AI_precision_list,
+    gpus_list,
+    frames_pipeline_list,
+    image_extension_list,
+    video_extension_list,
+    video_codec_list,
+    supported_video_extensions,
+    OUTPUT_PATH_CODED,
+    FFMPEG_EXE_PATH,
+    COMPLETED_STATUS,
+    ERROR_STATUS,
+    get_user_preference
+)
+
+CLI_STATUS_POLL_SECONDS = 0.5
+CLI_FRAME_GEN_FACTORS   = [ 2, 4, 8 ]
+
+
+
+# Progress events ------------------------
+
+def write_event(event: str, **fields) -> None:
+    print(json_dumps({ "event": event, **fields }), flush = True)
+
+def write_job_event(event: str, job: dict, **fields) -> None:
+    write_event(event, input = job["input"], job = job["number"], **fields)
+
+
+
+# Interpolation jobs ------------------------
+
+def interpolation_job(
+        process_status_q: multiprocessing_Queue,
+        selected_gpu: str,
+        device_profile_overrides: dict,
+        orchestrator_args: tuple
+        ) -> None:
+
+    # stdout is reserved to the JSON progress events, engine prints and ffmpeg/exiftool outputs go to stderr
+    sys.stdout.flush()
+    os_dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    from fluidframes.engine import frame_generation_orchestrator
+
+    # Command line options override the user preference of the selected device profile
+    if device_profile_overrides:
+        device_profiles = get_user_preference().setdefault("default_device_profiles", {})
+        device_profiles[selected_gpu] = { **device_profiles.get(selected_gpu, {}), **device_profile_overrides }
+
+    frame_generation_orchestrator(process_status_q, *orchestrator_args)
+
+def start_interpolation_job(job: dict, arguments: Namespace, device_profile_overrides: dict) -> None:
+    generation_option = f"Slowmotion x{arguments.factor}" if arguments.slowmotion else f"x{arguments.factor}"
+
+    orchestrator_args = (
+        [ job["input"] ],
+        arguments.output,
+        arguments.model,
+        arguments.precision,
+        arguments.device,
+        generation_option,
+        arguments.image_extension,
+        arguments.video_extension,
+        arguments.codec,
+        arguments.input_resize / 100,
+        arguments.output_resize / 100,
+        arguments.cpu_threads,
+        arguments.keep_frames,
+        arguments.pipeline
+    )
+
+    job["status_q"]   = multiprocessing_Queue()
+    job["status"]     = None
+    job["start_time"] = timer()
+    job["process"]    = Process(
+        target = interpolation_job,
+        args   = (job["status_q"], arguments.device, device_profile_overrides, orchestrator_args)
+    )
+    job["process"].start()
+    write_job_event("started", job)
+
+def read_interpolation_job_status(job: dict) -> None:
+    while True:
+        try:
+            status = job["status_q"].get_nowait()
+        except QueueEmpty:
+            return
+
+        if status != job["status"]:
+            job["status"] = status
+            if status != COMPLETED_STATUS and not status.startswith(ERROR_STATUS):
+                # Frame generation steps carry numeric fields (percent, frames_done, frames_total, eta_seconds)
+                write_job_event("progress", job, status = str(status), **getattr(status, "progress", {}))
+
+def finish_interpolation_job(job: dict) -> bool:
+    job["process"].join()
+    read_interpolation_job_status(job)
+    elapsed = round(timer() - job["start_time"], 2)
+
+    if job["status"] == COMPLETED_STATUS:
+        # The frame generation process reports the videos it wrote, completed only if they really exist
+        output_videos = getattr(job["status"], "progress", {}).get("output_videos", [])
+        if len(output_videos) > 0 and all(os_path_isfile(output_video) for output_video in output_videos):
+            write_job_event("completed", job, output = output_videos[0], elapsed = elapsed)
+            return True
+        error = f"Output video not found {' '.join(output_videos)}".strip()
+    elif job["status"] is not None and job["status"].startswith(ERROR_STATUS):
+        error = job["status"].replace(ERROR_STATUS, "").strip()
+    else:
+        error = f"Frame generation process exited with code {job['process'].exitcode}"
+    write_job_event("error", job, error = error, elapsed = elapsed)
+    return False
+
+def check_input_file(input_path: str) -> str | None:
+    if not os_path_isfile(input_path):
+        return "File not found"
+    if os_path_splitext(input_path)[1] not in supported_video_extensions:
+        return "Not supported file extension"
+    return None
+
+
+
+# Command line ------------------------
+
+def get_argument_parser() -> ArgumentParser:
+    devices_list = [ device for device in gpus_list if device not in MENU_LIST_SEPARATOR ]
+    codecs_list  = [ codec for codec in video_codec_list if codec not in MENU_LIST_SEPARATOR ]
+
+    parser = ArgumentParser(
+        prog        = "fluidframes", 
+        description = f"{app_name} {version} headless frame generation",
+        epilog      = "ffmpeg is required: Assets/ffmpeg.exe, otherwise the ffmpeg found in PATH (exiftool the same, optional)"
+    )
+    commands = parser.add_subparsers(dest = "command", required = True)
+
+    interpolate = commands.add_parser("interpolate", help = "generate frames for one or more videos", epilog = parser.epilog)
+    interpolate.add_argument("inputs", nargs = "+", help = "videos to process")
+    interpolate.add_argument("--output",          default = OUTPUT_PATH_CODED, help = "output directory (default: same path as input files)")
+    interpolate.add_argument("--model",           default = AI_models_list[0],       choices = AI_models_list)
+    interpolate.add_argument("--precision",       default = AI_precision_list[0],    choices = AI_precision_list)
+    interpolate.add_argument("--device",          default = devices_list[0],         choices = devices_list)
+    interpolate.add_argument("--factor",          default = 2, type = int,           choices = CLI_FRAME_GEN_FACTORS)
+    interpolate.add_argument("--slowmotion",      action = "store_true",             help = "slow the video down instead of raising the fps")
+    interpolate.add_argument("--input-resize",    default = 100, type = int,         help = "input resolution %% (default: 100)")
+    interpolate.add_argument("--output-resize",   default = 100, type = int,         help = "output resolution %% (default: 100)")
+    interpolate.add_argument("--codec",           default = codecs_list[0],          choices = codecs_list)
+    interpolate.add_argument("--video-extension", default = video_extension_list[0], choices = video_extension_list)
+    interpolate.add_argument("--image-extension", default = image_extension_list[0], choices = image_extension_list)
+    interpolate.add_argument("--pipeline",        default = frames_pipeline_list[0], choices = frames_pipeline_list)
+    interpolate.add_argument("--keep-frames",     action = "store_true",             help = "keep the generated frames as image files")
+    interpolate.add_argument("--cpu-threads",     default = max(1, int(os_cpu_count()/2)), type = int, help = "frame extraction and writing workers of every job")
+    interpolate.add_argument("--intra-op-threads", type = int, help = "onnxruntime intra-op threads (device profile override)")
+    interpolate.add_argument("--inter-op-threads", type = int, help = "onnxruntime inter-op threads (device profile override)")
+    interpolate.add_argument("--batch-size",       type = int, help = "frame pairs for every inference (device profile override)")
+    interpolate.add_argument("--inference-sessions", type = int, help = "CPU inference sessions, 0 = calibrated (device profile override)")
+    interpolate.add_argument("--jobs",            default = 1, type = int,           help = "videos processed at the same time (default: 1)")
+
+    return parser
+
+def interpolate_command(arguments: Namespace) -> int:
+    if not os_path_isfile(FFMPEG_EXE_PATH):
+        write_event("error", error = "ffmpeg not found, copy ffmpeg.exe in the Assets folder or install ffmpeg in PATH")
+        return 2
+
+    for option in ("input_resize", "output_resize", "cpu_threads", "jobs"):
+        if getattr(arguments, option) <= 0:
+            write_event("error", error = f"--{option.replace('_', '-')} must be a value > 0")
+            return 2
+
+    if arguments.output != OUTPUT_PATH_CODED:
+        arguments.output = os_path_abspath(arguments.output)
+        os_makedirs(arguments.output, exist_ok = True)
+
+    device_profile_overrides = {
+        profile_key: getattr(arguments, profile_key)
+        for profile_key in ("intra_op_threads", "inter_op_threads", "batch_size", "inference_sessions")
+        if getattr(arguments, profile_key) is not None
+    }
+
+    pending_jobs   = []
+    running_jobs   = []
+    completed_jobs = 0
+    failed_jobs    = 0
+
+    for job_number, input_path in enumerate(arguments.inputs, start = 1):
+        job = { "number": job_number, "input": os_path_abspath(input_path) }
+        input_error = check_input_file(input_path)
+        if input_error is None:
+            pending_jobs.append(job)
+        else:
+            write_job_event("error", job, error = input_error)
+            failed_jobs += 1
+
+    try:
+        while pending_jobs or running_jobs:
+            while pending_jobs and len(running_jobs) < arguments.jobs:
+                job = pending_jobs.pop(0)
+                start_interpolation_job(job, arguments, device_profile_overrides)
+                running_jobs.append(job)
+
+            sleep(CLI_STATUS_POLL_SECONDS)
+
+            for job in list(running_jobs):
+                read_interpolation_job_status(job)
+                if not job["process"].is_alive():
+                    running_jobs.remove(job)
+                    if finish_interpolation_job(job): completed_jobs += 1
+                    else:                             failed_jobs    += 1
+
+    except KeyboardInterrupt:
+        for job in running_jobs:
+            job["process"].terminate()
+            job["process"].join()
+            write_job_event("stopped", job)
+        write_event("summary", completed = completed_jobs, failed = failed_jobs, stopped = len(running_jobs) + len(pending_jobs))
+        return 130
+
+    write_event("summary", completed = completed_jobs, failed = failed_jobs, stopped = 0)
+    return 0 if failed_jobs == 0 else 1
+
+def main(argv: list[str] | None = None) -> int:
+    arguments = get_argument_parser().parse_args(argv)
+
+    if arguments.command == "interpolate":
+        return interpolate_command(arguments)
+
+    return 2
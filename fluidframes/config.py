@@ -0,0 +1,112 @@
+# Standard library imports
+import sys
+from functools import cache
+from json      import load as json_load
+from shutil    import which as shutil_which
+
+from os import (
+    sep        as os_separator,
+    devnull    as os_devnull
+)
+
+from os.path import (
+    dirname    as os_path_dirname,
+    abspath    as os_path_abspath,
+    join       as os_path_join,
+    exists     as os_path_exists,
+    expanduser as os_path_expanduser
+)
+
+# Only standard library imports, the GUI, the command line and every frame generation process import this module
+
+
+if sys.stdout is None: sys.stdout = open(os_devnull, "w")
+if sys.stderr is None: sys.stderr = open(os_devnull, "w")
+
+def find_by_relative_path(relative_path: str) -> str:
+    base_path = getattr(sys, '_MEIPASS', os_path_dirname(os_path_dirname(os_path_abspath(__file__))))
+    return os_path_join(base_path, relative_path)
+
+def find_executable(asset_name: str, command_name: str) -> str:
+    # The executable in the Assets folder, otherwise the one installed in the system (Linux and macOS servers)
+    asset_path = find_by_relative_path(f"Assets{os_separator}{asset_name}")
+    if os_path_exists(asset_path): return asset_path
+    return shutil_which(command_name) or asset_path
+
+
+
+app_name   = "FluidFrames"
+version    = "4.1"
+
+
+MENU_LIST_SEPARATOR     = [ "----" ]
+AI_models_list          = [ "RIFE", "RIFE_Lite" ]
+AI_precision_list       = [ "fp32", "fp16", "int8 dynamic", "int8 static" ]
+generation_options_list = [ "x2", "x4", "x8", "Slowmotion x2", "Slowmotion x4", "Slowmotion x8" ]
+gpus_list               = [ "Auto", "GPU 1", "GPU 2", "GPU 3", "GPU 4", MENU_LIST_SEPARATOR[0], "CPU", "CPU Parallel", "CPU Low RAM" ]
+keep_frames_list        = [ "ON", "OFF"]
+frames_pipeline_list    = [ "Frames on disk", "Frame store", "Frame cache", "Streaming" ]
+image_extension_list    = [ ".png", ".jpg", ".bmp", ".tiff" ]
+video_extension_list    = [ ".mp4", ".mkv", ".avi", ".mov" ]
+video_codec_list   = [ 
+    "x264",       "x265",       MENU_LIST_SEPARATOR[0],
+    "h264_nvenc", "hevc_nvenc", MENU_LIST_SEPARATOR[0],
+    "h264_amf",   "hevc_amf",   MENU_LIST_SEPARATOR[0],
+    "h264_qsv",   "hevc_qsv",
+    ]
+
+OUTPUT_PATH_CODED    = "Same path as input files"
+DOCUMENT_PATH        = os_path_join(os_path_expanduser('~'), 'Documents')
+USER_PREFERENCE_PATH = find_by_relative_path(f"{DOCUMENT_PATH}{os_separator}{app_name}_{version}_UserPreference.json")
+FFMPEG_EXE_PATH      = find_executable("ffmpeg.exe", "ffmpeg")
+EXIFTOOL_EXE_PATH    = find_executable("exiftool.exe", "exiftool")
+MODEL_CACHE_PATH     = os_path_join(DOCUMENT_PATH, f"{app_name}_{version}_ModelCache")
+PRECISION_CHECK_PATH = os_path_join(MODEL_CACHE_PATH, "precision_checks.json")
+CALIBRATION_PATH     = os_path_join(MODEL_CACHE_PATH, "inference_sessions_calibration.json")
+
+COMPLETED_STATUS = "Completed"
+ERROR_STATUS     = "Error"
+STOP_STATUS      = "Stop"
+
+class ProcessStatus(str):
+
+    # Status text shown by the GUI, with the numeric progress fields (percent, frames, eta) used by the command line
+
+    def __new__(cls, step: str, progress: dict):
+        process_status = super().__new__(cls, step)
+        process_status.progress = progress
+        return process_status
+
+    def __reduce__(self) -> tuple:
+        # Sent through the multiprocessing status queue
+        return ProcessStatus, (str(self), self.progress)
+
+supported_file_extensions = [
+    ".mp4", ".MP4", ".webm", ".WEBM", ".mkv", ".MKV",
+    ".flv", ".FLV", ".gif", ".GIF", ".m4v", ".M4V",
+    ".avi", ".AVI", ".mov", ".MOV", ".qt", ".3gp",
+    ".mpg", ".mpeg", ".vob", ".VOB"
+]
+
+supported_video_extensions = [
+    ".mp4", ".MP4", ".webm", ".WEBM", ".mkv", ".MKV",
+    ".flv", ".FLV", ".gif", ".GIF", ".m4v", ".M4V",
+    ".avi", ".AVI", ".mov", ".MOV", ".qt", ".3gp",
+    ".mpg", ".mpeg", ".vob", ".VOB"
+]
+
+
+
+# User preference ------------------------
+
+@cache
+def get_user_preference() -> dict:
+
+    # Read once for process, when the first value is needed (not at import)
+    if os_path_exists(USER_PREFERENCE_PATH):
+        print(f"[{app_name}] Preference file exist")
+        with open(USER_PREFERENCE_PATH, "r") as json_file:
+            return json_load(json_file)
+    else:
+        print(f"[{app_name}] Preference file does not exist, using default coded value")
+        return {}
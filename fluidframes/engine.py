@@ -0,0 +1,3508 @@
+from __future__ import annotations # onnxruntime classes in annotations, onnxruntime is not imported at module level
+
+# Standard library imports
+from math       import log10
+from re         import findall as re_findall
+from subprocess import run  as subprocess_run, Popen as subprocess_Popen, PIPE as subprocess_PIPE, DEVNULL as subprocess_DEVNULL
+from shutil     import rmtree as remove_directory
+from tempfile   import TemporaryFile
+from timeit     import default_timer as timer
+from zlib       import crc32
+from functools  import cache
+from platform   import machine as platform_machine, processor as platform_processor
+
+from typing      import Callable, Iterator, TYPE_CHECKING
+from collections import OrderedDict
+from queue       import Queue, Empty as QueueEmpty
+from itertools   import islice, chain, cycle
+from copy        import copy
+from threading   import Thread, Lock, Event, get_ident
+from multiprocessing.pool import ThreadPool
+from multiprocessing import Queue as multiprocessing_Queue
+from multiprocessing.synchronize import Event as multiprocessing_Event
+
+from hashlib import (
+    sha256,
+    file_digest
+)
+
+from json import (
+    load  as json_load, 
+    loads as json_loads,
+    dumps as json_dumps
+)
+
+# onnxruntime is imported by the AI functions (see AI_interpolation), only the type checkers import it here
+if TYPE_CHECKING:
+    from onnxruntime import InferenceSession, SessionOptions
+
+from os import (
+    sep        as os_separator,
+    makedirs   as os_makedirs,
+    listdir    as os_listdir,
+    remove     as os_remove,
+    cpu_count  as os_cpu_count,
+    getpid     as os_getpid,
+    fdopen     as os_fdopen,
+    open       as os_open,
+    replace    as os_replace,
+    fsync      as os_fsync,
+    O_WRONLY,
+    O_CREAT
+)
+
+from os.path import (
+    basename   as os_path_basename,
+    dirname    as os_path_dirname,
+    join       as os_path_join,
+    exists     as os_path_exists,
+    splitext   as os_path_splitext
+)
+
+# Third-party library imports (onnxruntime is imported with the first AI model)
+from cv2 import (
+    CAP_PROP_FPS,
+    CAP_PROP_FRAME_COUNT,
+    COLOR_BGR2GRAY,
+    IMREAD_UNCHANGED,
+    INTER_AREA,
+    INTER_CUBIC,
+    VideoCapture as opencv_VideoCapture,
+    cvtColor     as opencv_cvtColor,
+    imdecode     as opencv_imdecode,
+    imencode     as opencv_imencode,
+    resize       as opencv_resize,
+    GaussianBlur as opencv_GaussianBlur,
+)
+
+from numpy import (
+    ndarray           as numpy_ndarray,
+    ascontiguousarray as numpy_ascontiguousarray,
+    frombuffer        as numpy_frombuffer,
+    transpose         as numpy_transpose,
+    empty             as numpy_empty,
+    divide            as numpy_divide,
+    multiply          as numpy_multiply,
+    add               as numpy_add,
+    minimum           as numpy_minimum,
+    outer             as numpy_outer,
+    arange            as numpy_arange,
+    ones              as numpy_ones,
+    zeros             as numpy_zeros,
+    rint              as numpy_rint,
+    iinfo             as numpy_iinfo,
+    clip              as numpy_clip,
+    mean              as numpy_mean,
+    copyto            as numpy_copyto,
+    memmap            as numpy_memmap,
+    fromfile          as numpy_fromfile,
+    prod              as numpy_prod,
+    float32,
+    uint8
+)
+
+# Shared settings
+from fluidframes.config import (
+    app_name,
+    find_by_relative_path,
+    AI_precision_list,
+    gpus_list,
+    OUTPUT_PATH_CODED,
+    FFMPEG_EXE_PATH,
+    EXIFTOOL_EXE_PATH,
+    MODEL_CACHE_PATH,
+    PRECISION_CHECK_PATH,
+    CALIBRATION_PATH,
+    COMPLETED_STATUS,
+    ERROR_STATUS,
+    STOP_STATUS,
+    ProcessStatus,
+    get_user_preference
+)
+
+
+ECTRACTION_FRAMES_FOR_CPU = 30
+EXTRACTION_SEGMENTS_FOR_CPU    = 2   # More segments than workers, so workers finishing early take the next one
+EXTRACTION_MIN_SEGMENT_SECONDS = 10
+ENCODING_SEGMENT_SECONDS       = 20  # Output video seconds encoded by every segment encoder
+ENCODING_THREADS_FOR_SEGMENT   = 4   # CPU codecs, threads of every segment encoder
+ENCODING_HARDWARE_SESSIONS     = 2   # GPU codecs, concurrent segment encoders
+MAX_AI_BUFFERS_RESOLUTIONS = 4
+MAX_POOLED_FRAME_BUFFERS   = 32
+
+AI_MODEL_STRIDE     = 32
+AI_SHAPE_BUCKETS    = [ 256, 288, 384, 480, 544, 640, 736, 864, 960, 1088, 1280, 1440, 1632, 1920, 2176, 2560, 2880, 3200, 3840, 4352 ]
+AI_BUCKETS_ABOVE    = 512   # Above the last bucket, frames are padded to a multiple of this value
+MAX_AI_SESSIONS     = 3
+AI_TILES_OVERLAP    = 64
+AI_MIN_TILE_SIZE    = 128
+AI_MEMORY_PER_PIXEL = 1024  # Estimated peak memory (bytes) for every pixel of a frame pair inside the AI model
+AI_MAX_INFERENCE_SESSIONS = 8   # Upper limit of the CPU inference sessions calibration
+AI_CALIBRATION_PAIRS      = 8   # Frame pairs timed for every inference sessions candidate
+
+AI_MODEL_VARIANTS = {
+    "fp32":         "fp32",
+    "fp16":         "fp16",
+    "int8 dynamic": "int8_dynamic",
+    "int8 static":  "int8_static",
+}
+AI_PRECISION_SAMPLE_PAIRS = 8
+AI_PRECISION_MIN_PSNR     = 35.0
+AI_PRECISION_MIN_SSIM     = 0.97
+FRAME_PREFETCH_SIZE       = 4   # Source frames read ahead of the frame generation
+FRAME_WRITERS_QUEUE_SIZE  = 32  # Frames waiting to be written, when full the frame generation waits for the writers
+STREAMING_QUEUE_SIZE      = 16  # Frames waiting in every queue of the streaming pipeline
+JOURNAL_SYNC_RECORDS      = 32  # Frame generation journal records written between two fsync
+
+# Output resize cost model, nanoseconds for pixel (measured at 1080p, opencv resize cost counts input + output pixels)
+ENCODER_PIPE_PIXEL_COST = 0.8   # raw BGR pixel written to the encoder stdin
+OUTPUT_RESIZE_PIXEL_COSTS = {
+    "integer downscale": 0.45,  # opencv INTER_AREA with an integer ratio (50%, 25%)
+    "downscale":         7.5,   # opencv INTER_AREA with any other ratio
+    "upscale":           2.1,   # opencv INTER_CUBIC
+}
+
+# Frame cache of the "Frame cache" pipeline, the user preference file can override these values
+DEFAULT_FRAME_CACHE = {
+    "ram_budget_mb": 4096,  # frames over the budget are spilled to disk
+    "spill_policy":  "lru", # lru (least recently used frames spill first) / fifo (oldest frames spill first)
+}
+
+DIRECTML_PROVIDER = "DmlExecutionProvider"
+CPU_PROVIDER      = "CPUExecutionProvider"
+
+# Values shared by every device profile, each profile (and the user preference file) can override them
+DEFAULT_DEVICE_PROFILE = {
+    "batch_size":         1,            # frame pairs processed by a single inference
+    "inference_sessions": 1,            # CPU sessions running frame pairs at the same time (0 = calibrated for every resolution)
+    "memory_budget_mb":   4096,         # AI memory budget, bigger frames are processed in tiles (0 = unlimited)
+    "model_stride":       AI_MODEL_STRIDE, # frames are padded to a multiple of the stride
+    "shape_buckets":      True,         # pad frames to AI_SHAPE_BUCKETS and keep a warmed-up session for every bucket
+    "intra_op_threads":   0,            # 0 = onnxruntime default (one thread per physical core)
+    "inter_op_threads":   0,
+    "execution_mode":     "sequential", # sequential / parallel
+    "graph_optimization": "all",        # disabled / basic / extended / all
+    "memory_arena":       True,
+    "memory_pattern":     True,
+}
+
+DEVICE_PROFILES = {
+    # DirectML does not support memory pattern optimizations and parallel execution
+    "Auto":           { "provider": DIRECTML_PROVIDER, "provider_options": {"performance_preference": "high_performance"}, "memory_pattern": False },
+    "GPU 1":          { "provider": DIRECTML_PROVIDER, "provider_options": {"device_id": "0"}, "memory_pattern": False },
+    "GPU 2":          { "provider": DIRECTML_PROVIDER, "provider_options": {"device_id": "1"}, "memory_pattern": False },
+    "GPU 3":          { "provider": DIRECTML_PROVIDER, "provider_options": {"device_id": "2"}, "memory_pattern": False },
+    "GPU 4":          { "provider": DIRECTML_PROVIDER, "provider_options": {"device_id": "3"}, "memory_pattern": False },
+    "CPU":            { "provider": CPU_PROVIDER,      "provider_options": {}, "batch_size": 4, "inference_sessions": 0 },
+    "CPU Parallel":   { "provider": CPU_PROVIDER,      "provider_options": {}, "batch_size": 4, "inference_sessions": 0, "execution_mode": "parallel", "inter_op_threads": 2 },
+    "CPU Low RAM":    { "provider": CPU_PROVIDER,      "provider_options": {}, "intra_op_threads": 2, "memory_arena": False, "memory_pattern": False, "graph_optimization": "basic" },
+}
+
+CPU_DEVICE_PROFILE = "CPU"    # used when the provider of the selected device is not available
+
+# onnxruntime ExecutionMode / GraphOptimizationLevel names
+EXECUTION_MODES = {
+    "sequential": "ORT_SEQUENTIAL",
+    "parallel":   "ORT_PARALLEL",
+}
+
+GRAPH_OPTIMIZATION_LEVELS = {
+    "disabled": "ORT_DISABLE_ALL",
+    "basic":    "ORT_ENABLE_BASIC",
+    "extended": "ORT_ENABLE_EXTENDED",
+    "all":      "ORT_ENABLE_ALL",
+}
+
+# AI -------------------
+
+class FrameBufferPool:
+
+    # Decoded and AI output frames buffers, recycled once the frame has been written
+
+    def __init__(self) -> None:
+        self.free_buffers = {}
+        self.lock         = Lock()
+
+    def acquire(self, shape: tuple, dtype) -> numpy_ndarray:
+        with self.lock:
+            free_buffers = self.free_buffers.get((shape, numpy_iinfo(dtype).dtype.str))
+            if free_buffers: return free_buffers.pop()
+
+        return numpy_empty(shape, dtype = dtype)
+
+    def release(self, buffer: numpy_ndarray) -> None:
+        with self.lock:
+            free_buffers = self.free_buffers.setdefault((buffer.shape, buffer.dtype.str), [])
+            if len(free_buffers) < MAX_POOLED_FRAME_BUFFERS: free_buffers.append(buffer)
+
+def postprocess_output_into(onnx_output: numpy_ndarray, output_buffer: numpy_ndarray) -> numpy_ndarray:
+    # CHW float32 [0, 1] => HWC uint8/uint16, onnx_output is used as scratch memory so nothing is allocated
+    max_range = numpy_iinfo(output_buffer.dtype).max
+
+    # One channel at a time, the channel is still in cache from scale to rounding
+    for channel in range(onnx_output.shape[0]):
+        channel_output = onnx_output[channel]
+        numpy_multiply(channel_output, max_range, out = channel_output)
+        numpy_clip(channel_output, 0, max_range, out = channel_output)
+        numpy_rint(channel_output, out = output_buffer[:, :, channel], casting = "unsafe")
+
+    return output_buffer
+
+def get_device_profile(selected_device: str) -> dict:
+    from onnxruntime import get_available_providers
+
+    if selected_device not in DEVICE_PROFILES:
+        print(f"[{app_name}] Unknown device profile {selected_device}, using {gpus_list[0]}")
+        selected_device = gpus_list[0]
+
+    user_device_profiles = get_user_preference().get("default_device_profiles", {})
+    device_profile       = {
+        **DEFAULT_DEVICE_PROFILE,
+        **DEVICE_PROFILES[selected_device],
+        **user_device_profiles.get(selected_device, {})
+    }
+    device_profile["name"] = selected_device
+
+    # Without the provider of the device (DirectML outside Windows) the CPU profile is used, not the DirectML tuning
+    # User overrides of the selected device (command line options) are kept
+    if device_profile["provider"] not in get_available_providers() and selected_device != CPU_DEVICE_PROFILE:
+        print(f"[{app_name}] {device_profile['provider']} not available, using device profile {CPU_DEVICE_PROFILE}")
+        device_profile = {
+            **DEFAULT_DEVICE_PROFILE,
+            **DEVICE_PROFILES[CPU_DEVICE_PROFILE],
+            **user_device_profiles.get(CPU_DEVICE_PROFILE, {}),
+            **{ key: value for key, value in user_device_profiles.get(selected_device, {}).items() if key not in ("provider", "provider_options") }
+        }
+        device_profile["name"] = CPU_DEVICE_PROFILE
+
+    return device_profile
+
+@cache
+def get_cpu_identifier() -> str:
+    # CPU model and instruction set extensions: optimized models (NchwcTransformer layouts) are hardware specific
+    # and the model cache is in the Documents folder, often synced between different PCs
+    cpu_model = platform_processor()
+    cpu_flags = ""
+
+    try:
+        # Linux, the CPU model and its instruction set extensions
+        with open("/proc/cpuinfo", "r") as cpuinfo_file:
+            for cpuinfo_line in cpuinfo_file:
+                key, _, value = cpuinfo_line.partition(":")
+                if key.strip() == "model name" and cpu_model == "": cpu_model = value.strip()
+                if key.strip() in ("flags", "Features"):
+                    cpu_flags = " ".join(sorted(value.split()))
+                    break
+    except:
+        pass
+
+    return f"{platform_machine()} {cpu_model} {sha256(cpu_flags.encode()).hexdigest()[:16]}"
+
+def calculate_psnr(image1: numpy_ndarray, image2: numpy_ndarray) -> float:
+    mean_squared_error = float(numpy_mean((image1.astype(float32) - image2.astype(float32)) ** 2))
+    if mean_squared_error == 0: return 100.0
+    
+    return 10 * log10((255 ** 2) / mean_squared_error)
+
+def calculate_ssim(image1: numpy_ndarray, image2: numpy_ndarray) -> float:
+    C1 = (0.01 * 255) ** 2
+    C2 = (0.03 * 255) ** 2
+
+    image1 = opencv_cvtColor(image1, COLOR_BGR2GRAY).astype(float32)
+    image2 = opencv_cvtColor(image2, COLOR_BGR2GRAY).astype(float32)
+
+    mu1       = opencv_GaussianBlur(image1, (11, 11), 1.5)
+    mu2       = opencv_GaussianBlur(image2, (11, 11), 1.5)
+    sigma1_sq = opencv_GaussianBlur(image1 * image1, (11, 11), 1.5) - mu1 * mu1
+    sigma2_sq = opencv_GaussianBlur(image2 * image2, (11, 11), 1.5) - mu2 * mu2
+    sigma12   = opencv_GaussianBlur(image1 * image2, (11, 11), 1.5) - mu1 * mu2
+
+    ssim_map = ((2 * mu1 * mu2 + C1) * (2 * sigma12 + C2)) / ((mu1 * mu1 + mu2 * mu2 + C1) * (sigma1_sq + sigma2_sq + C2))
+
+    return float(numpy_mean(ssim_map))
+
+# Optimized model cache files are read, saved and removed by a single inference session at a time
+optimized_model_cache_lock = Lock()
+
+class AI_interpolation:
+
+    # CLASS INIT FUNCTIONS
+
+    def __init__(
+            self, 
+            AI_model_name: str, 
+            frame_gen_factor: int,
+            device_profile: dict, 
+            input_resize_factor: int,
+            output_resize_factor: int,
+            AI_precision: str = AI_precision_list[0],
+            ):
+        
+        # Passed variables
+        self.AI_model_name        = AI_model_name
+        self.frame_gen_factor     = frame_gen_factor
+        self.device_profile       = device_profile
+        self.input_resize_factor  = input_resize_factor
+        self.output_resize_factor = output_resize_factor
+        self.AI_precision         = AI_precision
+
+        # Calculated variables
+        self.init_start_time  = timer()
+        self.cold_start_time  = None
+        self.fp32_model_path  = find_by_relative_path(f"AI-onnx{os_separator}{self.AI_model_name}_fp32.onnx")
+        self.AI_model_path    = self._select_model_variant()
+        self.AI_model_hash    = self._get_model_hash()
+        self.inferenceSession = self._load_inferenceSession()
+        self.batch_size       = self._get_batch_size()
+        self.input_buffers    = {}
+        self.output_dtype     = uint8
+        self.output_pool      = FrameBufferPool()
+
+        # Source frames normalized once (see FrameReaderWindow), copied in the input buffer every time they are used
+        self.normalized_images = {}
+
+        # Input/output names and shapes resolved once, IO bindings cached for every input shape
+        self.input_name         = self.inferenceSession.get_inputs()[0].name
+        self.output_name        = self.inferenceSession.get_outputs()[0].name
+        self.output_channels    = self._get_output_channels()
+        self.io_binding_enabled = True
+        self.io_bindings        = {}
+
+        # Frames are padded to the model stride (and to a shape bucket), every bucket has its own warmed-up session
+        self.model_stride      = int(self.device_profile["model_stride"])
+        self.shape_buckets     = bool(self.device_profile["shape_buckets"]) and self._has_free_spatial_dimensions()
+        self.bucket_sessions   = {}
+
+        # Frames bigger than the memory budget are processed in overlapping tiles
+        self.max_pixels_per_inference = int(self.device_profile["memory_budget_mb"]) * 1024 * 1024 // AI_MEMORY_PER_PIXEL
+        self.tiles_layouts            = {}
+        self.blend_canvases           = {}
+
+        # On CPU the frame pairs can be shared by several inference sessions, each one with its own threads
+        self.inference_pool         = None
+        self.inference_pool_layouts = {}
+
+    def set_frame_generation_settings(self, frame_gen_factor: int, input_resize_factor: int, output_resize_factor: int) -> None:
+        # Settings of a new frame generation for an already loaded AI model (sessions, buffers and IO bindings are kept)
+        self.frame_gen_factor     = frame_gen_factor
+        self.input_resize_factor  = input_resize_factor
+        self.output_resize_factor = output_resize_factor
+
+    def _select_providers(self) -> tuple[list, list]:
+        from onnxruntime import get_available_providers
+
+        provider         = self.device_profile["provider"]
+        provider_options = self.device_profile["provider_options"]
+
+        if provider not in get_available_providers():
+            print(f"[{app_name}] {provider} not available, falling back to {CPU_PROVIDER}")
+            provider         = CPU_PROVIDER
+            provider_options = {}
+
+        if provider == CPU_PROVIDER:
+            return [ CPU_PROVIDER ], [ provider_options ]
+        else:
+            # CPU as secondary provider for operators not supported by the selected one
+            return [ provider, CPU_PROVIDER ], [ provider_options, {} ]
+
+    def _create_session_options(self, providers: list) -> SessionOptions:
+        from onnxruntime import SessionOptions, ExecutionMode, GraphOptimizationLevel
+
+        execution_mode = self.device_profile["execution_mode"]
+        memory_pattern = self.device_profile["memory_pattern"]
+
+        if DIRECTML_PROVIDER in providers:
+            execution_mode = "sequential"
+            memory_pattern = False
+
+        session_options = SessionOptions()
+        session_options.intra_op_num_threads     = int(self.device_profile["intra_op_threads"])
+        session_options.inter_op_num_threads     = int(self.device_profile["inter_op_threads"])
+        session_options.execution_mode           = getattr(ExecutionMode, EXECUTION_MODES[execution_mode])
+        session_options.graph_optimization_level = getattr(GraphOptimizationLevel, GRAPH_OPTIMIZATION_LEVELS[self.device_profile["graph_optimization"]])
+        session_options.enable_cpu_mem_arena     = bool(self.device_profile["memory_arena"])
+        session_options.enable_mem_pattern       = bool(memory_pattern)
+
+        return session_options
+
+    def _get_model_variant_path(self) -> str:
+        model_file_name = f"{self.AI_model_name}_{AI_MODEL_VARIANTS[self.AI_precision]}.onnx"
+
+        # Variants shipped with the app, otherwise produced in the model cache
+        shipped_model_path = find_by_relative_path(f"AI-onnx{os_separator}{model_file_name}")
+        if os_path_exists(shipped_model_path): return shipped_model_path
+
+        return os_path_join(MODEL_CACHE_PATH, model_file_name)
+
+    def _get_precision_check_key(self, model_path: str) -> str:
+        with open(model_path, "rb") as model_file:
+            model_hash = file_digest(model_file, "sha256").hexdigest()
+
+        # The provider the sessions really use (after the fallback to CPU), not the one asked by the device profile
+        providers, _ = self._select_providers()
+        return f"{model_hash[:16]}_{providers[0]}"
+
+    def _read_precision_checks(self) -> dict:
+        if not os_path_exists(PRECISION_CHECK_PATH): return {}
+
+        with open(PRECISION_CHECK_PATH, "r") as json_file:
+            return json_load(json_file)
+
+    def _write_precision_check(self, model_path: str, precision_check: dict) -> None:
+        precision_checks = self._read_precision_checks()
+        precision_checks[self._get_precision_check_key(model_path)] = precision_check
+
+        os_makedirs(MODEL_CACHE_PATH, exist_ok = True)
+        with open(f"{PRECISION_CHECK_PATH}.tmp", "w") as json_file:
+            json_file.write(json_dumps(precision_checks))
+        os_replace(f"{PRECISION_CHECK_PATH}.tmp", PRECISION_CHECK_PATH)
+
+    def _select_model_variant(self) -> str:
+        self.precision_check_pending = False
+
+        if self.AI_precision == "fp32": 
+            return self.fp32_model_path
+
+        variant_model_path = self._get_model_variant_path()
+        precision_check    = None
+        if os_path_exists(variant_model_path):
+            precision_check = self._read_precision_checks().get(self._get_precision_check_key(variant_model_path))
+
+        # Variants must pass the accuracy check against fp32 before being used
+        if precision_check == None:
+            print(f"[{app_name}] AI precision {self.AI_precision} not checked yet, using fp32 until the accuracy check")
+            self.precision_check_pending = True
+            return self.fp32_model_path
+        
+        if not precision_check["approved"]:
+            print(f"[{app_name}] AI precision {self.AI_precision} rejected by accuracy check (PSNR {precision_check['psnr']:.2f} SSIM {precision_check['ssim']:.4f}), using fp32")
+            return self.fp32_model_path
+
+        return variant_model_path
+
+    def _produce_model_variant(self, variant_model_path: str, sample_pairs: list[tuple[numpy_ndarray, numpy_ndarray]]) -> None:
+        temporary_model_path = f"{os_path_splitext(variant_model_path)[0]}_tmp.onnx"
+        os_makedirs(os_path_dirname(variant_model_path), exist_ok = True)
+
+        print(f"[{app_name}] Producing AI model variant {os_path_basename(variant_model_path)}")
+
+        match self.AI_precision:
+            case "fp16":
+                from onnx import load as onnx_load, save as onnx_save
+                from onnxconverter_common.float16 import convert_float_to_float16
+
+                onnx_save(convert_float_to_float16(onnx_load(self.fp32_model_path), keep_io_types = True), temporary_model_path)
+
+            case "int8 dynamic":
+                from onnxruntime.quantization import quantize_dynamic, QuantType
+
+                quantize_dynamic(self.fp32_model_path, temporary_model_path, weight_type = QuantType.QUInt8)
+
+            case "int8 static":
+                from onnxruntime.quantization import quantize_static, QuantType, QuantFormat, CalibrationDataReader
+
+                # Sample frame pairs of the video as calibration data
+                height, width = self.get_padded_resolution(*self.get_image_resolution(sample_pairs[0][0]))
+                calibration_inputs = [{self.input_name: self.preprocess_images([sample_pair], height, width).copy()} for sample_pair in sample_pairs]
+
+                class FramePairsDataReader(CalibrationDataReader):
+                    def __init__(self) -> None:
+                        self.calibration_inputs = iter(calibration_inputs)
+                    def get_next(self) -> dict:
+                        return next(self.calibration_inputs, None)
+
+                quantize_static(
+                    self.fp32_model_path, 
+                    temporary_model_path, 
+                    FramePairsDataReader(), 
+                    quant_format    = QuantFormat.QDQ, 
+                    activation_type = QuantType.QUInt8, 
+                    weight_type     = QuantType.QInt8
+                )
+
+        os_replace(temporary_model_path, variant_model_path)
+
+    def _switch_model(self, model_path: str) -> None:
+        self.close_inference_pool()
+        self.AI_model_path    = model_path
+        self.AI_model_hash    = self._get_model_hash()
+        self.inferenceSession = self._load_inferenceSession()
+        self.bucket_sessions  = {}
+        self.io_bindings      = {}
+        self.inference_pool_layouts = {}
+
+    def _get_model_hash(self) -> str:
+        with open(self.AI_model_path, "rb") as model_file:
+            return file_digest(model_file, "sha256").hexdigest()
+
+    def _get_optimized_model_path(self, providers: list, provider_options: list, free_dimensions: dict) -> str:
+        from onnxruntime import __version__ as onnxruntime_version
+
+        # Model file and onnxruntime version in the name (to remove stale files), session settings and CPU hashed
+        model_name      = os_path_splitext(os_path_basename(self.AI_model_path))[0]
+        model_prefix    = f"{model_name}_{self.AI_model_hash[:16]}_ort{onnxruntime_version}"
+        session_setting = json_dumps({
+            "providers":          providers,
+            "provider_options":   provider_options,
+            "graph_optimization": self.device_profile["graph_optimization"],
+            "free_dimensions":    free_dimensions,
+            "onnxruntime":        onnxruntime_version,
+            "cpu":                get_cpu_identifier(),
+        }, sort_keys = True)
+        
+        os_makedirs(MODEL_CACHE_PATH, exist_ok = True)
+
+        for cached_file in os_listdir(MODEL_CACHE_PATH):
+            if cached_file.startswith(f"{model_name}_") and not cached_file.startswith(model_prefix):
+                print(f"[{app_name}] Removing stale optimized model {cached_file}")
+                os_remove(os_path_join(MODEL_CACHE_PATH, cached_file))
+
+        return os_path_join(MODEL_CACHE_PATH, f"{model_prefix}_{sha256(session_setting.encode()).hexdigest()[:16]}.onnx")
+
+    def _load_inferenceSession(self, free_dimensions: dict = {}) -> InferenceSession:
+        from onnxruntime import InferenceSession, GraphOptimizationLevel
+
+        start_timer                 = timer()
+        providers, provider_options = self._select_providers()
+        session_options             = self._create_session_options(providers)
+
+        # Symbolic dimensions fixed to a value, onnxruntime can specialize kernels and plan memory for this shape
+        for dimension_name, dimension_value in free_dimensions.items():
+            session_options.add_free_dimension_override_by_name(dimension_name, dimension_value)
+
+        inference_session    = None
+
+        # Inference pool sessions are created on their own threads, the optimized model cache is read and saved by one at a time
+        with optimized_model_cache_lock:
+            optimized_model_path = self._get_optimized_model_path(providers, provider_options, free_dimensions)
+
+            # Cached optimized model, graph optimizations already applied
+            if os_path_exists(optimized_model_path):
+                session_options.graph_optimization_level = GraphOptimizationLevel.ORT_DISABLE_ALL
+                try:
+                    inference_session = InferenceSession(
+                        path_or_bytes    = optimized_model_path, 
+                        sess_options     = session_options,
+                        providers        = providers,
+                        provider_options = provider_options
+                        )
+                    model_cache_status = "optimized model cache hit"
+                except:
+                    os_remove(optimized_model_path)
+                    session_options = self._create_session_options(providers)
+                    for dimension_name, dimension_value in free_dimensions.items():
+                        session_options.add_free_dimension_override_by_name(dimension_name, dimension_value)
+
+            # Optimize the original model and save it in the cache (not every provider supports it)
+            if inference_session == None:
+                temporary_model_path = f"{os_path_splitext(optimized_model_path)[0]}_{os_getpid()}_{get_ident()}_tmp.onnx"
+                session_options.optimized_model_filepath = temporary_model_path
+                try:
+                    inference_session = InferenceSession(
+                        path_or_bytes    = self.AI_model_path, 
+                        sess_options     = session_options,
+                        providers        = providers,
+                        provider_options = provider_options
+                        )
+                    os_replace(temporary_model_path, optimized_model_path)
+                    model_cache_status = "optimized model cache miss, saved"
+                except:
+                    if os_path_exists(temporary_model_path): os_remove(temporary_model_path)
+                    session_options.optimized_model_filepath = ""
+                    inference_session = InferenceSession(
+                        path_or_bytes    = self.AI_model_path, 
+                        sess_options     = session_options,
+                        providers        = providers,
+                        provider_options = provider_options
+                        )
+                    model_cache_status = "optimized model cache not supported"
+        
+        if not free_dimensions: 
+            print(f"[{app_name}] AI device profile {self.device_profile['name']} => {inference_session.get_providers()[0]}")
+        print(f"[{app_name}] AI model loaded in {timer() - start_timer:.2f}s ({model_cache_status})")
+
+        return inference_session
+
+    def _has_free_spatial_dimensions(self) -> bool:
+        _, _, height_dimension, width_dimension = self.inferenceSession.get_inputs()[0].shape
+        return isinstance(height_dimension, str) and isinstance(width_dimension, str)
+
+    def _get_output_channels(self) -> int:
+        output_channels = self.inferenceSession.get_outputs()[0].shape[1]
+        return output_channels if isinstance(output_channels, int) else 3
+
+    def _get_batch_size(self) -> int:
+        batch_size      = max(1, int(self.device_profile["batch_size"]))
+        batch_dimension = self.inferenceSession.get_inputs()[0].shape[0]
+
+        # Models exported with a fixed batch dimension accept only that many frame pairs
+        if isinstance(batch_dimension, int):
+            if batch_size != batch_dimension: 
+                print(f"[{app_name}] AI model has a fixed batch dimension, batch size {batch_size} => {batch_dimension}")
+            return batch_dimension
+        
+        return batch_size
+
+
+
+    # INTERNAL CLASS FUNCTIONS
+
+    def get_image_mode(self, image: numpy_ndarray) -> str:
+        match image.shape:
+            case (_, _):
+                return "Grayscale"
+            case (_, _, channels) if channels == 3:
+                return "RGB"
+            case (_, _, channels) if channels == 4:
+                return "RGBA"
+
+    def get_image_resolution(self, image: numpy_ndarray) -> tuple:
+        height = image.shape[0]
+        width  = image.shape[1]
+
+        return height, width 
+
+    def get_input_resized_resolution(self, old_height: int, old_width: int) -> tuple:
+        
+        if self.input_resize_factor == 1: return old_height, old_width
+
+        new_width  = int(old_width * self.input_resize_factor)
+        new_height = int(old_height * self.input_resize_factor)
+
+        new_width  = new_width if new_width % 2 == 0 else new_width + 1
+        new_height = new_height if new_height % 2 == 0 else new_height + 1
+
+        return new_height, new_width
+
+    def resize_with_input_factor(self, image: numpy_ndarray) -> numpy_ndarray:
+        
+        old_height, old_width = self.get_image_resolution(image)
+        new_height, new_width = self.get_input_resized_resolution(old_height, old_width)
+
+        if self.input_resize_factor > 1:
+            return opencv_resize(image, (new_width, new_height), interpolation = INTER_CUBIC)
+        elif self.input_resize_factor < 1:
+            return opencv_resize(image, (new_width, new_height), interpolation = INTER_AREA)
+        else:
+            return image
+
+    def get_output_resized_resolution(self, old_height: int, old_width: int) -> tuple:
+        
+        if self.output_resize_factor == 1: return old_height, old_width
+
+        new_width  = int(old_width * self.output_resize_factor)
+        new_height = int(old_height * self.output_resize_factor)
+
+        new_width  = new_width if new_width % 2 == 0 else new_width + 1
+        new_height = new_height if new_height % 2 == 0 else new_height + 1
+
+        return new_height, new_width
+
+    def resize_with_output_factor(self, image: numpy_ndarray) -> numpy_ndarray:
+        
+        old_height, old_width = self.get_image_resolution(image)
+        new_height, new_width = self.get_output_resized_resolution(old_height, old_width)
+
+        if self.output_resize_factor > 1:
+            return opencv_resize(image, (new_width, new_height), interpolation = INTER_CUBIC)
+        elif self.output_resize_factor < 1:
+            return opencv_resize(image, (new_width, new_height), interpolation = INTER_AREA)
+        else:
+            return image
+
+
+
+    def get_padded_length(self, length: int) -> int:
+        padded_length = -(-length // self.model_stride) * self.model_stride
+
+        if not self.shape_buckets: 
+            return padded_length
+
+        for bucket_length in AI_SHAPE_BUCKETS:
+            if bucket_length >= padded_length and bucket_length % self.model_stride == 0: 
+                return bucket_length
+
+        if AI_BUCKETS_ABOVE % self.model_stride == 0: 
+            return -(-padded_length // AI_BUCKETS_ABOVE) * AI_BUCKETS_ABOVE
+        
+        return padded_length
+
+    def get_padded_resolution(self, height: int, width: int) -> tuple:
+        return self.get_padded_length(height), self.get_padded_length(width)
+
+    def get_budget_batch_size(self, padded_height: int, padded_width: int) -> int:
+        # Fewer frame pairs for every inference when the batch does not fit the memory budget
+        if self.max_pixels_per_inference == 0: 
+            return self.batch_size
+
+        return max(1, min(self.batch_size, self.max_pixels_per_inference // (padded_height * padded_width)))
+
+    def get_inference_session(self, height: int, width: int) -> InferenceSession:
+        if not self.shape_buckets: 
+            return self.inferenceSession
+
+        bucket_session = self.bucket_sessions.pop((height, width), None)
+
+        if bucket_session is None:
+            if len(self.bucket_sessions) >= MAX_AI_SESSIONS: 
+                evicted_resolution = next(iter(self.bucket_sessions))
+                self.bucket_sessions.pop(evicted_resolution)
+                self.io_bindings = { shape: io_binding_data for shape, io_binding_data in self.io_bindings.items() if shape[2:] != evicted_resolution }
+
+            _, _, height_dimension, width_dimension = self.inferenceSession.get_inputs()[0].shape
+            bucket_session = self._load_inferenceSession({ height_dimension: height, width_dimension: width })
+
+            # Warm-up run, the first inference on a new shape pays the memory planning (batch inside the memory budget)
+            warmup_input = numpy_zeros((self.get_budget_batch_size(height, width), 6, height, width), dtype = float32)
+            bucket_session.run([self.output_name], {self.input_name: warmup_input})
+
+            print(f"[{app_name}] AI session ready for shape bucket {width}x{height}")
+
+        # Most recently used bucket last
+        self.bucket_sessions[(height, width)] = bucket_session
+
+        return bucket_session
+
+
+
+    # AI CLASS FUNCTIONS
+
+    def get_input_buffer(self, batch_size: int, height: int, width: int) -> numpy_ndarray:
+        # One contiguous float32 NCHW buffer for every resolution, reused by all inferences
+        input_buffer = self.input_buffers.get((height, width))
+
+        if input_buffer is None or input_buffer.shape[0] < batch_size:
+            if len(self.input_buffers) >= MAX_AI_BUFFERS_RESOLUTIONS: 
+                self.input_buffers.pop(next(iter(self.input_buffers)))
+
+            input_buffer = numpy_empty((max(batch_size, self.batch_size), 6, height, width), dtype = float32)
+            self.input_buffers[(height, width)] = input_buffer
+
+        return input_buffer[:batch_size]
+
+    def normalize_image(self, image: numpy_ndarray) -> numpy_ndarray:
+        # HWC uint8/uint16 => CHW float32, the same values written by preprocess_image_into
+        return numpy_divide(numpy_transpose(image, (2, 0, 1)), numpy_iinfo(image.dtype).max, dtype = float32)
+
+    def add_normalized_image(self, image: numpy_ndarray, normalized_image: numpy_ndarray) -> None:
+        # The image is kept referenced, so its id can not be reused while it is registered
+        self.normalized_images[id(image)] = (image, normalized_image)
+
+    def remove_normalized_image(self, image: numpy_ndarray) -> None:
+        self.normalized_images.pop(id(image), None)
+
+    def preprocess_image_into(self, image: numpy_ndarray, buffer: numpy_ndarray) -> None:
+        image_height, image_width = self.get_image_resolution(image)
+        _, buffer_height, buffer_width = buffer.shape
+
+        normalized_image = self.normalized_images.get(id(image))
+
+        if normalized_image != None and normalized_image[0] is image:
+            # Already normalized source frame, only copied
+            numpy_copyto(buffer[:, :image_height, :image_width], normalized_image[1])
+        else:
+            # Normalize and transpose HWC uint8/uint16 => CHW float32 in a single pass, directly inside the buffer
+            numpy_divide(numpy_transpose(image, (2, 0, 1)), numpy_iinfo(image.dtype).max, out = buffer[:, :image_height, :image_width], dtype = float32)
+
+        # Replicate the last row/column when the buffer is bigger than the image
+        if image_height < buffer_height: buffer[:, image_height:, :image_width] = buffer[:, image_height - 1 : image_height, :image_width]
+        if image_width  < buffer_width:  buffer[:, :, image_width:] = buffer[:, :, image_width - 1 : image_width]
+
+    def preprocess_images(self, image_pairs: list[tuple[numpy_ndarray, numpy_ndarray]], height: int, width: int) -> numpy_ndarray:
+        input_buffer = self.get_input_buffer(len(image_pairs), height, width)
+
+        for batch_index, (image1, image2) in enumerate(image_pairs):
+            self.preprocess_image_into(image1, input_buffer[batch_index, 0:3])
+            self.preprocess_image_into(image2, input_buffer[batch_index, 3:6])
+
+        return input_buffer
+
+    def get_io_binding(self, image: numpy_ndarray) -> tuple:
+        io_binding_data = self.io_bindings.get(image.shape)
+
+        if io_binding_data is None:
+            if len(self.io_bindings) >= MAX_AI_BUFFERS_RESOLUTIONS: 
+                self.io_bindings.pop(next(iter(self.io_bindings)))
+
+            # The output OrtValue is bound to a numpy buffer reused by every inference with this input shape
+            batch_size, _, height, width = image.shape
+            output_buffer = numpy_empty((batch_size, self.output_channels, height, width), dtype = float32)
+            io_binding    = self.get_inference_session(height, width).io_binding()
+            io_binding.bind_output(
+                name         = self.output_name,
+                device_type  = "cpu",
+                device_id    = 0,
+                element_type = float32,
+                shape        = output_buffer.shape,
+                buffer_ptr   = output_buffer.ctypes.data
+            )
+
+            io_binding_data = (io_binding, output_buffer)
+            self.io_bindings[image.shape] = io_binding_data
+
+        return io_binding_data
+
+    def report_cold_start(self) -> None:
+        self.cold_start_time = timer() - self.init_start_time
+        print(f"[{app_name}] AI cold start to first inference {self.cold_start_time:.2f}s")
+
+    def onnxruntime_inference(self, image: numpy_ndarray) -> numpy_ndarray:
+
+        if self.io_binding_enabled:
+            try:
+                inference_session         = self.get_inference_session(image.shape[2], image.shape[3])
+                io_binding, output_buffer = self.get_io_binding(image)
+                io_binding.bind_cpu_input(self.input_name, image)
+                inference_session.run_with_iobinding(io_binding)
+                if self.cold_start_time == None: self.report_cold_start()
+                return output_buffer
+            except Exception as exception:
+                print(f"[{app_name}] IO binding not supported, using onnxruntime run ({str(exception)})")
+                self.io_binding_enabled = False
+                self.io_bindings        = {}
+
+        inference_session = self.get_inference_session(image.shape[2], image.shape[3])
+        onnx_input        = {self.input_name: image}
+        onnx_output       = inference_session.run([self.output_name], onnx_input)[0]
+        if self.cold_start_time == None: self.report_cold_start()
+
+        return onnx_output
+
+    def postprocess_output(self, onnx_output: numpy_ndarray) -> numpy_ndarray:
+        _, channels, height, width = onnx_output.shape
+        output_buffer = self.output_pool.acquire((height, width, channels), self.output_dtype)
+
+        return postprocess_output_into(onnx_output[0], output_buffer)
+
+    def AI_interpolation(self, image1: numpy_ndarray, image2: numpy_ndarray) -> numpy_ndarray:
+        return self.AI_interpolation_batch([(image1, image2)])[0]
+
+    def AI_interpolation_batch(self, image_pairs: list[tuple[numpy_ndarray, numpy_ndarray]]) -> list[numpy_ndarray]:
+        inference_pool = self.get_inference_pool(image_pairs)
+        if inference_pool != None: 
+            output_images = inference_pool.AI_interpolation_batch(image_pairs)
+            if self.cold_start_time == None: self.report_cold_start()
+            return output_images
+
+        return self.AI_interpolation_single_session(image_pairs)
+
+    def AI_interpolation_single_session(self, image_pairs: list[tuple[numpy_ndarray, numpy_ndarray]]) -> list[numpy_ndarray]:
+        height, width = self.get_image_resolution(image_pairs[0][0])
+        tiles_layout  = self.get_tiles_layout(height, width)
+
+        if tiles_layout != None:
+            return [self.AI_interpolation_tiled(image1, image2, tiles_layout) for image1, image2 in image_pairs]
+
+        # Frames padded to the model stride / shape bucket, the padding is cropped away from the output
+        padded_height, padded_width = self.get_padded_resolution(height, width)
+
+        batch_size    = self.get_budget_batch_size(padded_height, padded_width)
+        output_images = []
+
+        for batch_start in range(0, len(image_pairs), batch_size):
+            batch_pairs = image_pairs[batch_start : batch_start + batch_size]
+
+            # Stack N frame pairs in a single NCHW tensor
+            image       = self.preprocess_images(batch_pairs, padded_height, padded_width)
+            onnx_output = self.onnxruntime_inference(image)
+
+            # Split the NCHW output in N images
+            for batch_index in range(len(batch_pairs)):
+                output_image = self.postprocess_output(onnx_output[batch_index : batch_index + 1, :, :height, :width])
+                output_images.append(output_image)
+
+        return output_images
+
+
+
+    # TILES FUNCTIONS
+
+    def get_tiles_starts(self, length: int, tile_length: int) -> list[int]:
+        if tile_length >= length: return [0]
+
+        tiles_step   = tile_length - AI_TILES_OVERLAP
+        tiles_starts = list(range(0, length - tile_length, tiles_step))
+        tiles_starts.append(length - tile_length)
+
+        return tiles_starts
+
+    def get_tile_weight(self, tile_height: int, tile_width: int, sides: tuple[bool, bool, bool, bool]) -> numpy_ndarray:
+        # Linear feathering on the sides overlapping other tiles, weight 1 on the frame borders
+        top, bottom, left, right = sides
+        ramp = (numpy_arange(AI_TILES_OVERLAP, dtype = float32) + 1) / (AI_TILES_OVERLAP + 1)
+
+        weight_rows    = numpy_ones(tile_height, dtype = float32)
+        weight_columns = numpy_ones(tile_width,  dtype = float32)
+
+        if top:    weight_rows[:AI_TILES_OVERLAP]     = numpy_minimum(weight_rows[:AI_TILES_OVERLAP],     ramp[:tile_height])
+        if bottom: weight_rows[-AI_TILES_OVERLAP:]    = numpy_minimum(weight_rows[-AI_TILES_OVERLAP:],    ramp[::-1][-tile_height:])
+        if left:   weight_columns[:AI_TILES_OVERLAP]  = numpy_minimum(weight_columns[:AI_TILES_OVERLAP],  ramp[:tile_width])
+        if right:  weight_columns[-AI_TILES_OVERLAP:] = numpy_minimum(weight_columns[-AI_TILES_OVERLAP:], ramp[::-1][-tile_width:])
+
+        return numpy_outer(weight_rows, weight_columns)
+
+    def get_tiles_layout(self, height: int, width: int) -> dict | None:
+        padded_height, padded_width = self.get_padded_resolution(height, width)
+        if self.max_pixels_per_inference == 0 or padded_height * padded_width <= self.max_pixels_per_inference: 
+            return None
+
+        if (height, width) in self.tiles_layouts: 
+            return self.tiles_layouts[(height, width)]
+
+        # Biggest square tile (multiple of the model stride) still inside the memory budget once padded to its shape bucket,
+        # when even the smallest shape bucket is over the budget the tile is only padded to the model stride
+        max_tile_size = max(AI_MIN_TILE_SIZE, int(self.max_pixels_per_inference ** 0.5) // self.model_stride * self.model_stride)
+        for tile_size in range(max_tile_size, AI_MIN_TILE_SIZE - 1, -self.model_stride):
+            tile_height = min(tile_size, -(-height // self.model_stride) * self.model_stride)
+            tile_width  = min(tile_size, -(-width  // self.model_stride) * self.model_stride)
+            padded_tile_height, padded_tile_width = self.get_padded_resolution(tile_height, tile_width)
+
+            if padded_tile_height * padded_tile_width <= self.max_pixels_per_inference: break
+        else:
+            tile_height = min(max_tile_size, -(-height // self.model_stride) * self.model_stride)
+            tile_width  = min(max_tile_size, -(-width  // self.model_stride) * self.model_stride)
+            padded_tile_height, padded_tile_width = tile_height, tile_width
+
+        tiles          = []
+        tiles_weights  = {}
+        weight_sum     = numpy_zeros((height, width), dtype = float32)
+        tiles_y_starts = self.get_tiles_starts(height, tile_height)
+        tiles_x_starts = self.get_tiles_starts(width,  tile_width)
+
+        for y_start in tiles_y_starts:
+            for x_start in tiles_x_starts:
+                valid_height = min(tile_height, height - y_start)
+                valid_width  = min(tile_width,  width - x_start)
+                sides        = (y_start > 0, y_start + valid_height < height, x_start > 0, x_start + valid_width < width)
+
+                if (sides, valid_height, valid_width) not in tiles_weights:
+                    tiles_weights[(sides, valid_height, valid_width)] = self.get_tile_weight(valid_height, valid_width, sides)
+                tile_weight = tiles_weights[(sides, valid_height, valid_width)]
+
+                weight_sum[y_start : y_start + valid_height, x_start : x_start + valid_width] += tile_weight
+                tiles.append((y_start, x_start, valid_height, valid_width, tile_weight))
+
+        tiles_layout = {
+            "tile_height":         padded_tile_height,
+            "tile_width":          padded_tile_width,
+            "tiles":               tiles,
+            "tiles_per_inference": max(1, self.max_pixels_per_inference // (padded_tile_height * padded_tile_width)),
+            "inverse_weight_sum":  1 / weight_sum,
+        }
+
+        if len(self.tiles_layouts) >= MAX_AI_BUFFERS_RESOLUTIONS: 
+            self.tiles_layouts.pop(next(iter(self.tiles_layouts)))
+        self.tiles_layouts[(height, width)] = tiles_layout
+
+        print(f"[{app_name}] AI tiles {tile_width}x{tile_height} for frames {width}x{height} ({len(tiles)} tiles)")
+
+        return tiles_layout
+
+    def get_blend_canvas(self, height: int, width: int) -> numpy_ndarray:
+        blend_canvas = self.blend_canvases.get((height, width))
+
+        if blend_canvas is None:
+            if len(self.blend_canvases) >= MAX_AI_BUFFERS_RESOLUTIONS: 
+                self.blend_canvases.pop(next(iter(self.blend_canvases)))
+
+            blend_canvas = numpy_empty((self.output_channels, height, width), dtype = float32)
+            self.blend_canvases[(height, width)] = blend_canvas
+
+        return blend_canvas
+
+    def AI_interpolation_tiled(self, image1: numpy_ndarray, image2: numpy_ndarray, tiles_layout: dict) -> numpy_ndarray:
+        height, width       = self.get_image_resolution(image1)
+        tiles               = tiles_layout["tiles"]
+        tiles_per_inference = tiles_layout["tiles_per_inference"]
+
+        blend_canvas = self.get_blend_canvas(height, width)
+        blend_canvas.fill(0)
+
+        for tiles_start in range(0, len(tiles), tiles_per_inference):
+            batch_tiles = tiles[tiles_start : tiles_start + tiles_per_inference]
+            tile_pairs  = [
+                (image1[y_start : y_start + valid_height, x_start : x_start + valid_width], 
+                 image2[y_start : y_start + valid_height, x_start : x_start + valid_width])
+                for y_start, x_start, valid_height, valid_width, _ in batch_tiles
+            ]
+
+            image       = self.preprocess_images(tile_pairs, tiles_layout["tile_height"], tiles_layout["tile_width"])
+            onnx_output = self.onnxruntime_inference(image)
+
+            # Accumulate the weighted tiles (padding cropped away)
+            for tile_index, (y_start, x_start, valid_height, valid_width, tile_weight) in enumerate(batch_tiles):
+                tile_output   = onnx_output[tile_index, :, :valid_height, :valid_width]
+                canvas_region = blend_canvas[:, y_start : y_start + valid_height, x_start : x_start + valid_width]
+
+                numpy_multiply(tile_output, tile_weight, out = tile_output)
+                numpy_add(canvas_region, tile_output, out = canvas_region)
+
+        numpy_multiply(blend_canvas, tiles_layout["inverse_weight_sum"], out = blend_canvas)
+
+        output_buffer = self.output_pool.acquire((height, width, self.output_channels), self.output_dtype)
+
+        return postprocess_output_into(blend_canvas, output_buffer)
+
+
+
+    # INFERENCE SESSIONS FUNCTIONS
+
+    def _get_calibration_key(self, height: int, width: int) -> str:
+        return f"{self.AI_model_hash[:16]}_{self.device_profile['name']}_cpu{os_cpu_count()}_batch{self.batch_size}_{width}x{height}"
+
+    def _read_calibrations(self) -> dict:
+        if not os_path_exists(CALIBRATION_PATH): return {}
+
+        with open(CALIBRATION_PATH, "r") as json_file:
+            return json_load(json_file)
+
+    def _write_calibration(self, calibration_key: str, calibration: dict) -> None:
+        calibrations = self._read_calibrations()
+        calibrations[calibration_key] = calibration
+
+        os_makedirs(MODEL_CACHE_PATH, exist_ok = True)
+        with open(f"{CALIBRATION_PATH}.tmp", "w") as json_file:
+            json_file.write(json_dumps(calibrations))
+        os_replace(f"{CALIBRATION_PATH}.tmp", CALIBRATION_PATH)
+
+    def get_max_inference_sessions(self, height: int, width: int) -> int:
+        # DirectML sessions share the same GPU queue, only the CPU provider runs sessions at the same time
+        if self.inferenceSession.get_providers()[0] != CPU_PROVIDER: return 1
+
+        # The memory budget is shared by the sessions, every session needs at least a frame pair
+        max_inference_sessions = min(os_cpu_count(), AI_MAX_INFERENCE_SESSIONS)
+        if self.max_pixels_per_inference > 0: 
+            max_inference_sessions = min(max_inference_sessions, self.max_pixels_per_inference // (height * width))
+
+        return max(1, max_inference_sessions)
+
+    def create_session_instance(self, inference_sessions: int, intra_op_threads: int) -> AI_interpolation:
+        # Same AI model with its own onnxruntime session, buffers and IO bindings
+        # Output frames pool and normalized source frames are shared with this instance
+        session_instance = copy(self)
+        session_instance.device_profile           = { **self.device_profile, "intra_op_threads": intra_op_threads, "inference_sessions": 1 }
+        session_instance.inferenceSession         = session_instance._load_inferenceSession()
+        session_instance.max_pixels_per_inference = self.max_pixels_per_inference // inference_sessions
+        session_instance.bucket_sessions          = {}
+        session_instance.io_bindings              = {}
+        session_instance.input_buffers            = {}
+        session_instance.tiles_layouts            = {}
+        session_instance.blend_canvases           = {}
+        session_instance.inference_pool           = None
+        session_instance.inference_pool_layouts   = {}
+        session_instance.cold_start_time          = 0.0 # reported by this instance, not by every session
+
+        return session_instance
+
+    def create_inference_pool(self, inference_sessions: int, intra_op_threads: int) -> AI_inference_pool:
+        session_instances = [ self.create_session_instance(inference_sessions, intra_op_threads) for _ in range(inference_sessions) ]
+        return AI_inference_pool(session_instances, (inference_sessions, intra_op_threads))
+
+    def calibrate_inference_sessions(self, image_pairs: list[tuple[numpy_ndarray, numpy_ndarray]], max_inference_sessions: int) -> dict:
+        # The same frame pairs with 1, 2, 4... sessions sharing the CPU threads, the fastest layout is used
+        cpu_number   = os_cpu_count()
+        sample_pairs = list(islice(cycle(image_pairs), AI_CALIBRATION_PAIRS))
+        calibration  = None
+
+        inference_sessions = 1
+        while inference_sessions <= max_inference_sessions:
+            if inference_sessions == 1:
+                intra_op_threads       = int(self.device_profile["intra_op_threads"])
+                inference_pool         = None
+                interpolation_function = self.AI_interpolation_single_session
+            else:
+                intra_op_threads       = max(1, cpu_number // inference_sessions)
+                inference_pool         = self.create_inference_pool(inference_sessions, intra_op_threads)
+                interpolation_function = inference_pool.AI_interpolation_batch
+
+            # Warm-up with a frame pair for every session, then the timed run
+            for output_image in interpolation_function(sample_pairs[:inference_sessions]): self.output_pool.release(output_image)
+            start_timer = timer()
+            for output_image in interpolation_function(sample_pairs): self.output_pool.release(output_image)
+            pair_time = (timer() - start_timer) / len(sample_pairs)
+
+            if inference_pool != None: inference_pool.close()
+
+            threads_label = intra_op_threads if intra_op_threads > 0 else "default"
+            print(f"[{app_name}] AI inference sessions calibration {inference_sessions} x {threads_label} threads => {pair_time * 1000:.1f}ms for frame pair")
+
+            if calibration == None or pair_time < calibration["pair_time"]:
+                calibration = { "sessions": inference_sessions, "intra_op_threads": intra_op_threads, "pair_time": pair_time }
+
+            inference_sessions *= 2
+
+        return calibration
+
+    def get_inference_sessions_layout(self, image_pairs: list[tuple[numpy_ndarray, numpy_ndarray]], height: int, width: int) -> tuple[int, int]:
+        # (inference sessions, intra op threads of every session) for frames padded to height x width
+        inference_sessions     = max(0, int(self.device_profile["inference_sessions"]))
+        max_inference_sessions = self.get_max_inference_sessions(height, width)
+
+        if inference_sessions > max_inference_sessions:
+            print(f"[{app_name}] AI inference sessions {inference_sessions} => {max_inference_sessions} (CPU threads / memory budget)")
+            inference_sessions = max_inference_sessions
+
+        if inference_sessions == 1 or max_inference_sessions == 1: 
+            return 1, int(self.device_profile["intra_op_threads"])
+
+        if inference_sessions > 0:
+            intra_op_threads = int(self.device_profile["intra_op_threads"]) or max(1, os_cpu_count() // inference_sessions)
+            return inference_sessions, intra_op_threads
+
+        # Calibrated once for every AI model, device profile and resolution
+        calibration_key = self._get_calibration_key(height, width)
+        calibration     = self._read_calibrations().get(calibration_key)
+
+        if calibration == None:
+            calibration = self.calibrate_inference_sessions(image_pairs, max_inference_sessions)
+            self._write_calibration(calibration_key, calibration)
+
+        return min(calibration["sessions"], max_inference_sessions), calibration["intra_op_threads"]
+
+    def get_inference_pool(self, image_pairs: list[tuple[numpy_ndarray, numpy_ndarray]]) -> AI_inference_pool | None:
+        height, width = self.get_padded_resolution(*self.get_image_resolution(image_pairs[0][0]))
+
+        inference_pool_layout = self.inference_pool_layouts.get((height, width))
+        if inference_pool_layout == None:
+            inference_pool_layout = self.get_inference_sessions_layout(image_pairs, height, width)
+            self.inference_pool_layouts[(height, width)] = inference_pool_layout
+
+        inference_sessions, intra_op_threads = inference_pool_layout
+
+        if inference_sessions == 1:
+            self.close_inference_pool()
+            return None
+
+        if self.inference_pool == None or self.inference_pool.layout != inference_pool_layout:
+            self.close_inference_pool()
+            self.inference_pool = self.create_inference_pool(inference_sessions, intra_op_threads)
+            print(f"[{app_name}] AI inference sessions {inference_sessions} x {intra_op_threads} threads for frames {width}x{height}")
+
+        return self.inference_pool
+
+    def get_step_batch_size(self) -> int:
+        # Frame pairs of a wavefront step, every inference session gets a full batch
+        if self.inference_pool == None: return self.batch_size
+
+        return self.batch_size * len(self.inference_pool.session_instances)
+
+    def close_inference_pool(self) -> None:
+        if self.inference_pool != None: self.inference_pool.close()
+        self.inference_pool = None
+
+
+
+    # EXTERNAL FUNCTION
+
+    def check_AI_precision(self, sample_pairs: list[tuple[numpy_ndarray, numpy_ndarray]]) -> str:
+        # fp16/int8 variant compared with fp32 on sample frame pairs, the variant is used only if accurate enough
+        self.precision_check_pending = False
+        variant_model_path = self._get_model_variant_path()
+
+        try:
+            reference_images = [image.copy() for image in self.AI_interpolation_single_session(sample_pairs)]
+
+            if not os_path_exists(variant_model_path): 
+                self._produce_model_variant(variant_model_path, sample_pairs)
+
+            self._switch_model(variant_model_path)
+            variant_images = self.AI_interpolation_single_session(sample_pairs)
+        except Exception as exception:
+            print(f"[{app_name}] AI precision {self.AI_precision} not available ({str(exception)}), using fp32")
+            if self.AI_model_path != self.fp32_model_path: self._switch_model(self.fp32_model_path)
+            return f"AI precision {self.AI_precision} not available, using fp32"
+
+        psnr     = min(calculate_psnr(reference, variant) for reference, variant in zip(reference_images, variant_images))
+        ssim     = min(calculate_ssim(reference, variant) for reference, variant in zip(reference_images, variant_images))
+        approved = psnr >= AI_PRECISION_MIN_PSNR and ssim >= AI_PRECISION_MIN_SSIM
+
+        self._write_precision_check(variant_model_path, { "psnr": psnr, "ssim": ssim, "approved": approved })
+        
+        if approved:
+            return f"AI precision {self.AI_precision} approved (PSNR {psnr:.2f} SSIM {ssim:.4f})"
+        else:
+            self._switch_model(self.fp32_model_path)
+            return f"AI precision {self.AI_precision} rejected (PSNR {psnr:.2f} SSIM {ssim:.4f}), using fp32"
+
+    def AI_orchestration(self, image1: numpy_ndarray, image2: numpy_ndarray) -> list[numpy_ndarray]:
+        return self.AI_orchestration_batch([(image1, image2)])[0]
+
+    def AI_orchestration_batch(self, image_pairs: list[tuple[numpy_ndarray, numpy_ndarray]]) -> list[list[numpy_ndarray]]:
+        scheduler = AI_wavefront_scheduler(self)
+
+        for pair_index, (image1, image2) in enumerate(image_pairs): 
+            scheduler.submit(pair_index, image1, image2)
+
+        generated_images = []
+        while scheduler.has_pending():
+            generated_images.extend(pair_generated_images for _, pair_generated_images in scheduler.step())
+
+        return generated_images
+
+class AI_inference_pool:
+
+    # Frame pairs of a batch split in contiguous groups, one for every inference session (see create_session_instance)
+    # onnxruntime releases the GIL, so the sessions run at the same time on their own threads
+    # Generated frames are gathered back in the order of the frame pairs, whatever session finishes first
+
+    def __init__(self, session_instances: list[AI_interpolation], layout: tuple[int, int]) -> None:
+        self.session_instances = session_instances
+        self.layout            = layout
+        self.thread_pool       = ThreadPool(len(session_instances))
+
+    def AI_interpolation_batch(self, image_pairs: list[tuple[numpy_ndarray, numpy_ndarray]]) -> list[numpy_ndarray]:
+        how_many_pairs    = len(image_pairs)
+        how_many_sessions = len(self.session_instances)
+
+        sessions_jobs = []
+        for session_index, session_instance in enumerate(self.session_instances):
+            session_pairs = image_pairs[how_many_pairs * session_index // how_many_sessions : how_many_pairs * (session_index + 1) // how_many_sessions]
+            if len(session_pairs) > 0: sessions_jobs.append((session_instance, session_pairs))
+
+        sessions_output_images = self.thread_pool.starmap(AI_interpolation.AI_interpolation_single_session, sessions_jobs)
+
+        return [ output_image for output_images in sessions_output_images for output_image in output_images ]
+
+    def close(self) -> None:
+        self.thread_pool.close()
+        self.thread_pool.join()
+
+class AI_wavefront_scheduler:
+
+    # Frames between image1 and image2 form a bisection tree, only its depth levels depend on each other
+    #   x2 => [A]
+    #   x4 => [B] [A C]
+    #   x8 => [D] [B F] [A C E G]
+    # Every step evaluates the next level of all the frame pairs in progress with a single batched inference,
+    # so new frame pairs can enter while older ones are on deeper levels (wavefront) keeping batches full
+
+    def __init__(self, AI_instance: AI_interpolation) -> None:
+        self.AI_instance      = AI_instance
+        self.frame_gen_factor = AI_instance.frame_gen_factor
+        self.pairs_per_step   = max(1, AI_instance.get_step_batch_size() // (self.frame_gen_factor - 1))
+        self.pairs_in_progress = []
+
+    def submit(self, pair_id, image1: numpy_ndarray, image2: numpy_ndarray) -> None:
+        pair_frames = [None] * (self.frame_gen_factor + 1)
+        pair_frames[0]  = image1
+        pair_frames[-1] = image2
+
+        self.pairs_in_progress.append({ "pair_id": pair_id, "frames": pair_frames, "level": 0 })
+
+    def has_pending(self) -> bool:
+        return len(self.pairs_in_progress) > 0
+
+    def step(self) -> list[tuple]:
+        interpolations = []
+
+        for pair in self.pairs_in_progress:
+            distance = self.frame_gen_factor >> (pair["level"] + 1)
+            for position in range(distance, self.frame_gen_factor, distance * 2):
+                interpolations.append((pair["frames"], position, distance))
+
+        image_pairs   = [(frames[position - distance], frames[position + distance]) for frames, position, distance in interpolations]
+        output_images = self.AI_instance.AI_interpolation_batch(image_pairs)
+
+        for (frames, position, _), output_image in zip(interpolations, output_images):
+            frames[position] = output_image
+
+        # The first step can start the inference sessions pool (calibration), next steps fill every session
+        self.pairs_per_step = max(1, self.AI_instance.get_step_batch_size() // (self.frame_gen_factor - 1))
+
+        for pair in self.pairs_in_progress: 
+            pair["level"] += 1
+
+        # Older pairs are always on deeper levels, so completed pairs leave in submission order
+        completed_pairs = []
+        while self.has_pending() and (self.frame_gen_factor >> self.pairs_in_progress[0]["level"]) == 1:
+            pair = self.pairs_in_progress.pop(0)
+            completed_pairs.append((pair["pair_id"], pair["frames"][1:-1]))
+
+        return completed_pairs
+
+
+
+
+# File Utils functions ------------------------
+
+def create_dir(name_dir: str) -> None:
+    if os_path_exists(name_dir): remove_directory(name_dir)
+    if not os_path_exists(name_dir): os_makedirs(name_dir, mode=0o777)
+
+def image_read(file_path: str) -> numpy_ndarray: 
+    with open(file_path, 'rb') as file:
+        return opencv_imdecode(numpy_ascontiguousarray(numpy_frombuffer(file.read(), uint8)), IMREAD_UNCHANGED)
+
+def image_write(file_path: str, file_data: numpy_ndarray, file_extension: str = ".jpg") -> None: 
+    opencv_imencode(file_extension, file_data)[1].tofile(file_path)
+
+def image_write_atomic(file_path: str, file_data: numpy_ndarray, file_extension: str = ".jpg") -> int: 
+    # The file appears with its name only once completely written (and on disk), returns the checksum of the file
+    encoded_image = opencv_imencode(file_extension, file_data)[1]
+    with open(f"{file_path}.tmp", "wb") as temporary_file:
+        encoded_image.tofile(temporary_file)
+        temporary_file.flush()
+        os_fsync(temporary_file.fileno())
+    os_replace(f"{file_path}.tmp", file_path)
+
+    return crc32(encoded_image)
+
+class FrameWriterPool:
+
+    # Persistent writer threads fed by a bounded queue
+    # When the writers are slower than the frame generation, write() waits (backpressure) instead of piling up frames in memory
+
+    def __init__(
+            self, 
+            how_many_writers: int,
+            frame_buffer_pool: FrameBufferPool = None,
+            queue_size: int = FRAME_WRITERS_QUEUE_SIZE,
+            write_function: Callable = image_write
+            ) -> None:
+        
+        self.frames_q          = Queue(maxsize = queue_size)
+        self.frame_buffer_pool = frame_buffer_pool
+        self.write_function    = write_function
+        self.lock              = Lock()
+        self.errors            = []
+
+        # Metrics
+        self.frames_written  = 0
+        self.max_queue_depth = 0
+        self.stall_time      = 0.0
+
+        self.writers = [ Thread(target = self._writer_loop, daemon = True) for _ in range(max(1, how_many_writers)) ]
+        for writer in self.writers: writer.start()
+
+    def _writer_loop(self) -> None:
+        for frame_key, frame in queue_items(self.frames_q):
+            try:
+                self.write_function(frame_key, frame)
+                with self.lock: self.frames_written += 1
+            except Exception as exception:
+                with self.lock: self.errors.append(exception)
+            finally:
+                if self.frame_buffer_pool != None: self.frame_buffer_pool.release(frame)
+                self.frames_q.task_done()
+
+        self.frames_q.task_done()
+
+    def write(self, frame_key, frame: numpy_ndarray) -> None:
+        # frame_key is the frame path for image files (or the frame position for FrameStore)
+        start_timer = timer()
+        self.frames_q.put((frame_key, frame))
+        self.stall_time     += timer() - start_timer
+        self.max_queue_depth = max(self.max_queue_depth, self.frames_q.qsize())
+
+    def join(self) -> None:
+        # Barrier, returns when every frame given to write() has been written
+        self.frames_q.join()
+        if len(self.errors) > 0: raise self.errors[0]
+
+    def close(self) -> None:
+        # The writer threads end also when a write failed, the error is raised once they are stopped
+        try:
+            self.join()
+        finally:
+            for _ in self.writers: self.frames_q.put(None)
+            for writer in self.writers: writer.join()
+
+        print(f"[{app_name}] Frame writers: {self.frames_written} frames written, max queue depth {self.max_queue_depth}/{self.frames_q.maxsize}, generation stalled for {self.stall_time:.2f}s")
+
+class FrameReaderWindow:
+
+    # Sliding window over the video frames: a background thread reads (and normalizes) the next frames,
+    # every frame is read once and stays in the window until all the frame pairs using it are completed
+
+    def __init__(
+            self, 
+            read_function: Callable,
+            frames_indexes: list[int],
+            AI_instance: AI_interpolation,
+            prefetch_size: int = FRAME_PREFETCH_SIZE
+            ) -> None:
+        
+        self.read_function  = read_function
+        self.frames_indexes = frames_indexes
+        self.AI_instance    = AI_instance
+        self.frames_q       = Queue(maxsize = prefetch_size)
+        self.window_frames  = {}
+        self.stop_reading   = False
+
+        self.reader = Thread(target = self._reader_loop, daemon = True)
+        self.reader.start()
+
+    def _reader_loop(self) -> None:
+        try:
+            for frame_index in self.frames_indexes:
+                if self.stop_reading: break
+                frame = self.read_function(frame_index)
+                self.frames_q.put((frame_index, frame, self.AI_instance.normalize_image(frame)))
+        except Exception as exception:
+            self.frames_q.put(exception)
+        finally:
+            self.frames_q.put(None)
+
+    def get_frame(self, frame_index: int) -> numpy_ndarray:
+        # Frames must be requested in order
+        while frame_index not in self.window_frames:
+            item = self.frames_q.get()
+            if item is None: raise Exception(f"Frame {frame_index} not available")
+            if isinstance(item, Exception): raise item
+
+            index, frame, normalized_frame = item
+            self.window_frames[index] = frame
+            self.AI_instance.add_normalized_image(frame, normalized_frame)
+
+        return self.window_frames[frame_index]
+
+    def release_frames(self, last_frame_index: int) -> None:
+        # Frames up to last_frame_index are not needed anymore
+        for frame_index in [ index for index in self.window_frames if index <= last_frame_index ]:
+            self.AI_instance.remove_normalized_image(self.window_frames.pop(frame_index))
+
+    def close(self) -> None:
+        self.release_frames(max(self.window_frames, default = -1))
+
+        # Frames read ahead and never requested (stopped frame generation) are dropped, so the reader thread ends
+        self.stop_reading = True
+        while self.reader.is_alive():
+            try: self.frames_q.get(timeout = 0.1)
+            except QueueEmpty: pass
+
+class FrameStore:
+
+    # All the frames of a video in a single preallocated file of fixed-size raw frames, memory mapped
+    # The position of a frame is its index in the output video (original frame i => i * frame_gen_factor),
+    # so frame offsets are implicit and the index only keeps a written flag (1 byte) for every position
+
+    def __init__(self, store_directory: str) -> None:
+        self.data_path   = os_path_join(store_directory, "frames.store")
+        self.index_path  = os_path_join(store_directory, "frames.index")
+        self.header_path = os_path_join(store_directory, "frames.json")
+        self.header      = None
+        self.frames      = None
+        self.written     = None
+
+    def create(self, frame_shape: tuple, capacity: int, frame_gen_factor: int) -> None:
+        self.header = {
+            "frame_shape":      list(frame_shape),
+            "frame_gen_factor": frame_gen_factor,
+            "capacity":         0,
+            "how_many_frames":  0,
+            "extracted":        False,
+        }
+        open(self.data_path, "wb").close()
+        open(self.index_path, "wb").close()
+        self.resize(capacity)
+
+    def open(self, frame_gen_factor: int) -> bool:
+        # Resume, only when the frames extraction was completed
+        try:
+            with open(self.header_path, "r") as header_file: header = json_load(header_file)
+        except:
+            return False
+
+        if header.get("frame_gen_factor") != frame_gen_factor or header.get("extracted") != True: return False
+
+        self.header = header
+        self._map()
+        return True
+
+    def _map(self) -> None:
+        capacity    = self.header["capacity"]
+        frame_shape = tuple(self.header["frame_shape"])
+
+        self.frames  = numpy_memmap(self.data_path,  dtype = uint8, mode = "r+", shape = (capacity, *frame_shape))
+        self.written = numpy_memmap(self.index_path, dtype = uint8, mode = "r+", shape = (capacity,))
+
+    def _unmap(self) -> None:
+        if self.frames is not None: 
+            self.frames.flush()
+            self.written.flush()
+        self.frames  = None
+        self.written = None
+
+    def save_header(self) -> None:
+        with open(f"{self.header_path}.tmp", "w") as header_file: header_file.write(json_dumps(self.header))
+        os_replace(f"{self.header_path}.tmp", self.header_path)
+
+    def resize(self, capacity: int) -> None:
+        # Only while no frame view is in use (frames extraction), the file grows sparse
+        self._unmap()
+
+        frame_size = int(numpy_prod(self.header["frame_shape"]))
+        with open(self.data_path, "r+b")  as data_file:  data_file.truncate(max(1, capacity) * frame_size)
+        with open(self.index_path, "r+b") as index_file: index_file.truncate(max(1, capacity))
+
+        self.header["capacity"] = max(1, capacity)
+        self._map()
+        self.save_header()
+
+    def get_capacity(self) -> int:
+        return self.header["capacity"]
+
+    def write(self, position: int, frame: numpy_ndarray) -> None:
+        self.frames[position]  = frame
+        self.written[position] = 1
+
+    def read(self, position: int) -> numpy_ndarray:
+        # Zero-copy view on the mapped file
+        return self.frames[position]
+
+    def is_written(self, position: int) -> bool:
+        return self.written[position] == 1
+
+    def close(self) -> None:
+        self._unmap()
+
+    def delete(self) -> None:
+        self._unmap()
+        for file_path in (self.data_path, self.index_path, self.header_path):
+            if os_path_exists(file_path): os_remove(file_path)
+
+class TieredFrameCache:
+
+    # Frames in RAM up to a memory budget, over the budget frames are spilled to raw files in spill_directory
+    # following the spill policy (lru: least recently read frames first, fifo: oldest frames first)
+    # put() takes ownership of the frame, discarded RAM frames go back to frame_buffer_pool
+
+    def __init__(
+            self,
+            spill_directory: str,
+            ram_budget_mb: int,
+            spill_policy: str = "lru",
+            frame_buffer_pool: FrameBufferPool = None
+            ) -> None:
+
+        self.spill_directory   = spill_directory
+        self.ram_budget        = max(0, int(ram_budget_mb)) * 1024 * 1024
+        self.spill_policy      = spill_policy if spill_policy in ("lru", "fifo") else "lru"
+        self.frame_buffer_pool = frame_buffer_pool
+        self.ram_frames        = OrderedDict()
+        self.disk_frames       = {}
+        self.ram_bytes         = 0
+        self.lock              = Lock()
+
+        # Metrics
+        self.ram_hits       = 0
+        self.disk_hits      = 0
+        self.spilled_frames = 0
+        self.spilled_bytes  = 0
+        self.max_ram_bytes  = 0
+
+    def _get_spill_path(self, frame_key) -> str:
+        return os_path_join(self.spill_directory, f"frame_{frame_key}.raw")
+
+    def _spill(self) -> None:
+        # Spilled frames may still be in use (frames window), so they are left to the garbage collector instead of the buffers pool
+        while self.ram_bytes > self.ram_budget and len(self.ram_frames) > 0:
+            frame_key, frame = self.ram_frames.popitem(last = False)
+            frame.tofile(self._get_spill_path(frame_key))
+
+            self.disk_frames[frame_key] = (frame.shape, frame.dtype)
+            self.ram_bytes      -= frame.nbytes
+            self.spilled_frames += 1
+            self.spilled_bytes  += frame.nbytes
+
+    def put(self, frame_key, frame: numpy_ndarray) -> None:
+        with self.lock:
+            self.ram_frames[frame_key] = frame
+            self.ram_bytes            += frame.nbytes
+            self.max_ram_bytes         = max(self.max_ram_bytes, self.ram_bytes)
+            self._spill()
+
+    def get(self, frame_key) -> numpy_ndarray:
+        with self.lock:
+            frame = self.ram_frames.get(frame_key)
+            if frame is not None:
+                if self.spill_policy == "lru": self.ram_frames.move_to_end(frame_key)
+                self.ram_hits += 1
+                return frame
+
+            # Frames read from disk are not moved back to RAM
+            frame_shape, frame_dtype = self.disk_frames[frame_key]
+            self.disk_hits += 1
+
+        return numpy_fromfile(self._get_spill_path(frame_key), dtype = frame_dtype).reshape(frame_shape)
+
+    def contains(self, frame_key) -> bool:
+        with self.lock: return frame_key in self.ram_frames or frame_key in self.disk_frames
+
+    def discard(self, frame_key) -> None:
+        # Only when the frame is not used anymore
+        with self.lock:
+            frame = self.ram_frames.pop(frame_key, None)
+            if frame is not None:
+                self.ram_bytes -= frame.nbytes
+                if self.frame_buffer_pool != None: self.frame_buffer_pool.release(frame)
+            elif self.disk_frames.pop(frame_key, None) is not None:
+                os_remove(self._get_spill_path(frame_key))
+
+    def close(self) -> None:
+        with self.lock:
+            for frame_key in self.disk_frames:
+                if os_path_exists(self._get_spill_path(frame_key)): os_remove(self._get_spill_path(frame_key))
+            self.ram_frames.clear()
+            self.disk_frames.clear()
+            self.ram_bytes = 0
+
+        print(f"[{app_name}] Frame cache: {self.ram_hits} RAM hits, {self.disk_hits} disk hits, {self.spilled_frames} frames spilled ({self.spilled_bytes / 1048576:.1f} MB), max RAM used {self.max_ram_bytes / 1048576:.1f}/{self.ram_budget / 1048576:.0f} MB ({self.spill_policy})")
+
+class FrameGenerationJournal:
+
+    # Append-only progress journal of the "Frames on disk" pipeline, one json record for line:
+    # settings and frame count (written once the frames extraction is completed), then a record for every 
+    # completed frame pair with the checksums of its generated frames
+    # Records are fsync'ed in batches, a record cut by a killed process is dropped and its frame pair generated again,
+    # on resume the generated frames are checked with their checksums
+
+    def __init__(self, target_directory: str) -> None:
+        self.journal_path     = os_path_join(target_directory, "frames.journal")
+        self.journal_file     = None
+        self.frame_gen_factor = 0
+        self.how_many_frames  = 0
+        self.completed_pairs  = set()
+        self.pending_pairs    = {}
+        self.records_to_sync  = 0
+        self.lock             = Lock()
+
+    def create(self, settings: dict, how_many_frames: int) -> None:
+        self.frame_gen_factor = settings["frame_gen_factor"]
+        self.how_many_frames  = how_many_frames
+        self.journal_file     = open(self.journal_path, "wb")
+        self._append({ "settings": settings, "how_many_frames": how_many_frames }, sync = True)
+
+    def open(self, settings: dict) -> bool:
+        # Resume, only when the journal was written with the same settings
+        try:
+            with open(self.journal_path, "rb") as journal_file: journal_lines = journal_file.read().split(b"\n")
+        except:
+            return False
+
+        records          = []
+        journal_length   = 0
+        missing_line_end = False
+        for line_number, journal_line in enumerate(journal_lines):
+            try: 
+                records.append(json_loads(journal_line))
+            except: 
+                break
+
+            # The last line has no line end, a complete record there was cut just before its line end
+            missing_line_end = line_number == len(journal_lines) - 1
+            journal_length  += len(journal_line) + (0 if missing_line_end else 1)
+
+        if len(records) == 0 or records[0].get("settings") != settings: return False
+
+        self.frame_gen_factor = settings["frame_gen_factor"]
+        self.how_many_frames  = records[0]["how_many_frames"]
+
+        # A frame pair is completed only if its frames are still the ones written, a frame lost or corrupted 
+        # (power loss) makes its frame pair generated again
+        pairs_checksums = {}
+        for record in records[1:]:
+            if "pair" in record: pairs_checksums[record["pair"]] = record["checksums"]
+
+        target_directory = os_path_dirname(self.journal_path)
+        for frame_index, pair_checksums in pairs_checksums.items():
+            if all(self._get_file_checksum(os_path_join(target_directory, frame_name)) == checksum for frame_name, checksum in pair_checksums.items()):
+                self.completed_pairs.add(frame_index)
+
+        corrupted_pairs = len(pairs_checksums) - len(self.completed_pairs)
+        if corrupted_pairs > 0: print(f"[{app_name}] {corrupted_pairs} frame pairs with lost or corrupted frames, they will be generated again")
+
+        # New records start after the last complete one
+        self.journal_file = open(self.journal_path, "r+b")
+        self.journal_file.truncate(journal_length)
+        self.journal_file.seek(journal_length)
+        if missing_line_end: self.journal_file.write(b"\n")
+        return True
+
+    def _get_file_checksum(self, file_path: str) -> int | None:
+        try:
+            with open(file_path, "rb") as file: return crc32(file.read())
+        except:
+            return None
+
+    def _append(self, record: dict, sync: bool = False) -> None:
+        self.journal_file.write(f"{json_dumps(record)}\n".encode())
+        self.records_to_sync += 1
+
+        if sync or self.records_to_sync >= JOURNAL_SYNC_RECORDS:
+            self.journal_file.flush()
+            os_fsync(self.journal_file.fileno())
+            self.records_to_sync = 0
+
+    def is_pair_completed(self, frame_index: int) -> bool:
+        return frame_index in self.completed_pairs
+
+    def add_generated_frame(self, frame_index: int, frame_name: str, checksum: int) -> None:
+        # The frame pair is completed when all its generated frames are on disk
+        with self.lock:
+            pair_checksums = self.pending_pairs.setdefault(frame_index, {})
+            pair_checksums[frame_name] = checksum
+
+            if len(pair_checksums) == self.frame_gen_factor - 1:
+                self._append({ "pair": frame_index, "checksums": self.pending_pairs.pop(frame_index) })
+                self.completed_pairs.add(frame_index)
+
+    def close(self) -> None:
+        if self.journal_file is None: return
+
+        with self.lock:
+            self.journal_file.flush()
+            os_fsync(self.journal_file.fileno())
+            self.journal_file.close()
+            self.journal_file = None
+
+def prepare_output_video_frame_filenames(
+        extracted_frames_paths: list[str],
+        selected_AI_model: str,
+        frame_gen_factor: int,
+        selected_image_extension: str,
+        ) -> list[str]:
+
+    total_frames_paths = []
+    how_many_frames    = len(extracted_frames_paths)
+
+    for index in range(how_many_frames - 1):
+        frame_path            = extracted_frames_paths[index]
+        base_path             = os_path_splitext(frame_path)[0]
+        generated_frames_paths = prepare_generated_frames_paths(base_path, selected_AI_model, selected_image_extension, frame_gen_factor)
+
+        total_frames_paths.append(frame_path)
+        total_frames_paths.extend(generated_frames_paths)
+
+    total_frames_paths.append(extracted_frames_paths[-1])
+
+    return total_frames_paths
+
+def prepare_output_video_filename(
+        video_path: str, 
+        selected_output_path: str,
+        selected_AI_model: str,
+        frame_gen_factor: int, 
+        slowmotion: bool, 
+        input_resize_factor: int, 
+        output_resize_factor: int,
+        selected_video_extension: str,
+        ) -> str:
+    
+
+    if selected_output_path == OUTPUT_PATH_CODED:
+        file_path_no_extension, _ = os_path_splitext(video_path)
+        output_path = file_path_no_extension
+    else:
+        file_name = os_path_basename(video_path)
+        file_path_no_extension, _ = os_path_splitext(file_name)
+        output_path = f"{selected_output_path}{os_separator}{file_path_no_extension}"
+
+    # Selected AI model
+    to_append = f"_{selected_AI_model}x{str(frame_gen_factor)}"
+
+    # Slowmotion?
+    if slowmotion: to_append += "_slowmo"
+
+    # Selected input resize
+    to_append += f"_InputR-{str(int(input_resize_factor * 100))}"
+
+    # Selected output resize
+    to_append += f"_OutputR-{str(int(output_resize_factor * 100))}"
+
+    # Video output
+    to_append += f"{selected_video_extension}"
+
+    output_path += to_append
+
+    return output_path
+
+def prepare_output_video_directory_name(
+        video_path: str, 
+        selected_output_path: str,
+        selected_AI_model: str,
+        frame_gen_factor: int, 
+        slowmotion: bool, 
+        input_resize_factor: int, 
+        output_resize_factor: int, 
+        ) -> str:
+    
+    if selected_output_path == OUTPUT_PATH_CODED:
+        file_path_no_extension, _ = os_path_splitext(video_path)
+        output_path = file_path_no_extension
+    else:
+        file_name = os_path_basename(video_path)
+        file_path_no_extension, _ = os_path_splitext(file_name)
+        output_path = f"{selected_output_path}{os_separator}{file_path_no_extension}"
+
+    # Selected AI model
+    to_append = f"_{selected_AI_model}x{str(frame_gen_factor)}"
+
+    # Slowmotion?
+    if slowmotion: to_append += "_slowmo"
+
+    # Selected input resize
+    to_append += f"_InputR-{str(int(input_resize_factor * 100))}"
+
+    # Selected output resize
+    to_append += f"_OutputR-{str(int(output_resize_factor * 100))}"
+
+    output_path += to_append
+
+    return output_path
+
+
+
+
+# Image/video Utils functions ------------------------
+
+def get_video_fps(video_path: str) -> float:
+    video_capture = opencv_VideoCapture(video_path)
+    frame_rate    = video_capture.get(CAP_PROP_FPS)
+    video_capture.release()
+    return frame_rate
+
+def save_extracted_frames(
+        extracted_frames_paths: list[str], 
+        extracted_frames: list[numpy_ndarray], 
+        cpu_number: int,
+        frame_buffer_pool: FrameBufferPool = None
+        ) -> None:
+    
+    with ThreadPool(cpu_number) as pool: pool.starmap(image_write, zip(extracted_frames_paths, extracted_frames))
+
+    if frame_buffer_pool != None: 
+        for frame in extracted_frames: frame_buffer_pool.release(frame)
+
+def read_frame_into(stream, frame: numpy_ndarray) -> bool:
+    # Fills the frame buffer with the next raw frame of the pipe, False at the end of the video
+    frame_bytes = memoryview(frame).cast("B")
+    bytes_read  = 0
+
+    while bytes_read < len(frame_bytes):
+        chunk_size = stream.readinto(frame_bytes[bytes_read:])
+        if not chunk_size: return False
+        bytes_read += chunk_size
+
+    return True
+
+def read_video_frames_opencv(
+        video_path: str, 
+        AI_instance: AI_interpolation,
+        ) -> Iterator[numpy_ndarray]:
+    
+    video_capture = opencv_VideoCapture(video_path)
+    try:
+        while True:
+            success, frame = video_capture.read()
+            if not success: break
+            yield AI_instance.resize_with_input_factor(frame)
+    finally:
+        video_capture.release()
+
+def read_video_frames_ffmpeg(
+        video_path: str, 
+        AI_instance: AI_interpolation,
+        frame_buffer_pool: FrameBufferPool,
+        segment: dict = None,
+        decoder_threads: int = 0,
+        ) -> Iterator[numpy_ndarray]:
+    
+    # The first frame gives the real frame resolution (after rotation metadata)
+    video_capture  = opencv_VideoCapture(video_path)
+    success, frame = video_capture.read()
+    frame_count    = int(video_capture.get(CAP_PROP_FRAME_COUNT)) if segment == None else 0
+    video_capture.release()
+    if not success: return
+
+    old_height, old_width = AI_instance.get_image_resolution(frame)
+    new_height, new_width = AI_instance.get_input_resized_resolution(old_height, old_width)
+    frame_shape           = (new_height, new_width, 3)
+
+    # Multi-threaded decoding, the input resize is done by ffmpeg with the same interpolation of resize_with_input_factor
+    decoding_command = [
+        FFMPEG_EXE_PATH,
+        "-loglevel", "error",
+        "-threads",  str(decoder_threads),
+    ]
+    video_filters = []
+
+    if segment != None:
+        # Seek to the segment keyframe, frames are then selected by their exact timestamps (see get_video_segments)
+        decoding_command += [ "-copyts" ]
+        if segment["start_pts"] != None: 
+            decoding_command += [ "-noaccurate_seek", "-ss", f"{segment['seek_time']:.6f}" ]
+        
+        trim_filter = "trim"
+        if segment["start_pts"] != None: trim_filter += f"=start_pts={segment['start_pts']}"
+        if segment["end_pts"]   != None: trim_filter += f"{'=' if trim_filter == 'trim' else ':'}end_pts={segment['end_pts']}"
+        video_filters.append(trim_filter)
+
+    decoding_command += [
+        "-i",        video_path,
+        "-map",      "0:v:0",
+        "-vsync",    "passthrough",
+    ]
+
+    if AI_instance.input_resize_factor != 1:
+        scale_flags = "bicubic" if AI_instance.input_resize_factor > 1 else "area"
+        video_filters.append(f"scale={new_width}:{new_height}:flags={scale_flags}")
+
+    if len(video_filters) > 0: decoding_command += [ "-vf", ",".join(video_filters) ]
+    decoding_command += [ "-f", "rawvideo", "-pix_fmt", "bgr24", "pipe:1" ]
+
+    # ffmpeg errors go to a file, a pipe could fill up and block the decoder
+    decoding_errors  = TemporaryFile()
+    decoding_process = subprocess_Popen(decoding_command, stdout = subprocess_PIPE, stderr = decoding_errors, stdin = subprocess_DEVNULL)
+    frames_read      = 0
+    try:
+        while True:
+            frame = frame_buffer_pool.acquire(frame_shape, uint8)
+            if not read_frame_into(decoding_process.stdout, frame): 
+                frame_buffer_pool.release(frame)
+                break
+            frames_read += 1
+            yield frame
+
+        # The end of the pipe is also where a failed decoder stops, that would be a truncated video
+        decoding_process.wait()
+        if decoding_process.returncode != 0 or frames_read < frame_count:
+            decoding_errors.seek(0)
+            decoder_output = decoding_errors.read().decode(errors = "ignore").strip()[-1000:]
+            raise Exception(f"Unable to decode {os_path_basename(video_path)}, {frames_read}/{frame_count} frames read (ffmpeg exit code {decoding_process.returncode}) {decoder_output}")
+    finally:
+        decoding_process.stdout.close()
+        if decoding_process.poll() == None: decoding_process.kill()
+        decoding_process.wait()
+        decoding_errors.close()
+
+def read_video_frames(
+        video_path: str, 
+        AI_instance: AI_interpolation,
+        frame_buffer_pool: FrameBufferPool,
+        ) -> Iterator[numpy_ndarray]:
+    
+    # Frames already resized with the input resize factor, decoded by ffmpeg or OpenCV as fallback
+    if os_path_exists(FFMPEG_EXE_PATH):
+        try:
+            ffmpeg_frames = read_video_frames_ffmpeg(video_path, AI_instance, frame_buffer_pool)
+            first_frame   = next(ffmpeg_frames, None)
+        except Exception as exception:
+            print(f"[{app_name}] ffmpeg decoder error: {str(exception)}")
+            first_frame = None
+
+        if first_frame is not None:
+            yield first_frame
+            yield from ffmpeg_frames
+            return
+        
+        print(f"[{app_name}] ffmpeg decoder not available for this video, using OpenCV")
+
+    yield from read_video_frames_opencv(video_path, AI_instance)
+
+def get_video_keyframes(video_path: str) -> list[tuple]:
+    # Only keyframes are decoded, their timestamps are kept as in the file (-copyts) like in read_video_frames_ffmpeg
+    probe_command = [
+        FFMPEG_EXE_PATH,
+        "-hide_banner",
+        "-copyts",
+        "-skip_frame", "nokey",
+        "-i",          video_path,
+        "-map",        "0:v:0",
+        "-vf",         "showinfo",
+        "-f",          "null",
+        "-"
+    ]
+    try:
+        probe_output = subprocess_run(probe_command, check = True, capture_output = True, stdin = subprocess_DEVNULL).stderr.decode(errors = "ignore")
+    except:
+        return []
+
+    keyframes = re_findall(r"pts:\s*(-?\d+)\s+pts_time:(\S+)", probe_output)
+    keyframes = sorted(set((int(pts), float(pts_time)) for pts, pts_time in keyframes))
+
+    return keyframes
+
+def get_video_segments(
+        video_path: str, 
+        cpu_number: int
+        ) -> list[dict]:
+    
+    # Keyframe aligned segments, every segment can be decoded independently
+    # A segment contains the frames with start_pts <= pts < end_pts, so no frame is lost or duplicated at the borders
+    if not os_path_exists(FFMPEG_EXE_PATH): return []
+
+    video_fps = get_video_fps(video_path)
+    if video_fps <= 0: return []
+
+    video_duration    = get_video_frame_count(video_path) / video_fps
+    how_many_segments = min(cpu_number * EXTRACTION_SEGMENTS_FOR_CPU, int(video_duration // EXTRACTION_MIN_SEGMENT_SECONDS))
+    if how_many_segments < 2: return []
+
+    keyframes = get_video_keyframes(video_path)
+    if len(keyframes) < 2: return []
+
+    first_keyframe_time = keyframes[0][1]
+    segment_keyframes   = []
+
+    for segment_number in range(1, how_many_segments):
+        split_time = first_keyframe_time + segment_number * video_duration / how_many_segments
+        keyframe   = next((keyframe for keyframe in keyframes[1:] if keyframe[1] >= split_time), None)
+        if keyframe != None and keyframe not in segment_keyframes: segment_keyframes.append(keyframe)
+
+    segments   = []
+    boundaries = [ None ] + segment_keyframes + [ None ]
+
+    for index in range(len(boundaries) - 1):
+        start_keyframe = boundaries[index]
+        end_keyframe   = boundaries[index + 1]
+
+        segments.append({
+            "index":     index,
+            "start_pts": start_keyframe[0] if start_keyframe != None else None,
+            "end_pts":   end_keyframe[0]   if end_keyframe   != None else None,
+            "seek_time": max(0, start_keyframe[1] - first_keyframe_time) if start_keyframe != None else None,
+        })
+
+    return segments if len(segments) > 1 else []
+
+def extract_video_segments(
+        process_status_q: multiprocessing_Queue,
+        file_number: int,
+        target_directory: str,
+        AI_instance: AI_interpolation,
+        video_path: str, 
+        cpu_number: int,
+        selected_image_extension: str,
+        segments: list[dict]
+        ) -> list[str]:
+    
+    frames_number_to_save = cpu_number * ECTRACTION_FRAMES_FOR_CPU
+    frame_count           = max(1, get_video_frame_count(video_path))
+    how_many_workers      = min(cpu_number, len(segments))
+    decoder_threads       = max(1, os_cpu_count() // how_many_workers)
+    progress_lock         = Lock()
+    extraction_progress   = { "extracted": 0, "reported": 0 }
+
+    def update_extraction_progress(how_many_frames: int) -> None:
+        # Progress of all the workers, reported as often as the single decoder extraction
+        with progress_lock:
+            extraction_progress["extracted"] += how_many_frames
+            if extraction_progress["extracted"] - extraction_progress["reported"] < frames_number_to_save: return
+            extraction_progress["reported"] = extraction_progress["extracted"]
+
+            percentage_extraction = min(100, (extraction_progress["extracted"] / frame_count) * 100)
+            write_process_status(process_status_q, f"{file_number}. Extracting video frames ({round(percentage_extraction, 2)}%)")
+
+    def extract_video_segment(segment: dict) -> tuple:
+        # Every worker drives its own ffmpeg decoder and writes frames in its own directory
+        segment_directory    = os_path_join(target_directory, f"segment_{segment['index']:03d}")
+        segment_frames_paths = []
+        frames_since_status  = 0
+        os_makedirs(segment_directory, exist_ok = True)
+
+        for frame in read_video_frames_ffmpeg(video_path, AI_instance, AI_instance.output_pool, segment, decoder_threads):
+            check_frame_generation_stop()
+            frame_path = f"{segment_directory}{os_separator}frame_{len(segment_frames_paths):06d}{selected_image_extension}"
+            image_write(frame_path, frame)
+            AI_instance.output_pool.release(frame)
+            segment_frames_paths.append(frame_path)
+
+            frames_since_status += 1
+            if frames_since_status == ECTRACTION_FRAMES_FOR_CPU:
+                update_extraction_progress(frames_since_status)
+                frames_since_status = 0
+
+        update_extraction_progress(frames_since_status)
+        return segment["index"], segment_directory, segment_frames_paths
+
+    print(f"[{app_name}] Extracting {len(segments)} video segments with {how_many_workers} decoders")
+    with ThreadPool(how_many_workers) as pool:
+        extracted_segments = { index: (directory, paths) for index, directory, paths in pool.imap_unordered(extract_video_segment, segments) }
+
+    # A segment without frames means ffmpeg was not able to seek in this video
+    if any(len(paths) == 0 for _, paths in extracted_segments.values()): 
+        for directory, _ in extracted_segments.values(): remove_directory(directory)
+        return []
+
+    # Every decoder checked its own exit code, all together they must give all the frames of the video
+    extracted_frames = sum(len(paths) for _, paths in extracted_segments.values())
+    if extracted_frames < frame_count:
+        raise Exception(f"Unable to decode {os_path_basename(video_path)}, {extracted_frames}/{frame_count} frames read")
+
+    # Segments frames get their global frame number in the video order
+    video_frames_list = []
+    for segment in segments:
+        segment_directory, segment_frames_paths = extracted_segments[segment["index"]]
+
+        for segment_frame_path in segment_frames_paths:
+            frame_path = f"{target_directory}{os_separator}frame_{len(video_frames_list):03d}{selected_image_extension}"
+            os_replace(segment_frame_path, frame_path)
+            video_frames_list.append(frame_path)
+
+        remove_directory(segment_directory)
+
+    return video_frames_list
+
+def extract_video_frames(
+        process_status_q: multiprocessing_Queue,
+        file_number: int,
+        target_directory: str,
+        AI_instance: AI_interpolation,
+        video_path: str, 
+        cpu_number: int,
+        selected_image_extension: str
+        #half_frames: bool = False
+    ) -> list[str]:
+
+    create_dir(target_directory)
+
+    # Long videos are split in segments extracted in parallel
+    segments = get_video_segments(video_path, cpu_number)
+    if len(segments) > 1:
+        video_frames_list = extract_video_segments(process_status_q, file_number, target_directory, AI_instance, video_path, cpu_number, selected_image_extension, segments)
+        if len(video_frames_list) > 0: return video_frames_list
+        print(f"[{app_name}] Segment extraction not available for this video, using a single decoder")
+
+    # Video frame extraction
+    frames_number_to_save = cpu_number * ECTRACTION_FRAMES_FOR_CPU
+    frame_count           = get_video_frame_count(video_path)
+
+    extracted_frames       = []
+    extracted_frames_paths = []
+    video_frames_list      = []
+
+    frame_index = 0
+
+    for frame_number, frame in enumerate(read_video_frames(video_path, AI_instance, AI_instance.output_pool)):
+        check_frame_generation_stop()
+
+        # Extract only the odd frames (1, 3, 5, ...)
+        #if half_frames and frame_index % 2 == 0:
+        #    frame_index += 1
+        #    continue
+
+        frame_path = f"{target_directory}{os_separator}frame_{frame_number:03d}{selected_image_extension}"  
+
+        extracted_frames.append(frame)
+        extracted_frames_paths.append(frame_path)
+        video_frames_list.append(frame_path)
+
+        if len(extracted_frames) == frames_number_to_save:
+            percentage_extraction = (frame_number / frame_count) * 100
+
+            write_process_status(process_status_q, f"{file_number}. Extracting video frames ({round(percentage_extraction, 2)}%)")
+            save_extracted_frames(extracted_frames_paths, extracted_frames, cpu_number, AI_instance.output_pool)
+            extracted_frames       = []
+            extracted_frames_paths = []
+
+        frame_index += 1
+
+    if len(extracted_frames) > 0: 
+        save_extracted_frames(extracted_frames_paths, extracted_frames, cpu_number, AI_instance.output_pool)
+    
+    return video_frames_list
+
+def get_video_frame_count(video_path: str) -> int:
+    video_capture = opencv_VideoCapture(video_path)
+    frame_count   = int(video_capture.get(CAP_PROP_FRAME_COUNT))
+    video_capture.release()
+    return frame_count
+
+def get_video_codec(selected_video_codec: str) -> str:
+    if   "x264" in selected_video_codec: codec = "libx264"
+    elif "x265" in selected_video_codec: codec = "libx265"
+    else: codec = selected_video_codec
+    return codec
+
+def get_output_video_fps(
+        video_path: str, 
+        frame_gen_factor: int,
+        slowmotion: bool
+        ) -> str:
+    
+    # Get the correct output video fps
+    if slowmotion:
+        video_fps = str(get_video_fps(video_path))
+    else:
+        video_fps = str(get_video_fps(video_path) * frame_gen_factor)
+
+    return video_fps
+
+def get_no_audio_video_path(video_output_path: str) -> str:
+    return f"{os_path_splitext(video_output_path)[0]}_no_audio{os_path_splitext(video_output_path)[1]}"
+
+def get_source_mux_options(slowmotion: bool) -> list[str]:
+    # The source video is the second ffmpeg input: its audio (not for slowmotion) and container metadata go in the output video
+    mux_options = [ "-map", "0:v:0", "-map_metadata", "1" ]
+    if slowmotion: mux_options += [ "-an" ]
+    else:          mux_options += [ "-map", "1:a?", "-c:a", "copy" ]
+
+    return mux_options
+
+def check_single_pass_encoding(
+        video_path: str, 
+        video_output_path: str,
+        slowmotion: bool
+        ) -> bool:
+    
+    # The encoder can write the final video (with audio and metadata) when the source audio fits the output container,
+    # checked muxing a fraction of second of audio, otherwise the video is encoded without audio and muxed later
+    if slowmotion: return True
+
+    probe_command = [ FFMPEG_EXE_PATH, "-hide_banner", "-i", video_path ]
+    try:
+        probe_output = subprocess_run(probe_command, capture_output = True, stdin = subprocess_DEVNULL).stderr.decode(errors = "ignore")
+    except:
+        return False
+
+    if len(re_findall(r"Stream #0:\d+.*: Audio:", probe_output)) == 0: return True
+
+    audio_check_path    = f"{os_path_splitext(video_output_path)[0]}_audio_check{os_path_splitext(video_output_path)[1]}"
+    audio_check_command = [
+        FFMPEG_EXE_PATH,
+        "-y",
+        "-loglevel", "error",
+        "-i",        video_path,
+        "-map",      "0:a",
+        "-c:a",      "copy",
+        "-t",        "0.1",
+        audio_check_path
+    ]
+    try:
+        subprocess_run(audio_check_command, check = True, capture_output = True, stdin = subprocess_DEVNULL)
+        return True
+    except:
+        return False
+    finally:
+        if os_path_exists(audio_check_path): os_remove(audio_check_path)
+
+def get_encoding_video_filter(frame_resolution: tuple, output_resolution: tuple) -> str:
+    # The output resize is fused with the color range conversion in a single scale filter
+    if output_resolution == frame_resolution: return "scale=in_range=full:out_range=limited,format=yuv420p"
+
+    output_height, output_width = output_resolution
+    scale_flags = "bicubic" if output_width > frame_resolution[1] else "area"
+
+    return f"scale={output_width}:{output_height}:flags={scale_flags}:in_range=full:out_range=limited,format=yuv420p"
+
+def get_output_resize_stage(frame_resolution: tuple, output_resolution: tuple) -> str:
+    # Where the frames given to the encoder pipe are resized, the cheapest for this process (ffmpeg runs in parallel)
+    #  none   => output resize factor 100%
+    #  memory => opencv resize before the pipe, the pipe carries the output pixels
+    #  ffmpeg => scale filter of the encoder, the pipe carries the frame pixels
+    if output_resolution == frame_resolution: return "none"
+
+    frame_pixels  = frame_resolution[0] * frame_resolution[1]
+    output_pixels = output_resolution[0] * output_resolution[1]
+
+    if output_pixels > frame_pixels:
+        resize_pixel_cost = OUTPUT_RESIZE_PIXEL_COSTS["upscale"]
+    elif frame_resolution[0] % output_resolution[0] == 0 and frame_resolution[1] % output_resolution[1] == 0:
+        resize_pixel_cost = OUTPUT_RESIZE_PIXEL_COSTS["integer downscale"]
+    else:
+        resize_pixel_cost = OUTPUT_RESIZE_PIXEL_COSTS["downscale"]
+
+    memory_cost = resize_pixel_cost * (frame_pixels + output_pixels) + ENCODER_PIPE_PIXEL_COST * output_pixels
+    ffmpeg_cost = ENCODER_PIPE_PIXEL_COST * frame_pixels
+
+    return "memory" if memory_cost < ffmpeg_cost else "ffmpeg"
+
+def encode_frames_files(
+        frames_paths: list[str],
+        output_path: str,
+        video_fps: str,
+        codec: str,
+        video_filter: str,
+        encoder_threads: int = 0,
+        source_video_path: str = None,
+        slowmotion: bool = False
+        ) -> None:
+    
+    # With source_video_path the output gets audio and metadata of the source video
+    txt_path = f"{os_path_splitext(output_path)[0]}.txt"
+    if os_path_exists(txt_path): os_remove(txt_path)
+
+    # Create a file .txt with all upscaled video frames paths || this file is essential
+    with os_fdopen(os_open(txt_path, O_WRONLY | O_CREAT, 0o777), 'w') as txt:
+        for frame_path in frames_paths:
+            txt.write(f"file '{frame_path}' \n")
+
+    encoding_command = [
+        FFMPEG_EXE_PATH,
+        "-y",
+        "-loglevel",    "error",
+        "-f",           "concat",
+        "-safe",        "0",
+        "-r",           video_fps,
+        "-i",           txt_path,
+    ]
+    if source_video_path != None: encoding_command += [ "-i", source_video_path ] + get_source_mux_options(slowmotion)
+    encoding_command += [
+        "-c:v",         codec,
+        "-vf",          video_filter,
+        "-color_range", "tv",
+        "-b:v",         "12000k",
+    ]
+    if encoder_threads > 0: encoding_command += [ "-threads", str(encoder_threads) ]
+    encoding_command.append(output_path)
+
+    try:
+        subprocess_run(encoding_command, check = True)
+    finally:
+        if os_path_exists(txt_path): os_remove(txt_path)
+
+def video_encoding_segments(
+        process_status_q: multiprocessing_Queue,
+        file_number: int,
+        segments: list[list[str]],
+        encoding_directory: str,
+        output_path: str,
+        video_fps: str,
+        codec: str,
+        video_filter: str,
+        source_video_path: str = None,
+        slowmotion: bool = False
+        ) -> None:
+    
+    # Every segment is encoded by its own ffmpeg (so it starts with a keyframe), then segments are concatenated without re-encoding
+    # segments.json keeps the completed segments, an interrupted encoding starts again from the missing ones
+    # With source_video_path the concatenation adds audio and metadata of the source video
+    video_extension   = os_path_splitext(output_path)[1]
+    manifest_path     = os_path_join(encoding_directory, "segments.json")
+    manifest_lock     = Lock()
+    encoding_settings = {
+        "codec":           codec,
+        "video_fps":       video_fps,
+        "video_filter":    video_filter,
+        "video_extension": video_extension,
+        "segments":        [ len(segment) for segment in segments ],
+    }
+
+    manifest = None
+    if os_path_exists(manifest_path):
+        try:
+            with open(manifest_path, "r") as manifest_file: manifest = json_load(manifest_file)
+        except:
+            manifest = None
+
+    if manifest == None or manifest.get("settings") != encoding_settings:
+        create_dir(encoding_directory)
+        manifest = { "settings": encoding_settings, "completed": [] }
+
+    segments_paths     = [ os_path_join(encoding_directory, f"segment_{index:03d}{video_extension}") for index in range(len(segments)) ]
+    segments_to_encode = [ index for index in range(len(segments)) if index not in manifest["completed"] ]
+
+    # CPU codecs scale with more encoders sharing the cores, GPU codecs have a few encoding sessions
+    if codec in ("libx264", "libx265"):
+        how_many_encoders = max(1, min(len(segments_to_encode), os_cpu_count() // ENCODING_THREADS_FOR_SEGMENT))
+        encoder_threads   = max(1, os_cpu_count() // how_many_encoders)
+    else:
+        how_many_encoders = max(1, min(len(segments_to_encode), ENCODING_HARDWARE_SESSIONS))
+        encoder_threads   = 0
+
+    def encode_segment(segment_index: int) -> None:
+        check_frame_generation_stop()
+        encode_frames_files(segments[segment_index], segments_paths[segment_index], video_fps, codec, video_filter, encoder_threads)
+
+        with manifest_lock:
+            manifest["completed"].append(segment_index)
+            with open(f"{manifest_path}.tmp", "w") as manifest_file: manifest_file.write(json_dumps(manifest))
+            os_replace(f"{manifest_path}.tmp", manifest_path)
+            write_process_status(process_status_q, f"{file_number}. Encoding frame-generated video ({len(manifest['completed'])}/{len(segments)} segments)")
+
+    if len(segments) > len(segments_to_encode): print(f"[{app_name}] Resume video encoding, {len(segments) - len(segments_to_encode)}/{len(segments)} segments already encoded")
+    print(f"[FFMPEG] ENCODING ({codec}) {len(segments)} segments with {how_many_encoders} encoders")
+    with ThreadPool(how_many_encoders) as pool:
+        for _ in pool.imap_unordered(encode_segment, segments_to_encode): pass
+
+    # Lossless concatenation of the segments
+    txt_path = os_path_join(encoding_directory, "segments.txt")
+    with open(txt_path, "w") as txt:
+        for segment_path in segments_paths:
+            txt.write(f"file '{segment_path}' \n")
+
+    concat_command = [
+        FFMPEG_EXE_PATH,
+        "-y",
+        "-loglevel", "error",
+        "-f",        "concat",
+        "-safe",     "0",
+        "-i",        txt_path,
+    ]
+    if source_video_path != None: concat_command += [ "-i", source_video_path ] + get_source_mux_options(slowmotion)
+    concat_command += [ "-c:v", "copy", output_path ]
+    subprocess_run(concat_command, check = True)
+    remove_directory(encoding_directory)
+
+def video_encoding(
+        process_status_q: multiprocessing_Queue,
+        file_number: int,
+        video_path: str, 
+        video_output_path: str,
+        total_frames_paths: list, 
+        frame_gen_factor: int,
+        slowmotion: bool,
+        selected_video_codec: str,
+        video_filter: str,
+        encoding_directory: str,
+        ) -> None:
+    
+    codec          = get_video_codec(selected_video_codec)
+    video_fps      = get_output_video_fps(video_path, frame_gen_factor, slowmotion)
+    no_audio_path  = get_no_audio_video_path(video_output_path)
+    segment_length = max(1, int(float(video_fps) * ENCODING_SEGMENT_SECONDS))
+    segments       = [ total_frames_paths[index : index + segment_length] for index in range(0, len(total_frames_paths), segment_length) ]
+
+    # Cleaning files from previous encoding
+    if os_path_exists(no_audio_path): os_remove(no_audio_path)
+
+    # The final video in a single pass (with audio and metadata), otherwise the video without audio muxed later
+    single_pass       = check_single_pass_encoding(video_path, video_output_path, slowmotion)
+    output_path       = video_output_path if single_pass else no_audio_path
+    source_video_path = video_path if single_pass else None
+
+    # Long videos are encoded in segments
+    try: 
+        if len(segments) > 1:
+            video_encoding_segments(process_status_q, file_number, segments, encoding_directory, output_path, video_fps, codec, video_filter, source_video_path, slowmotion)
+        else:
+            print(f"[FFMPEG] ENCODING ({codec})")
+            encode_frames_files(total_frames_paths, output_path, video_fps, codec, video_filter, 0, source_video_path, slowmotion)
+    except FrameGenerationStopped:
+        raise
+    except Exception as exception:
+        # Raised like the other pipelines, so the orchestrator reports the error instead of completed
+        raise Exception("An error occurred during video encoding. \n Have you selected a codec compatible with your GPU? If the issue persists, try selecting 'x264'.") from exception
+
+    if not single_pass: video_audio_passthrough(video_path, no_audio_path, video_output_path, slowmotion)
+
+def video_audio_passthrough(
+        video_path: str, 
+        no_audio_path: str,
+        video_output_path: str,
+        slowmotion: bool,
+        ) -> None:
+
+    # Used when the encoder can not write the final video, the video without audio becomes the final video with a
+    # second ffmpeg (audio) and exiftool (metadata)
+    if slowmotion:
+        # Skip audio passthrough and rename the video without audio
+        os_replace(no_audio_path, video_output_path)
+    else:
+        # The source audio does not fit the output container (checked by check_single_pass_encoding), it is re-encoded
+        print("[FFMPEG] AUDIO PASSTHROUGH")
+        audio_passthrough_command = [
+            FFMPEG_EXE_PATH,
+            "-y",
+            "-loglevel", "error",
+            "-i",        video_path,
+            "-i",        no_audio_path,
+            "-c:v",      "copy",
+            "-map",      "1:v:0",
+            "-map",      "0:a?",
+            "-c:a",      "aac",
+            "-b:a",      "192k",
+            video_output_path
+        ]
+        try: 
+            subprocess_run(audio_passthrough_command, check = True, stdin = subprocess_DEVNULL)
+            os_remove(no_audio_path)
+        except Exception as exception:
+            # The video is not lost, it becomes the final video without audio
+            print(f"[{app_name}] Warning: audio passthrough failed, {os_path_basename(video_output_path)} has no audio ({exception})")
+            os_replace(no_audio_path, video_output_path)
+
+    copy_file_metadata(video_path, video_output_path)
+
+def start_video_encoding_process(
+        video_path: str, 
+        output_path: str,
+        frame_gen_factor: int,
+        slowmotion: bool,
+        selected_video_codec: str,
+        frame_width: int,
+        frame_height: int,
+        video_filter: str,
+        single_pass: bool = False,
+        ) -> subprocess_Popen:
+
+    codec     = get_video_codec(selected_video_codec)
+    video_fps = get_output_video_fps(video_path, frame_gen_factor, slowmotion)
+
+    if os_path_exists(output_path): os_remove(output_path)
+
+    # Frames arrive on stdin as raw BGR pixels, in the same order they will have in the video
+    # With single_pass the output gets audio and metadata of the source video
+    print(f"[FFMPEG] STREAMING ENCODING ({codec})")
+    encoding_command = [
+        FFMPEG_EXE_PATH,
+        "-y",
+        "-loglevel",    "error",
+        "-f",           "rawvideo",
+        "-pix_fmt",     "bgr24",
+        "-s",           f"{frame_width}x{frame_height}",
+        "-r",           video_fps,
+        "-i",           "pipe:0",
+    ]
+    if single_pass: encoding_command += [ "-i", video_path ] + get_source_mux_options(slowmotion)
+    encoding_command += [
+        "-c:v",         codec,
+        "-vf",          video_filter,
+        "-color_range", "tv",
+        "-b:v",         "12000k",
+        output_path
+    ]
+    return subprocess_Popen(encoding_command, stdin = subprocess_PIPE)
+
+def start_frames_encoding_process(
+        video_path: str, 
+        video_output_path: str,
+        AI_instance: AI_interpolation,
+        frame_gen_factor: int,
+        slowmotion: bool,
+        selected_video_codec: str,
+        first_frame: numpy_ndarray,
+        ) -> tuple[subprocess_Popen, Callable, bool]:
+
+    # Encoder of frames with the AI resolution, returns the process, the resize to apply before the pipe (or None)
+    # and if the encoder writes the final video (otherwise video_audio_passthrough is needed once the encoder is done)
+    frame_resolution  = first_frame.shape[:2]
+    output_resolution = AI_instance.get_output_resized_resolution(*frame_resolution)
+    resize_stage      = get_output_resize_stage(frame_resolution, output_resolution)
+    single_pass       = check_single_pass_encoding(video_path, video_output_path, slowmotion)
+    output_path       = video_output_path if single_pass else get_no_audio_video_path(video_output_path)
+    print(f"[{app_name}] Output resize ({resize_stage}): {frame_resolution[1]}x{frame_resolution[0]} => {output_resolution[1]}x{output_resolution[0]}")
+
+    if resize_stage == "memory":
+        video_filter     = get_encoding_video_filter(output_resolution, output_resolution)
+        encoding_process = start_video_encoding_process(video_path, output_path, frame_gen_factor, slowmotion, selected_video_codec, output_resolution[1], output_resolution[0], video_filter, single_pass)
+        return encoding_process, AI_instance.resize_with_output_factor, single_pass
+    else:
+        video_filter     = get_encoding_video_filter(frame_resolution, output_resolution)
+        encoding_process = start_video_encoding_process(video_path, output_path, frame_gen_factor, slowmotion, selected_video_codec, frame_resolution[1], frame_resolution[0], video_filter, single_pass)
+        return encoding_process, None, single_pass
+
+def queue_items(items_q: Queue):
+    # None marks the end of the queue (iter(get, None) would compare frames with ==)
+    while (item := items_q.get()) is not None:
+        yield item
+
+def decode_video_frames(
+        video_path: str, 
+        AI_instance: AI_interpolation,
+        decoded_frames_q: Queue,
+        decoding_stop: Event,
+        decoding_errors: list,
+        ) -> None:
+    
+    # The bounded queue blocks the decoder when the AI is slower, keeping only a few frames in memory
+    video_frames = read_video_frames(video_path, AI_instance, AI_instance.output_pool)
+    try:
+        for frame in video_frames:
+            if decoding_stop.is_set() or is_frame_generation_stop_requested(): break
+            decoded_frames_q.put(frame)
+    except Exception as exception:
+        # Raised by the frame generation at the end of the queue
+        decoding_errors.append(exception)
+    finally:
+        # Closing the frames generator stops the ffmpeg decoder
+        video_frames.close()
+        decoded_frames_q.put(None)
+
+def encode_video_frames(
+        encoding_process: subprocess_Popen, 
+        resize_frame: Callable,
+        AI_instance: AI_interpolation,
+        frames_to_encode_q: Queue,
+        encoding_errors: list,
+        ) -> None:
+    
+    for frame in queue_items(frames_to_encode_q):
+        if len(encoding_errors) == 0:
+            try:
+                resized_frame = resize_frame(frame) if resize_frame != None else frame
+                encoding_process.stdin.write(numpy_ascontiguousarray(resized_frame).data)
+            except Exception as exception:
+                # Keep draining the queue, so the frame generation is never blocked
+                encoding_errors.append(exception)
+        
+        AI_instance.output_pool.release(frame)
+
+    try: encoding_process.stdin.close()
+    except Exception as exception: encoding_errors.append(exception)
+
+def close_streaming_threads(
+        AI_instance: AI_interpolation,
+        decoding_stop: Event,
+        decoded_frames: Iterator[numpy_ndarray],
+        decoder_thread: Thread,
+        encoding_process: subprocess_Popen | None,
+        encoder_thread: Thread | None,
+        frames_to_encode_q: Queue,
+        ) -> None:
+    
+    # The decoder stops at the next frame, its queue is drained so it is never blocked on a full queue
+    decoding_stop.set()
+    for frame in decoded_frames: AI_instance.output_pool.release(frame)
+    decoder_thread.join()
+
+    # The encoder keeps draining its queue after ffmpeg is killed, until the end of the queue
+    if encoding_process is not None:
+        if encoding_process.poll() is None: encoding_process.kill()
+        if encoder_thread.is_alive():
+            frames_to_encode_q.put(None)
+            encoder_thread.join()
+        encoding_process.wait()
+
+def extract_video_frames_to_store(
+        process_status_q: multiprocessing_Queue,
+        file_number: int,
+        frame_store: FrameStore,
+        AI_instance: AI_interpolation,
+        video_path: str, 
+        cpu_number: int,
+        ) -> None:
+    
+    frames_number_to_save = cpu_number * ECTRACTION_FRAMES_FOR_CPU
+    frame_gen_factor      = AI_instance.frame_gen_factor
+    frame_count           = max(1, get_video_frame_count(video_path))
+    how_many_frames       = 0
+
+    for frame_number, frame in enumerate(read_video_frames(video_path, AI_instance, AI_instance.output_pool)):
+        check_frame_generation_stop()
+        position = frame_number * frame_gen_factor
+
+        # The store is preallocated for the expected frames, the frame count of some videos is only an estimate
+        if frame_store.header is None: 
+            frame_store.create(frame.shape, (frame_count - 1) * frame_gen_factor + 1, frame_gen_factor)
+        if position >= frame_store.get_capacity(): 
+            frame_store.resize(max(position + 1, int(frame_store.get_capacity() * 1.25)))
+
+        frame_store.write(position, frame)
+        AI_instance.output_pool.release(frame)
+        how_many_frames += 1
+
+        if how_many_frames % frames_number_to_save == 0:
+            percentage_extraction = min(100, (how_many_frames / frame_count) * 100)
+            write_process_status(process_status_q, f"{file_number}. Extracting video frames ({round(percentage_extraction, 2)}%)")
+
+    if how_many_frames == 0: raise Exception(f"Unable to read video frames of {os_path_basename(video_path)}")
+
+    frame_store.resize((how_many_frames - 1) * frame_gen_factor + 1)
+    frame_store.header["how_many_frames"] = how_many_frames
+    frame_store.header["extracted"]       = True
+    frame_store.save_header()
+
+def extract_video_frames_to_cache(
+        process_status_q: multiprocessing_Queue,
+        file_number: int,
+        frame_cache: TieredFrameCache,
+        AI_instance: AI_interpolation,
+        video_path: str, 
+        cpu_number: int,
+        ) -> int:
+    
+    frames_number_to_save = cpu_number * ECTRACTION_FRAMES_FOR_CPU
+    frame_gen_factor      = AI_instance.frame_gen_factor
+    frame_count           = max(1, get_video_frame_count(video_path))
+    how_many_frames       = 0
+
+    # Decoded frames buffers are given to the cache, the key of a frame is its position in the output video
+    for frame_number, frame in enumerate(read_video_frames(video_path, AI_instance, AI_instance.output_pool)):
+        check_frame_generation_stop()
+        frame_cache.put(frame_number * frame_gen_factor, frame)
+        how_many_frames += 1
+
+        if how_many_frames % frames_number_to_save == 0:
+            percentage_extraction = min(100, (how_many_frames / frame_count) * 100)
+            write_process_status(process_status_q, f"{file_number}. Extracting video frames ({round(percentage_extraction, 2)}%)")
+
+    if how_many_frames == 0: raise Exception(f"Unable to read video frames of {os_path_basename(video_path)}")
+
+    return how_many_frames
+
+def video_encoding_frames(
+        video_path: str, 
+        video_output_path: str,
+        read_frame: Callable,
+        how_many_positions: int,
+        AI_instance: AI_interpolation,
+        frame_gen_factor: int,
+        slowmotion: bool,
+        selected_video_codec: str,
+        release_frame: Callable = None,
+        ) -> None:
+    
+    # Frames go from read_frame(position) (FrameStore or TieredFrameCache) to ffmpeg stdin, resized with the output resize factor on the way
+    # release_frame(position) is called once the frame has been given to ffmpeg
+    encoding_process, resize_frame, single_pass = start_frames_encoding_process(video_path, video_output_path, AI_instance, frame_gen_factor, slowmotion, selected_video_codec, read_frame(0))
+
+    try:
+        for position in range(how_many_positions):
+            check_frame_generation_stop()
+            resized_frame = resize_frame(read_frame(position)) if resize_frame != None else read_frame(position)
+            encoding_process.stdin.write(numpy_ascontiguousarray(resized_frame).data)
+            if release_frame != None: release_frame(position)
+    except BrokenPipeError:
+        # ffmpeg exited before reading all the frames, its error is reported with the returncode
+        pass
+    except:
+        encoding_process.kill()
+        encoding_process.wait()
+        raise
+    finally:
+        # Also on errors, otherwise ffmpeg waits for more frames
+        try: encoding_process.stdin.close()
+        except BrokenPipeError: pass
+
+    encoding_process.wait()
+    if encoding_process.returncode != 0:
+        raise Exception("An error occurred during video encoding. \n Have you selected a codec compatible with your GPU? If the issue persists, try selecting 'x264'.")
+
+    if not single_pass: video_audio_passthrough(video_path, get_no_audio_video_path(video_output_path), video_output_path, slowmotion)
+
+def export_video_frames(
+        read_frame: Callable,
+        total_frames_paths: list[str],
+        cpu_number: int,
+        ) -> None:
+    
+    # Image files of all the frames, with the same names and resolution (AI resolution) of the "Frames on disk" pipeline
+    frame_writers = FrameWriterPool(cpu_number)
+
+    for position, frame_path in enumerate(total_frames_paths):
+        frame_writers.write(frame_path, read_frame(position))
+
+    frame_writers.close()
+
+def calculate_time_to_complete_video(
+        time_for_frame: float, 
+        remaining_frames: int
+        ) -> str:
+    
+    remaining_time = time_for_frame * remaining_frames
+
+    hours_left   = remaining_time // 3600
+    minutes_left = (remaining_time % 3600) // 60
+    seconds_left = round((remaining_time % 3600) % 60)
+
+    time_left = ""
+
+    if int(hours_left) > 0: 
+        time_left = f"{int(hours_left):02d}h"
+    
+    if int(minutes_left) > 0: 
+        time_left = f"{time_left}{int(minutes_left):02d}m"
+
+    if seconds_left > 0: 
+        time_left = f"{time_left}{seconds_left:02d}s"
+
+    return time_left    
+
+def update_process_status_videos(
+        process_status_q: multiprocessing_Queue, 
+        file_number: int, 
+        frame_index: int, 
+        how_many_frames: int,
+        average_processing_time: float,
+        ) -> None:
+    
+    if frame_index != 0:  
+
+        remaining_frames = how_many_frames - frame_index
+        remaining_time   = calculate_time_to_complete_video(average_processing_time, remaining_frames)
+        if remaining_time != "":
+            percent_complete = (frame_index + 1) / how_many_frames * 100 
+            progress = {
+                "percent":      round(percent_complete, 2),
+                "frames_done":  frame_index + 1,
+                "frames_total": how_many_frames,
+                "eta_seconds":  round(average_processing_time * remaining_frames, 1),
+            }
+            write_process_status(process_status_q, f"{file_number}. Generating frames {percent_complete:.2f}% ({remaining_time})", progress)
+
+def prepare_generated_frames_paths(
+        base_path: str,
+        selected_AI_model: str,
+        selected_image_extension: str,
+        frame_gen_factor: int
+        ) -> list[str]:
+    
+    generated_frames_paths = [f"{base_path}_{selected_AI_model}_{i}{selected_image_extension}" for i in range(frame_gen_factor-1)]
+    
+    return generated_frames_paths
+
+def check_frame_generation_option(selected_generation_option: str) -> tuple:
+    slowmotion = False
+    frame_gen_factor = 0
+
+    if "Slowmotion" in selected_generation_option: slowmotion = True
+
+    if   "2" in selected_generation_option: frame_gen_factor = 2
+    elif "4" in selected_generation_option: frame_gen_factor = 4
+    elif "8" in selected_generation_option: frame_gen_factor = 8
+
+    return frame_gen_factor, slowmotion
+
+def copy_file_metadata(
+        original_file_path: str, 
+        upscaled_file_path: str
+        ) -> None:
+    
+    exiftool_cmd = [
+        EXIFTOOL_EXE_PATH, 
+        '-fast', 
+        '-TagsFromFile', 
+        original_file_path, 
+        '-overwrite_original', 
+        '-all:all',
+        '-unsafe',
+        '-largetags', 
+        upscaled_file_path
+    ]
+    
+    try: 
+        subprocess_run(exiftool_cmd, check = True, stdin = subprocess_DEVNULL)
+    except Exception as exception:
+        print(f"[{app_name}] Warning: metadata not copied to {os_path_basename(upscaled_file_path)} ({exception})")
+
+
+
+
+# Core functions ------------------------
+
+class FrameGenerationStopped(Exception):
+    pass
+
+# Set by the frame generation worker, the GUI stop button sets the event instead of terminating the process
+frame_generation_stop_event: multiprocessing_Event | None = None
+
+def is_frame_generation_stop_requested() -> bool:
+    return frame_generation_stop_event is not None and frame_generation_stop_event.is_set()
+
+def check_frame_generation_stop() -> None:
+    if is_frame_generation_stop_requested(): raise FrameGenerationStopped(STOP_STATUS)
+
+def write_process_status(
+        process_status_q: multiprocessing_Queue,
+        step: str,
+        progress: dict | None = None
+        ) -> None:
+    
+    print(f"{step}")
+    while not process_status_q.empty(): process_status_q.get()
+    process_status_q.put(f"{step}" if progress == None else ProcessStatus(step, progress))
+
+
+
+
+# ORCHESTRATOR
+
+# The AI model stays loaded in the frame generation worker between generations,
+# it is only reloaded when the AI model, device or precision change
+warm_AI_instances = {}
+
+def get_AI_instance(
+        selected_AI_model: str,
+        selected_AI_precision: str,
+        selected_gpu: str,
+        frame_gen_factor: int,
+        input_resize_factor: int,
+        output_resize_factor: int
+        ) -> AI_interpolation:
+    
+    AI_instance_key = (selected_AI_model, selected_gpu, selected_AI_precision)
+
+    if AI_instance_key in warm_AI_instances:
+        print(f"[{app_name}] AI model {selected_AI_model} already loaded on {selected_gpu}")
+        AI_instance = warm_AI_instances[AI_instance_key]
+        AI_instance.set_frame_generation_settings(frame_gen_factor, input_resize_factor, output_resize_factor)
+        return AI_instance
+
+    for AI_instance in warm_AI_instances.values(): AI_instance.close_inference_pool()
+    warm_AI_instances.clear()
+    AI_instance = AI_interpolation(selected_AI_model, frame_gen_factor, get_device_profile(selected_gpu), input_resize_factor, output_resize_factor, selected_AI_precision)
+    warm_AI_instances[AI_instance_key] = AI_instance
+    return AI_instance
+
+def frame_generation_worker(
+        frame_generation_command_q: multiprocessing_Queue,
+        process_status_q: multiprocessing_Queue,
+        stop_event: multiprocessing_Event
+        ) -> None:
+    
+    # Persistent process started with the GUI, every command is the arguments of a frame generation
+    global frame_generation_stop_event
+    frame_generation_stop_event = stop_event
+
+    for orchestrator_args in queue_items(frame_generation_command_q):
+        frame_generation_orchestrator(process_status_q, *orchestrator_args)
+
+def frame_generation_orchestrator(
+        process_status_q: multiprocessing_Queue,
+        selected_file_list: list,
+        selected_output_path: str,
+        selected_AI_model: str,
+        selected_AI_precision: str,
+        selected_gpu: str,
+        selected_generation_option: str,
+        selected_image_extension: str,
+        selected_video_extension: str,
+        selected_video_codec: str,
+        input_resize_factor: int,
+        output_resize_factor: int,
+        cpu_number: int,
+        selected_keep_frames: bool,
+        selected_frames_pipeline: str
+        ) -> None:
+         
+    frame_gen_factor, slowmotion = check_frame_generation_option(selected_generation_option)
+    how_many_files = len(selected_file_list)
+    output_videos  = []
+
+    try:
+        write_process_status(process_status_q, "Loading AI model")
+        AI_instance = get_AI_instance(selected_AI_model, selected_AI_precision, selected_gpu, frame_gen_factor, input_resize_factor, output_resize_factor)
+
+        for file_number in range(how_many_files):
+            check_frame_generation_stop()
+            file_path   = selected_file_list[file_number]
+            file_number = file_number + 1
+
+            if selected_frames_pipeline == "Streaming":
+                video_frame_generation_streaming(
+                    process_status_q,
+                    file_path, 
+                    file_number,
+                    selected_output_path,
+                    AI_instance,
+                    selected_AI_model,
+                    frame_gen_factor, 
+                    slowmotion,
+                    selected_video_extension,
+                    selected_video_codec,
+                    input_resize_factor,
+                    output_resize_factor
+                )
+            elif selected_frames_pipeline == "Frame store":
+                video_frame_generation_frame_store(
+                    process_status_q,
+                    file_path, 
+                    file_number,
+                    selected_output_path,
+                    AI_instance,
+                    selected_AI_model,
+                    frame_gen_factor, 
+                    slowmotion,
+                    selected_image_extension, 
+                    selected_video_extension,
+                    selected_video_codec,
+                    input_resize_factor,
+                    output_resize_factor,
+                    cpu_number,
+                    selected_keep_frames
+                )
+            elif selected_frames_pipeline == "Frame cache":
+                video_frame_generation_frame_cache(
+                    process_status_q,
+                    file_path, 
+                    file_number,
+                    selected_output_path,
+                    AI_instance,
+                    selected_AI_model,
+                    frame_gen_factor, 
+                    slowmotion,
+                    selected_image_extension, 
+                    selected_video_extension,
+                    selected_video_codec,
+                    input_resize_factor,
+                    output_resize_factor,
+                    cpu_number,
+                    selected_keep_frames
+                )
+            else:
+                video_frame_generation(
+                    process_status_q,
+                    file_path, 
+                    file_number,
+                    selected_output_path,
+                    AI_instance,
+                    selected_AI_model,
+                    frame_gen_factor, 
+                    slowmotion,
+                    selected_image_extension, 
+                    selected_video_extension,
+                    selected_video_codec,
+                    input_resize_factor,
+                    output_resize_factor,
+                    cpu_number,
+                    selected_keep_frames
+                )
+
+            output_videos.append(prepare_output_video_filename(file_path, selected_output_path, selected_AI_model, frame_gen_factor, slowmotion, input_resize_factor, output_resize_factor, selected_video_extension))
+
+        # The command line checks the output videos before reporting the generation as completed
+        write_process_status(process_status_q, f"{COMPLETED_STATUS}", { "output_videos": output_videos })
+
+    except FrameGenerationStopped:
+        write_process_status(process_status_q, f"{STOP_STATUS}")
+
+    except Exception as exception:
+        write_process_status(process_status_q, f"{ERROR_STATUS} {str(exception)}")
+
+# FRAME GENERATION
+
+def generate_frame_pairs(
+        process_status_q: multiprocessing_Queue,
+        file_number: int,
+        AI_instance: AI_interpolation,
+        pairs_to_generate: list[tuple],
+        how_many_frames: int,
+        frames_window: FrameReaderWindow,
+        frame_writers: FrameWriterPool,
+        ) -> None:
+    
+    # pairs_to_generate = [ (frame index, keys of the generated frames), ... ] in video order,
+    # the keys are given to frame_writers together with the generated frames
+    frame_processing_times = []
+    frame_pairs_to_process = []
+    frames_since_status    = 0
+
+    scheduler   = AI_wavefront_scheduler(AI_instance)
+    start_timer = timer()
+
+    for pair_number, (frame_index, generated_frames_keys) in enumerate(pairs_to_generate):
+        frame_pairs_to_process.append((frame_index, generated_frames_keys))
+
+        is_step_ready = len(frame_pairs_to_process) == scheduler.pairs_per_step
+        is_last_pair  = pair_number == len(pairs_to_generate) - 1
+
+        if not (is_step_ready or is_last_pair): continue
+        check_frame_generation_stop()
+
+        for pair_index, generated_frames_keys in frame_pairs_to_process:
+            frame_1 = frames_window.get_frame(pair_index)
+            frame_2 = frames_window.get_frame(pair_index + 1)
+            scheduler.submit((pair_index, generated_frames_keys), frame_1, frame_2)
+        frame_pairs_to_process = []
+
+        # One wavefront step for every group of new pairs, on the last pair all the pairs in progress are completed
+        completed_pairs = []
+        if scheduler.has_pending(): 
+            completed_pairs.extend(scheduler.step())
+        while is_last_pair and scheduler.has_pending(): 
+            completed_pairs.extend(scheduler.step())
+
+        if len(completed_pairs) == 0: continue
+
+        # Pairs complete in order, so the frames up to the last completed pair leave the window
+        frames_window.release_frames(completed_pairs[-1][0][0])
+
+        # Save generated frames, waits when the writers are behind
+        for (_, generated_frames_keys), generated_frames in completed_pairs:
+            for generated_frame_key, generated_frame in zip(generated_frames_keys, generated_frames):
+                frame_writers.write(generated_frame_key, generated_frame)
+
+        # Calculate processing time (for frame pair) and update process status
+        frame_processing_times.append((timer() - start_timer) / len(completed_pairs))
+        frames_since_status += len(completed_pairs)
+        start_timer          = timer()
+
+        if frames_since_status >= 8:
+            average_processing_time = numpy_mean(frame_processing_times)
+            update_process_status_videos(process_status_q, file_number, frame_index, how_many_frames, average_processing_time)
+            frames_since_status = 0
+
+        if len(frame_processing_times) >= 100: frame_processing_times = []
+
+def video_frame_generation(
+        process_status_q: multiprocessing_Queue,
+        video_path: str, 
+        file_number: int,
+        selected_output_path: str,
+        AI_instance: AI_interpolation,
+        selected_AI_model: str,
+        frame_gen_factor: int, 
+        slowmotion: bool, 
+        selected_image_extension: str,
+        selected_video_extension: str,
+        selected_video_codec: str,
+        input_resize_factor: int,
+        output_resize_factor: int,
+        cpu_number: int, 
+        selected_keep_frames: bool
+        ) -> None:
+    
+    
+    # Internal functions
+
+    def generate_video_frames(
+            process_status_q: multiprocessing_Queue,
+            file_number: int,
+            selected_AI_model: str,
+            AI_instance: AI_interpolation,
+            extracted_frames_paths: list[str],
+            selected_image_extension: str,
+            cpu_number: int,
+            journal: FrameGenerationJournal
+            ) -> None:
+        
+        how_many_pairs   = len(extracted_frames_paths) - 1
+        frame_gen_factor = AI_instance.frame_gen_factor
+
+        # Only the frames of pairs not generated yet are read, each of them once
+        pairs_to_generate = []
+        for frame_index in range(how_many_pairs):
+            if journal.is_pair_completed(frame_index): continue
+
+            base_path              = os_path_splitext(extracted_frames_paths[frame_index])[0]
+            generated_frames_paths = prepare_generated_frames_paths(base_path, selected_AI_model, selected_image_extension, frame_gen_factor)
+            pairs_to_generate.append((frame_index, [ (frame_index, generated_frame_path) for generated_frame_path in generated_frames_paths ]))
+
+        # The pair is recorded in the journal once all its generated frames are written
+        def write_generated_frame(frame_key: tuple, generated_frame: numpy_ndarray) -> None:
+            frame_index, generated_frame_path = frame_key
+            checksum = image_write_atomic(generated_frame_path, generated_frame)
+            journal.add_generated_frame(frame_index, os_path_basename(generated_frame_path), checksum)
+
+        frames_indexes = sorted(set(index for frame_index, _ in pairs_to_generate for index in (frame_index, frame_index + 1)))
+        frames_window  = FrameReaderWindow(lambda frame_index: image_read(extracted_frames_paths[frame_index]), frames_indexes, AI_instance)
+        frame_writers  = FrameWriterPool(cpu_number, AI_instance.output_pool, write_function = write_generated_frame)
+
+        # Wait for the frames still in the writers queue (also when stopped, generated frames are kept in the journal)
+        try:
+            generate_frame_pairs(process_status_q, file_number, AI_instance, pairs_to_generate, len(extracted_frames_paths), frames_window, frame_writers)
+        finally:
+            frames_window.close()
+            frame_writers.close()
+
+
+
+    # Main function
+    
+    # 1. Preparation
+    target_directory  = prepare_output_video_directory_name(video_path, selected_output_path, selected_AI_model, frame_gen_factor, slowmotion,  input_resize_factor, output_resize_factor)
+    video_output_path = prepare_output_video_filename(video_path, selected_output_path, selected_AI_model, frame_gen_factor, slowmotion, input_resize_factor, output_resize_factor, selected_video_extension)
+
+    # 2. Resume frame generation (from the journal) OR Extract video frames and start frame generation
+    journal          = FrameGenerationJournal(target_directory)
+    journal_settings = {
+        "AI_model":         selected_AI_model,
+        "frame_gen_factor": frame_gen_factor,
+        "image_extension":  selected_image_extension,
+    }
+
+    if os_path_exists(target_directory) and journal.open(journal_settings):
+        write_process_status(process_status_q, f"{file_number}. Resume frame generation")
+        extracted_frames_paths = [ f"{target_directory}{os_separator}frame_{frame_index:03d}{selected_image_extension}" for frame_index in range(journal.how_many_frames) ]
+    else:
+        write_process_status(process_status_q, f"{file_number}. Extracting video frames")
+        extracted_frames_paths = extract_video_frames(process_status_q, file_number, target_directory, AI_instance, video_path, cpu_number, selected_image_extension)
+        journal.create(journal_settings, len(extracted_frames_paths))
+
+    total_frames_paths = prepare_output_video_frame_filenames(extracted_frames_paths, selected_AI_model, frame_gen_factor, selected_image_extension)
+
+    # 3. Frame generation
+    if AI_instance.precision_check_pending:
+        write_process_status(process_status_q, f"{file_number}. Checking AI precision {AI_instance.AI_precision}")
+        sample_indexes = sorted(set(index * (len(extracted_frames_paths) - 1) // AI_PRECISION_SAMPLE_PAIRS for index in range(AI_PRECISION_SAMPLE_PAIRS)))
+        sample_pairs   = [(image_read(extracted_frames_paths[index]), image_read(extracted_frames_paths[index + 1])) for index in sample_indexes]
+        print(f"[{app_name}] {AI_instance.check_AI_precision(sample_pairs)}")
+
+    write_process_status(process_status_q, f"{file_number}. Video frame generation")
+    try:
+        generate_video_frames(process_status_q, file_number, selected_AI_model, AI_instance, extracted_frames_paths, selected_image_extension, cpu_number, journal)
+    finally:
+        journal.close()
+
+    # 4. Video encoding, frames are resized with the output resolution by the encoder
+    write_process_status(process_status_q, f"{file_number}. Encoding frame-generated video")
+    frame_resolution  = image_read(extracted_frames_paths[0]).shape[:2]
+    output_resolution = AI_instance.get_output_resized_resolution(*frame_resolution)
+    video_filter      = get_encoding_video_filter(frame_resolution, output_resolution)
+    video_encoding(process_status_q, file_number, video_path, video_output_path, total_frames_paths, frame_gen_factor, slowmotion, selected_video_codec, video_filter, os_path_join(target_directory, "encoding"))
+
+    # 5. Delete frames folder, only once the video is encoded (on errors frames, journal and encoded segments are kept to resume)
+    if selected_keep_frames == False: 
+        if os_path_exists(target_directory): remove_directory(target_directory)
+
+def video_frame_generation_frame_store(
+        process_status_q: multiprocessing_Queue,
+        video_path: str, 
+        file_number: int,
+        selected_output_path: str,
+        AI_instance: AI_interpolation,
+        selected_AI_model: str,
+        frame_gen_factor: int, 
+        slowmotion: bool, 
+        selected_image_extension: str,
+        selected_video_extension: str,
+        selected_video_codec: str,
+        input_resize_factor: int,
+        output_resize_factor: int,
+        cpu_number: int, 
+        selected_keep_frames: bool
+        ) -> None:
+    
+    # Same steps of video_frame_generation, with all the frames in a single FrameStore file instead of image files
+
+    # 1. Preparation
+    target_directory  = prepare_output_video_directory_name(video_path, selected_output_path, selected_AI_model, frame_gen_factor, slowmotion,  input_resize_factor, output_resize_factor)
+    video_output_path = prepare_output_video_filename(video_path, selected_output_path, selected_AI_model, frame_gen_factor, slowmotion, input_resize_factor, output_resize_factor, selected_video_extension)
+    frame_store       = FrameStore(target_directory)
+
+    # 2. Resume frame generation OR Extract video frames in the frame store
+    if os_path_exists(target_directory) and frame_store.open(frame_gen_factor):
+        write_process_status(process_status_q, f"{file_number}. Resume frame generation")
+    else:
+        write_process_status(process_status_q, f"{file_number}. Extracting video frames")
+        create_dir(target_directory)
+        extract_video_frames_to_store(process_status_q, file_number, frame_store, AI_instance, video_path, cpu_number)
+
+    how_many_frames = frame_store.header["how_many_frames"]
+
+    # 3. Frame generation
+    if AI_instance.precision_check_pending:
+        write_process_status(process_status_q, f"{file_number}. Checking AI precision {AI_instance.AI_precision}")
+        sample_indexes = sorted(set(index * (how_many_frames - 1) // AI_PRECISION_SAMPLE_PAIRS for index in range(AI_PRECISION_SAMPLE_PAIRS)))
+        sample_pairs   = [(frame_store.read(index * frame_gen_factor), frame_store.read((index + 1) * frame_gen_factor)) for index in sample_indexes]
+        print(f"[{app_name}] {AI_instance.check_AI_precision(sample_pairs)}")
+
+    write_process_status(process_status_q, f"{file_number}. Video frame generation")
+
+    pairs_to_generate = []
+    for frame_index in range(how_many_frames - 1):
+        generated_frames_positions = [ frame_index * frame_gen_factor + position for position in range(1, frame_gen_factor) ]
+        if not all(frame_store.is_written(position) for position in generated_frames_positions):
+            pairs_to_generate.append((frame_index, generated_frames_positions))
+
+    frames_indexes = sorted(set(index for frame_index, _ in pairs_to_generate for index in (frame_index, frame_index + 1)))
+    frames_window  = FrameReaderWindow(lambda frame_index: frame_store.read(frame_index * frame_gen_factor), frames_indexes, AI_instance)
+    frame_writers  = FrameWriterPool(cpu_number, AI_instance.output_pool, write_function = frame_store.write)
+
+    try:
+        generate_frame_pairs(process_status_q, file_number, AI_instance, pairs_to_generate, how_many_frames, frames_window, frame_writers)
+    finally:
+        frames_window.close()
+        frame_writers.close()
+
+    # 4. Video encoding (with output resolution)
+    write_process_status(process_status_q, f"{file_number}. Encoding frame-generated video")
+    video_encoding_frames(video_path, video_output_path, frame_store.read, frame_store.get_capacity(), AI_instance, frame_gen_factor, slowmotion, selected_video_codec)
+
+    # 5. Export frames as image files OR Delete frames folder
+    if selected_keep_frames == True:
+        write_process_status(process_status_q, f"{file_number}. Saving video frames")
+        extracted_frames_paths = [ f"{target_directory}{os_separator}frame_{frame_index:03d}{selected_image_extension}" for frame_index in range(how_many_frames) ]
+        total_frames_paths     = prepare_output_video_frame_filenames(extracted_frames_paths, selected_AI_model, frame_gen_factor, selected_image_extension)
+        export_video_frames(frame_store.read, total_frames_paths, cpu_number)
+        frame_store.delete()
+    else:
+        frame_store.close()
+        if os_path_exists(target_directory): remove_directory(target_directory)
+
+def video_frame_generation_frame_cache(
+        process_status_q: multiprocessing_Queue,
+        video_path: str, 
+        file_number: int,
+        selected_output_path: str,
+        AI_instance: AI_interpolation,
+        selected_AI_model: str,
+        frame_gen_factor: int, 
+        slowmotion: bool, 
+        selected_image_extension: str,
+        selected_video_extension: str,
+        selected_video_codec: str,
+        input_resize_factor: int,
+        output_resize_factor: int,
+        cpu_number: int, 
+        selected_keep_frames: bool
+        ) -> None:
+    
+    # Same steps of video_frame_generation_frame_store, with the frames in a TieredFrameCache (RAM first, disk over budget)
+    # Nothing survives the process, so frame generation always starts from the beginning
+
+    # 1. Preparation
+    target_directory   = prepare_output_video_directory_name(video_path, selected_output_path, selected_AI_model, frame_gen_factor, slowmotion,  input_resize_factor, output_resize_factor)
+    video_output_path  = prepare_output_video_filename(video_path, selected_output_path, selected_AI_model, frame_gen_factor, slowmotion, input_resize_factor, output_resize_factor, selected_video_extension)
+    frame_cache_config = { **DEFAULT_FRAME_CACHE, **get_user_preference().get("default_frame_cache", {}) }
+    frame_cache        = TieredFrameCache(target_directory, frame_cache_config["ram_budget_mb"], frame_cache_config["spill_policy"], AI_instance.output_pool)
+
+    # 2. Extract video frames in the frame cache
+    write_process_status(process_status_q, f"{file_number}. Extracting video frames")
+    create_dir(target_directory)
+
+    try:
+        how_many_frames = extract_video_frames_to_cache(process_status_q, file_number, frame_cache, AI_instance, video_path, cpu_number)
+
+        # 3. Frame generation
+        if AI_instance.precision_check_pending:
+            write_process_status(process_status_q, f"{file_number}. Checking AI precision {AI_instance.AI_precision}")
+            sample_indexes = sorted(set(index * (how_many_frames - 1) // AI_PRECISION_SAMPLE_PAIRS for index in range(AI_PRECISION_SAMPLE_PAIRS)))
+            sample_pairs   = [(frame_cache.get(index * frame_gen_factor), frame_cache.get((index + 1) * frame_gen_factor)) for index in sample_indexes]
+            print(f"[{app_name}] {AI_instance.check_AI_precision(sample_pairs)}")
+
+        write_process_status(process_status_q, f"{file_number}. Video frame generation")
+
+        pairs_to_generate = [ (frame_index, [ frame_index * frame_gen_factor + position for position in range(1, frame_gen_factor) ]) for frame_index in range(how_many_frames - 1) ]
+        frames_window     = FrameReaderWindow(lambda frame_index: frame_cache.get(frame_index * frame_gen_factor), list(range(how_many_frames)), AI_instance)
+        frame_writers     = FrameWriterPool(cpu_number, write_function = frame_cache.put)
+
+        try:
+            generate_frame_pairs(process_status_q, file_number, AI_instance, pairs_to_generate, how_many_frames, frames_window, frame_writers)
+        finally:
+            frames_window.close()
+            frame_writers.close()
+
+        # 4. Video encoding (with output resolution), frames leave the cache once encoded when they are not kept
+        write_process_status(process_status_q, f"{file_number}. Encoding frame-generated video")
+        how_many_positions = (how_many_frames - 1) * frame_gen_factor + 1
+        release_frame      = None if selected_keep_frames == True else frame_cache.discard
+        video_encoding_frames(video_path, video_output_path, frame_cache.get, how_many_positions, AI_instance, frame_gen_factor, slowmotion, selected_video_codec, release_frame)
+
+        # 5. Export frames as image files
+        if selected_keep_frames == True:
+            write_process_status(process_status_q, f"{file_number}. Saving video frames")
+            extracted_frames_paths = [ f"{target_directory}{os_separator}frame_{frame_index:03d}{selected_image_extension}" for frame_index in range(how_many_frames) ]
+            total_frames_paths     = prepare_output_video_frame_filenames(extracted_frames_paths, selected_AI_model, frame_gen_factor, selected_image_extension)
+            export_video_frames(frame_cache.get, total_frames_paths, cpu_number)
+
+    finally:
+        frame_cache.close()
+
+    # 6. Delete frames folder
+    if selected_keep_frames == False: 
+        if os_path_exists(target_directory): remove_directory(target_directory)
+
+def video_frame_generation_streaming(
+        process_status_q: multiprocessing_Queue,
+        video_path: str, 
+        file_number: int,
+        selected_output_path: str,
+        AI_instance: AI_interpolation,
+        selected_AI_model: str,
+        frame_gen_factor: int, 
+        slowmotion: bool, 
+        selected_video_extension: str,
+        selected_video_codec: str,
+        input_resize_factor: int,
+        output_resize_factor: int,
+        ) -> None:
+
+    # Decoder thread -> frames queue -> AI (wavefront scheduler) -> frames queue -> encoder thread -> ffmpeg stdin
+    # Frames never touch the disk, both queues are bounded so memory stays constant for any video length
+
+    # 1. Preparation
+    video_output_path = prepare_output_video_filename(video_path, selected_output_path, selected_AI_model, frame_gen_factor, slowmotion, input_resize_factor, output_resize_factor, selected_video_extension)
+    how_many_frames   = get_video_frame_count(video_path)
+
+    decoded_frames_q   = Queue(maxsize = STREAMING_QUEUE_SIZE)
+    frames_to_encode_q = Queue(maxsize = STREAMING_QUEUE_SIZE * frame_gen_factor)
+    decoding_errors    = []
+    encoding_errors    = []
+
+    write_process_status(process_status_q, f"{file_number}. Video frame generation")
+    decoding_stop  = Event()
+    decoder_thread = Thread(target = decode_video_frames, args = (video_path, AI_instance, decoded_frames_q, decoding_stop, decoding_errors), daemon = True)
+    decoder_thread.start()
+    decoded_frames = queue_items(decoded_frames_q)
+
+    encoding_process = None
+    encoder_thread   = None
+
+    try:
+        # 2. AI precision check on the first frames of the video
+        if AI_instance.precision_check_pending:
+            write_process_status(process_status_q, f"{file_number}. Checking AI precision {AI_instance.AI_precision}")
+            first_frames   = list(islice(decoded_frames, AI_PRECISION_SAMPLE_PAIRS + 1))
+            sample_pairs   = list(zip(first_frames[:-1], first_frames[1:]))
+            decoded_frames = chain(first_frames, decoded_frames)
+            print(f"[{app_name}] {AI_instance.check_AI_precision(sample_pairs)}")
+
+        # 3. Start encoding, the frame resolution comes from the first frame
+        frame_1 = next(decoded_frames, None)
+        check_frame_generation_stop()
+        if frame_1 is None: raise Exception(f"Unable to read video frames of {os_path_basename(video_path)}")
+
+        encoding_process, resize_frame, single_pass = start_frames_encoding_process(video_path, video_output_path, AI_instance, frame_gen_factor, slowmotion, selected_video_codec, frame_1)
+        encoder_thread = Thread(target = encode_video_frames, args = (encoding_process, resize_frame, AI_instance, frames_to_encode_q, encoding_errors), daemon = True)
+        encoder_thread.start()
+
+        # 4. Frame generation
+        frame_processing_times = []
+        frames_since_status    = 0
+        pairs_since_step       = 0
+        frame_index            = 0
+
+        scheduler   = AI_wavefront_scheduler(AI_instance)
+        start_timer = timer()
+
+        def step_and_encode(drain: bool) -> int:
+            completed_pairs = scheduler.step()
+            while drain and scheduler.has_pending(): 
+                completed_pairs.extend(scheduler.step())
+
+            # The pair id is the first frame of the pair, followed by its generated frames
+            for pair_frame_1, generated_frames in completed_pairs:
+                frames_to_encode_q.put(pair_frame_1)
+                for generated_frame in generated_frames: 
+                    frames_to_encode_q.put(generated_frame)
+
+            return len(completed_pairs)
+
+        for frame_2 in decoded_frames:
+            check_frame_generation_stop()
+            scheduler.submit(frame_1, frame_1, frame_2)
+            frame_1           = frame_2
+            pairs_since_step += 1
+            frame_index      += 1
+
+            if pairs_since_step < scheduler.pairs_per_step: continue
+            pairs_since_step = 0
+
+            completed_pairs = step_and_encode(drain = False)
+            if len(encoding_errors) > 0: break
+            if completed_pairs == 0: continue
+
+            # Calculate processing time (for frame pair) and update process status
+            frame_processing_times.append((timer() - start_timer) / completed_pairs)
+            frames_since_status += completed_pairs
+            start_timer          = timer()
+
+            if frames_since_status >= 8:
+                average_processing_time = numpy_mean(frame_processing_times)
+                update_process_status_videos(process_status_q, file_number, frame_index, how_many_frames, average_processing_time)
+                frames_since_status = 0
+
+            if len(frame_processing_times) >= 100: frame_processing_times = []
+
+        # A decoder error ends the queue like the end of the video (the error is added before the end of the queue)
+        if len(decoding_errors) > 0: raise decoding_errors[0]
+
+        if scheduler.has_pending() and len(encoding_errors) == 0: 
+            step_and_encode(drain = True)
+
+        # Last video frame
+        if len(encoding_errors) == 0:
+            frames_to_encode_q.put(frame_1)
+            frames_to_encode_q.put(None)
+            encoder_thread.join()
+            encoding_process.wait()
+
+        if len(encoding_errors) > 0 or encoding_process.returncode != 0:
+            raise Exception("An error occurred during video encoding. \n Have you selected a codec compatible with your GPU? If the issue persists, try selecting 'x264'.")
+
+    except:
+        # Any failure (or frame generation stop) stops both ffmpeg processes and threads, the worker process stays alive
+        close_streaming_threads(AI_instance, decoding_stop, decoded_frames, decoder_thread, encoding_process, encoder_thread, frames_to_encode_q)
+
+        # The video encoded so far is not kept, it would look like a complete video
+        for partial_video_path in (video_output_path, get_no_audio_video_path(video_output_path)):
+            if os_path_exists(partial_video_path): os_remove(partial_video_path)
+        raise
+
+    # 5. Audio and metadata (when the encoder did not write them)
+    if not single_pass:
+        write_process_status(process_status_q, f"{file_number}. Encoding frame-generated video")
+        video_audio_passthrough(video_path, get_no_audio_video_path(video_output_path), video_output_path, slowmotion)
@@ -0,0 +1,1779 @@
+# Standard library imports
+import sys
+from functools  import cache
+from time       import sleep
+from webbrowser import open as open_browser
+from threading  import Thread
+from typing     import Callable
+from multiprocessing import ( 
+    Process, 
+    Queue          as multiprocessing_Queue,
+    Event          as multiprocessing_Event
+)
+
+from json import dumps as json_dumps
+
+from os import (
+    sep        as os_separator,
+    devnull    as os_devnull,
+    cpu_count  as os_cpu_count,
+)
+
+from os.path import (
+    basename   as os_path_basename,
+    exists     as os_path_exists
+)
+
+# Third-party library imports
+from PIL.Image import (
+    open      as pillow_image_open,
+    fromarray as pillow_image_fromarray
+)
+
+from cv2 import (
+    CAP_PROP_FPS,
+    CAP_PROP_FRAME_COUNT,
+    CAP_PROP_FRAME_HEIGHT,
+    CAP_PROP_FRAME_WIDTH,
+    COLOR_BGR2RGB,
+    VideoCapture as opencv_VideoCapture,
+    cvtColor     as opencv_cvtColor,
+    resize       as opencv_resize,
+)
+
+# Shared settings and engine imports
+from fluidframes.config import (
+    app_name,
+    version,
+    find_by_relative_path,
+    AI_models_list,
+    AI_precision_list,
+    generation_options_list,
+    gpus_list,
+    keep_frames_list,
+    frames_pipeline_list,
+    image_extension_list,
+    video_extension_list,
+    video_codec_list,
+    supported_file_extensions,
+    supported_video_extensions,
+    OUTPUT_PATH_CODED,
+    USER_PREFERENCE_PATH,
+    FFMPEG_EXE_PATH,
+    COMPLETED_STATUS,
+    ERROR_STATUS,
+    STOP_STATUS,
+    get_user_preference
+)
+
+from fluidframes.engine import (
+    AI_PRECISION_MIN_PSNR,
+    AI_PRECISION_MIN_SSIM,
+    image_read,
+    write_process_status,
+    frame_generation_worker
+)
+
+# GUI imports
+from tkinter import StringVar
+from tkinter import DISABLED
+from customtkinter import (
+    CTk,
+    CTkFrame,
+    CTkButton,
+    CTkEntry,
+    CTkFont,
+    CTkImage,
+    CTkLabel,
+    CTkOptionMenu,
+    CTkScrollableFrame,
+    CTkToplevel,
+    filedialog,
+    set_appearance_mode,
+    set_default_color_theme
+)
+
+
+
+githubme   = "https://github.com/Djdefrag/FluidFrames.RIFE"
+telegramme = "https://linktr.ee/j3ngystudio"
+
+app_name_color          = "#F08080"
+background_color        = "#000000"
+widget_background_color = "#181818"
+text_color              = "#B8B8B8"
+
+
+offset_y_options = 0.0825
+row1  = 0.125
+row2  = row1 + offset_y_options
+row3  = row2 + offset_y_options
+row4  = row3 + offset_y_options
+row5  = row4 + offset_y_options
+row6  = row5 + offset_y_options
+row7  = row6 + offset_y_options
+row8  = row7 + offset_y_options
+row9  = row8 + offset_y_options
+row10 = row9 + offset_y_options
+
+column_offset = 0.2
+column_info1  = 0.625
+column_info2  = 0.858
+column_1      = 0.66
+column_2      = column_1 + column_offset
+column_1_5    = column_info1 + 0.08
+column_1_4    = column_1_5 - 0.0127
+column_3      = column_info2 + 0.08
+column_2_9    = column_3 - 0.0127
+column_3_5    = column_2 + 0.0355
+
+little_textbox_width = 74
+little_menu_width = 98
+
+if sys.stdout is None: sys.stdout = open(os_devnull, "w")
+if sys.stderr is None: sys.stderr = open(os_devnull, "w")
+
+
+
+# GUI utils ---------------------------
+
+class MessageBox(CTkToplevel):
+
+    def __init__(
+            self,
+            messageType: str,
+            title: str,
+            subtitle: str,
+            default_value: str,
+            option_list: list,
+            ) -> None:
+
+        super().__init__()
+
+        self._running: bool = False
+
+        self._messageType = messageType
+        self._title       = title        
+        self._subtitle    = subtitle
+        self._default_value = default_value
+        self._option_list   = option_list
+        self._ctkwidgets_index = 0
+
+        self.title('')
+        self.lift()                          # lift window on top
+        self.attributes("-topmost", True)    # stay on top
+        self.protocol("WM_DELETE_WINDOW", self._on_closing)
+        self.after(10, self._create_widgets)  # create widgets with slight delay, to avoid white flickering of background
+        self.resizable(False, False)
+        self.grab_set()                       # make other windows not clickable
+
+    def _ok_event(
+            self, 
+            event = None
+            ) -> None:
+        self.grab_release()
+        self.destroy()
+
+    def _on_closing(
+            self
+            ) -> None:
+        self.grab_release()
+        self.destroy()
+
+    def createEmptyLabel(self) -> CTkLabel:
+        return CTkLabel(
+            master   = self,
+            fg_color = "transparent",
+            width    = 500,
+            height   = 17,
+            text     = ''
+        )
+
+    def placeInfoMessageTitleSubtitle(self) -> None:
+
+        spacingLabel1 = self.createEmptyLabel()
+        spacingLabel2 = self.createEmptyLabel()
+
+        if self._messageType == "info":
+            title_subtitle_text_color = "#3399FF"
+        elif self._messageType == "error":
+            title_subtitle_text_color = "#FF3131"
+
+        titleLabel = CTkLabel(
+            master     = self,
+            width      = 500,
+            anchor     = 'w',
+            justify    = "left",
+            fg_color   = "transparent",
+            text_color = title_subtitle_text_color,
+            font       = bold22,
+            text       = self._title
+            )
+        
+        if self._default_value != None:
+            defaultLabel = CTkLabel(
+                master     = self,
+                width      = 500,
+                anchor     = 'w',
+                justify    = "left",
+                fg_color   = "transparent",
+                text_color = "#3399FF",
+                font       = bold17,
+                text       = f"Default: {self._default_value}"
+                )
+        
+        subtitleLabel = CTkLabel(
+            master     = self,
+            width      = 500,
+            anchor     = 'w',
+            justify    = "left",
+            fg_color   = "transparent",
+            text_color = title_subtitle_text_color,
+            font       = bold14,
+            text       = self._subtitle
+            )
+        
+        spacingLabel1.grid(row = self._ctkwidgets_index, column = 0, columnspan = 2, padx = 0, pady = 0, sticky = "ew")
+        
+        self._ctkwidgets_index += 1
+        titleLabel.grid(row = self._ctkwidgets_index, column = 0, columnspan = 2, padx = 25, pady = 0, sticky = "ew")
+        
+        if self._default_value != None:
+            self._ctkwidgets_index += 1
+            defaultLabel.grid(row = self._ctkwidgets_index, column = 0, columnspan = 2, padx = 25, pady = 0, sticky = "ew")
+        
+        self._ctkwidgets_index += 1
+        subtitleLabel.grid(row = self._ctkwidgets_index, column = 0, columnspan = 2, padx = 25, pady = 0, sticky = "ew")
+        
+        self._ctkwidgets_index += 1
+        spacingLabel2.grid(row = self._ctkwidgets_index, column = 0, columnspan = 2, padx = 0, pady = 0, sticky = "ew")
+
+    def placeInfoMessageOptionsText(self) -> None:
+        
+        for option_text in self._option_list:
+            optionLabel = CTkLabel(
+                master        = self,
+                width         = 600,
+                height        = 45,
+                anchor        = 'w',
+                justify       = "left",
+                text_color    = text_color,
+                fg_color      = "#282828",
+                bg_color      = "transparent",
+                font          = bold13,
+                text          = option_text,
+                corner_radius = 10,
+            )
+            
+            self._ctkwidgets_index += 1
+            optionLabel.grid(row = self._ctkwidgets_index, column = 0, columnspan = 2, padx = 25, pady = 4, sticky = "ew")
+
+        spacingLabel3 = self.createEmptyLabel()
+
+        self._ctkwidgets_index += 1
+        spacingLabel3.grid(row = self._ctkwidgets_index, column = 0, columnspan = 2, padx = 0, pady = 0, sticky = "ew")
+
+    def placeInfoMessageOkButton(
+            self
+            ) -> None:
+        
+        ok_button = CTkButton(
+            master  = self,
+            command = self._ok_event,
+            text    = 'OK',
+            width   = 125,
+            font         = bold11,
+            border_width = 1,
+            fg_color     = "#282828",
+            text_color   = "#E0E0E0",
+            border_color = "#0096FF"
+        )
+        
+        self._ctkwidgets_index += 1
+        ok_button.grid(row = self._ctkwidgets_index, column = 1, columnspan = 1, padx = (10, 20), pady = (10, 20), sticky = "e")
+
+    def _create_widgets(
+            self
+            ) -> None:
+
+        self.grid_columnconfigure((0, 1), weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.placeInfoMessageTitleSubtitle()
+        self.placeInfoMessageOptionsText()
+        self.placeInfoMessageOkButton()
+
+class FileWidget(CTkScrollableFrame):
+
+    def __init__(
+            self, 
+            master,
+            selected_file_list, 
+            frame_generation_factor = 1,
+            input_resize_factor     = 0,
+            output_resize_factor    = 0,
+            **kwargs
+            ) -> None:
+        
+        super().__init__(master, **kwargs)
+        self.grid_columnconfigure(0, weight = 1)
+
+        self.file_list               = selected_file_list
+        self.frame_generation_factor = frame_generation_factor
+        self.input_resize_factor     = input_resize_factor
+        self.output_resize_factor    = output_resize_factor
+
+        self.index_row = 1
+        self.ui_components = []
+        self._create_widgets()
+
+    def _destroy_(self) -> None:
+        self.file_list = []
+        self.destroy()
+        place_loadFile_section()
+
+    def _create_widgets(self) -> None:
+        self.add_clean_button()
+        for file_path in self.file_list:
+            file_name_label, file_info_label = self.add_file_information(file_path)
+            self.ui_components.append(file_name_label)
+            self.ui_components.append(file_info_label)
+
+    def add_file_information(self, file_path) -> tuple:
+        infos, icon = self.extract_file_info(file_path)
+
+        # File name
+        file_name_label = CTkLabel(
+            self, 
+            text       = os_path_basename(file_path),
+            font       = bold14,
+            text_color = text_color,
+            compound   = "left", 
+            anchor     = "w",
+            padx       = 10,
+            pady       = 5,
+            justify    = "left",
+        )      
+        file_name_label.grid(
+            row    = self.index_row, 
+            column = 0,
+            pady   = (0, 2),
+            padx   = (3, 3),
+            sticky = "w"
+        )
+
+        # File infos and icon
+        file_info_label = CTkLabel(
+            self, 
+            text       = infos,
+            image      = icon, 
+            font       = bold12,
+            text_color = text_color,
+            compound   = "left", 
+            anchor     = "w",
+            padx       = 10,
+            pady       = 5,
+            justify    = "left",
+        )      
+        file_info_label.grid(
+            row    = self.index_row + 1, 
+            column = 0,
+            pady   = (0, 15),
+            padx   = (3, 3),
+            sticky = "w"
+        )
+
+        self.index_row += 2
+
+        return file_name_label, file_info_label
+
+    def add_clean_button(self) -> None:
+
+        button = CTkButton(
+            master        = self, 
+            command       = self._destroy_,
+            text          = "CLEAN",
+            image         = clear_icon,
+            width         = 90, 
+            height        = 28,
+            font          = bold11,
+            border_width  = 1,
+            corner_radius = 1,
+            fg_color      = "#282828",
+            text_color    = "#E0E0E0",
+            border_color  = "#0096FF"
+        )
+        
+        button.grid(row = 0, column=2, pady=(7, 7), padx = (0, 7))
+        
+
+    
+    @cache
+    def extract_file_icon(self, file_path) -> CTkImage:
+        max_size = 60
+
+        if check_if_file_is_video(file_path):
+            video_cap   = opencv_VideoCapture(file_path)
+            _, frame    = video_cap.read()
+            source_icon = opencv_cvtColor(frame, COLOR_BGR2RGB)
+            video_cap.release()
+        else:
+            source_icon = opencv_cvtColor(image_read(file_path), COLOR_BGR2RGB)
+
+        ratio       = min(max_size / source_icon.shape[0], max_size / source_icon.shape[1])
+        new_width   = int(source_icon.shape[1] * ratio)
+        new_height  = int(source_icon.shape[0] * ratio)
+        source_icon = opencv_resize(source_icon,(new_width, new_height))
+        ctk_icon    = CTkImage(pillow_image_fromarray(source_icon, mode="RGB"), size = (new_width, new_height))
+
+        return ctk_icon
+
+    def extract_file_info(self, file_path) -> tuple:
+        
+        if check_if_file_is_video(file_path):
+            cap          = opencv_VideoCapture(file_path)
+            width        = round(cap.get(CAP_PROP_FRAME_WIDTH))
+            height       = round(cap.get(CAP_PROP_FRAME_HEIGHT))
+            num_frames   = int(cap.get(CAP_PROP_FRAME_COUNT))
+            frame_rate   = cap.get(CAP_PROP_FPS)
+            duration     = num_frames/frame_rate
+            minutes      = int(duration/60)
+            seconds      = duration % 60
+            cap.release()
+
+            file_icon  = self.extract_file_icon(file_path)
+
+            file_infos = f"{minutes}m:{round(seconds)}s • {round(frame_rate, 2)} fps • {num_frames} frames • {width}x{height} \n"
+            
+            if self.input_resize_factor != 0 and self.output_resize_factor != 0:
+                input_resized_height = int(height * (self.input_resize_factor/100))
+                input_resized_width  = int(width * (self.input_resize_factor/100))
+
+                output_resized_height = int(input_resized_height * (self.output_resize_factor/100))
+                output_resized_width  = int(input_resized_width * (self.output_resize_factor/100))
+
+                if   "x2" in self.frame_generation_factor: generation_factor = 2
+                elif "x4" in self.frame_generation_factor: generation_factor = 4
+                elif "x8" in self.frame_generation_factor: generation_factor = 8
+
+                if "Slowmotion" in self.frame_generation_factor: slowmotion = True
+                else: slowmotion = False
+
+                if slowmotion:
+                    duration_slowmotion = (num_frames/frame_rate) * generation_factor
+                    minutes_slowmotion  = int(duration_slowmotion/60)
+                    seconds_slowmotion  = duration_slowmotion % 60
+
+                    file_infos += (
+                        f"AI input ({self.input_resize_factor}%) ➜ {input_resized_width}x{input_resized_height} • {round(frame_rate, 2)} fps \n"
+                        f"AI output (x{generation_factor}-slow) ➜ {input_resized_width}x{input_resized_height} • {round(frame_rate, 2)} fps \n"
+                        f"Video out. ({self.output_resize_factor}%) ➜ {minutes_slowmotion}m:{round(seconds_slowmotion)}s • {output_resized_width}x{output_resized_height} • {round(frame_rate, 2)} fps"
+                    )
+                    
+                else:
+                    fps_frame_generated = frame_rate * generation_factor
+
+                    file_infos += (
+                        f"AI input ({self.input_resize_factor}%) ➜ {input_resized_width}x{input_resized_height} • {round(frame_rate, 2)} fps \n"
+                        f"AI output (x{generation_factor}) ➜ {input_resized_width}x{input_resized_height} • {round(fps_frame_generated, 2)} fps \n"
+                        f"Video out. ({self.output_resize_factor}%) ➜ {output_resized_width}x{output_resized_height} • {round(fps_frame_generated, 2)} fps"
+                    )
+
+
+            return file_infos, file_icon
+
+
+
+    # EXTERNAL FUNCTIONS
+
+    def clean_file_list(self) -> None:
+        self.index_row = 1
+        for ui_component in self.ui_components: ui_component.grid_forget()
+
+    def get_selected_file_list(self) -> list: 
+        return self.file_list  
+
+    def set_frame_generation_factor(self, frame_generation_factor) -> None:
+        self.frame_generation_factor = frame_generation_factor
+
+    def set_input_resize_factor(self, input_resize_factor) -> None:
+        self.input_resize_factor = input_resize_factor
+
+    def set_output_resize_factor(self, output_resize_factor) -> None:
+        self.output_resize_factor = output_resize_factor
+ 
+
+
+def get_values_for_file_widget() -> tuple:
+    # Generation factor
+    global selected_generation_option
+
+    # Input resolution %
+    try:
+        input_resize_factor = int(float(str(selected_input_resize_factor.get())))
+    except:
+        input_resize_factor = 0
+
+    # Output resolution %
+    try:
+        output_resize_factor = int(float(str(selected_output_resize_factor.get())))
+    except:
+        output_resize_factor = 0
+
+    return selected_generation_option, input_resize_factor, output_resize_factor
+
+def update_file_widget(a, b, c) -> None:
+    try:
+        global file_widget
+        file_widget
+    except:
+        return
+        
+    generation_option, input_resize_factor, output_resize_factor = get_values_for_file_widget()
+
+    file_widget.clean_file_list()
+    file_widget.set_frame_generation_factor(generation_option)
+    file_widget.set_input_resize_factor(input_resize_factor)
+    file_widget.set_output_resize_factor(output_resize_factor)
+    file_widget._create_widgets()
+
+def create_option_background():
+    return CTkFrame(
+        master   = window,
+        bg_color = background_color,
+        fg_color = widget_background_color,
+        height   = 46,
+        corner_radius = 10
+    )
+
+def create_info_button(
+    command: Callable, 
+    text: str, 
+    width: int = 200
+    ) -> CTkFrame:
+    
+    frame = CTkFrame(master = window, fg_color = widget_background_color, height = 25)
+
+    button = CTkButton(
+        master        = frame,
+        command       = command,
+        font          = bold12,
+        text          = "?",
+        border_color  = "#0096FF",
+        border_width  = 1,
+        fg_color      = widget_background_color,
+        hover_color   = background_color,
+        width         = 23,
+        height        = 15,
+        corner_radius = 1
+    )
+    button.grid(row=0, column=0, padx=(0, 7), pady=2, sticky="w")
+
+    label = CTkLabel(
+        master     = frame,
+        text       = text,
+        width      = width,
+        height     = 22,
+        fg_color   = "transparent",
+        bg_color   = widget_background_color,
+        text_color = text_color,
+        font       = bold13,
+        anchor     = "w"
+    )
+    label.grid(row=0, column=1, sticky="w")
+
+    frame.grid_propagate(False)
+    frame.grid_columnconfigure(1, weight=1)
+
+    return frame
+
+def create_option_menu(
+        command: Callable, 
+        values: list,
+        default_value: str,
+        border_color: str = "#404040", 
+        border_width: int = 1,
+        width: int = 159   
+    ) -> CTkFrame:
+
+    width  = width
+    height = 28
+
+    total_width  = (width + 2 * border_width)
+    total_height = (height + 2 * border_width)
+    
+    frame = CTkFrame(
+        master        = window,
+        fg_color      = border_color,
+        width         = total_width,
+        height        = total_height,
+        border_width  = 0,
+        corner_radius = 1,
+    )
+    
+    option_menu = CTkOptionMenu(
+        master             = frame, 
+        command            = command,
+        values             = values,
+        width              = width,
+        height             = height,
+        corner_radius      = 0,
+        dropdown_font      = bold12,
+        font               = bold11,
+        anchor             = "center",
+        text_color         = text_color,
+        fg_color           = background_color,
+        button_color       = background_color,
+        button_hover_color = background_color,
+        dropdown_fg_color  = background_color
+    )
+    
+    option_menu.place(
+        x = (total_width - width) / 2,
+        y = (total_height - height) / 2
+    )
+    option_menu.set(default_value)
+    return frame
+
+def create_text_box(textvariable: StringVar, width: int) -> CTkEntry:
+    return CTkEntry(
+        master        = window, 
+        textvariable  = textvariable,
+        corner_radius = 1,
+        width         = width,
+        height        = 28,
+        font          = bold11,
+        justify       = "center",
+        text_color    = text_color,
+        fg_color      = "#000000",
+        border_width  = 1,
+        border_color  = "#404040",
+    )
+
+def create_text_box_output_path(textvariable: StringVar) -> CTkEntry:
+    return CTkEntry(
+        master        = window, 
+        textvariable  = textvariable,
+        corner_radius = 1,
+        width         = 250,
+        height        = 28,
+        font          = bold11,
+        justify       = "center",
+        text_color    = text_color,
+        fg_color      = "#000000",
+        border_width  = 1,
+        border_color  = "#404040",
+        state         = DISABLED
+    )
+
+def create_active_button(
+        command: Callable,
+        text: str,
+        icon: CTkImage = None,
+        width: int = 140,
+        height: int = 30,
+        border_color: str = "#0096FF"
+        ) -> CTkButton:
+    
+    return CTkButton(
+        master        = window, 
+        command       = command,
+        text          = text,
+        image         = icon,
+        width         = width,
+        height        = height,
+        font          = bold11,
+        border_width  = 1,
+        corner_radius = 1,
+        fg_color      = "#282828",
+        text_color    = "#E0E0E0",
+        border_color  = border_color
+    )
+
+
+
+
+# Core functions ------------------------
+
+def stop_thread() -> None:
+    stop = 1 + "x"
+
+def check_frame_generation_steps() -> None:
+    sleep(1)
+
+    try:
+        while True:
+            actual_step = read_process_status()
+
+            if actual_step == COMPLETED_STATUS:
+                info_message.set(f"All files completed! :)")
+                stop_thread()
+
+            elif actual_step == STOP_STATUS:
+                info_message.set(f"Generation stopped")
+                stop_thread()
+
+            elif ERROR_STATUS in actual_step:
+                error_message = f"Error while generating :("
+                error = actual_step.replace(ERROR_STATUS, "")
+                info_message.set(error_message)
+                show_error_message(error)
+                stop_thread()
+
+            else:
+                info_message.set(actual_step)
+
+            sleep(1)
+    except:
+        place_generation_button()
+
+def read_process_status() -> None:
+    return process_status_q.get()
+
+def start_frame_generation_worker() -> None:
+    global process_frame_generation_worker
+
+    # The worker keeps the AI model loaded between generations, restarted only if it is not alive
+    try:
+        if process_frame_generation_worker.is_alive(): return
+    except:
+        pass
+
+    process_frame_generation_worker = Process(
+        target = frame_generation_worker,
+        args   = (frame_generation_command_q, process_status_q, frame_generation_stop_event),
+        daemon = True
+    )
+    process_frame_generation_worker.start()
+
+def stop_generation_process() -> None:
+    global process_frame_generation_worker
+
+    try:
+        process_frame_generation_worker
+    except:
+        pass
+    else:
+        frame_generation_stop_event.set()
+        frame_generation_command_q.put(None)
+        process_frame_generation_worker.join(timeout = 5)
+        if process_frame_generation_worker.is_alive():
+            process_frame_generation_worker.terminate()
+            process_frame_generation_worker.join()
+
+def stop_button_command() -> None:
+    # The worker stops at the next frame pair and writes the STOP status, the AI model stays loaded
+    frame_generation_stop_event.set()
+    if not process_frame_generation_worker.is_alive():
+        write_process_status(process_status_q, f"{STOP_STATUS}")
+
+def generate_button_command() -> None: 
+    global selected_file_list
+    global selected_AI_model
+    global selected_AI_precision
+    global selected_generation_option
+    global selected_gpu
+    global selected_image_extension
+    global selected_video_extension
+    global selected_keep_frames
+    global selected_video_codec
+    global selected_frames_pipeline
+    global input_resize_factor
+    global output_resize_factor
+
+    if user_input_checks():
+        info_message.set("Loading")
+
+        cpu_number = int(os_cpu_count()/2)
+
+        print("=" * 50)
+        print(f"> Starting frame generation:")
+        print(f"   Files to process: {len(selected_file_list)}")
+        print(f"   Output path: {(selected_output_path.get())}")
+        print(f"   Selected AI model: {selected_AI_model}")
+        print(f"   Selected AI precision: {selected_AI_precision}")
+        print(f"   Selected device: {selected_gpu}")
+        print(f"   Selected frame generation option: {selected_generation_option}")
+        print(f"   Selected image output extension: {selected_image_extension}")
+        print(f"   Selected video output extension: {selected_video_extension}")
+        print(f"   Selected video output codec: {selected_video_codec}")
+        print(f"   Input resize factor: {int(input_resize_factor * 100)}%")
+        print(f"   Output resize factor: {int(output_resize_factor * 100)}%")
+        print(f"   Cpu number: {cpu_number}")
+        print(f"   Save frames: {selected_keep_frames}")
+        print(f"   Frames pipeline: {selected_frames_pipeline}")
+        print("=" * 50)
+
+        place_stop_button()
+
+        start_frame_generation_worker()
+        frame_generation_stop_event.clear()
+        frame_generation_command_q.put(
+            (
+                selected_file_list, 
+                selected_output_path.get(),
+                selected_AI_model,
+                selected_AI_precision,
+                selected_gpu,
+                selected_generation_option, 
+                selected_image_extension, 
+                selected_video_extension, 
+                selected_video_codec,
+                input_resize_factor,
+                output_resize_factor, 
+                cpu_number, 
+                selected_keep_frames,
+                selected_frames_pipeline
+            )
+        )
+
+        thread_wait = Thread(target = check_frame_generation_steps)
+        thread_wait.start()
+
+
+
+
+
+# GUI utils function ---------------------------
+
+def opengithub() -> None:   
+    open_browser(githubme, new=1)
+
+def opentelegram() -> None: 
+    open_browser(telegramme, new=1)
+
+def user_input_checks() -> None:
+    global selected_file_list
+    global selected_generation_option
+    global selected_image_extension
+    global input_resize_factor
+    global output_resize_factor
+
+    is_ready = True
+
+    # Selected files 
+    try: selected_file_list = file_widget.get_selected_file_list()
+    except:
+        info_message.set("No file selected. Please select a file")
+        is_ready = False
+
+    if len(selected_file_list) <= 0:
+        info_message.set("No file selected. Please select a file")
+        is_ready = False
+
+    # Input resize factor 
+    try: input_resize_factor = int(float(str(selected_input_resize_factor.get())))
+    except:
+        info_message.set("Input resolution % must be a number")
+        return False
+
+    if input_resize_factor > 0: input_resize_factor = input_resize_factor/100
+    else:
+        info_message.set("Input resolution % must be a value > 0")
+        return False
+
+
+    # Output resize factor 
+    try: output_resize_factor = int(float(str(selected_output_resize_factor.get())))
+    except:
+        info_message.set("Output resolution % must be a number")
+        return False
+
+    if output_resize_factor > 0: output_resize_factor = output_resize_factor/100
+    else:
+        info_message.set("Output resolution % must be a value > 0")
+        return False
+
+    return is_ready
+
+def check_if_file_is_video(file: str) -> bool:
+    return any(video_extension in file for video_extension in supported_video_extensions)
+
+def check_supported_selected_files(uploaded_file_list: list) -> list:
+    return [file for file in uploaded_file_list if any(supported_extension in file for supported_extension in supported_file_extensions)]
+
+def show_error_message(exception: str) -> None:
+    messageBox_title    = "Frame generation error"
+    messageBox_subtitle = "Please report the error on Github or Telegram"
+    messageBox_text     = f"\n {str(exception)} \n"
+
+    MessageBox(
+        messageType   = "error",
+        title         = messageBox_title,
+        subtitle      = messageBox_subtitle,
+        default_value = None,
+        option_list   = [messageBox_text]
+    )
+
+def open_files_action() -> None:
+    info_message.set("Selecting files")
+
+    uploaded_files_list    = list(filedialog.askopenfilenames())
+    uploaded_files_counter = len(uploaded_files_list)
+
+    supported_files_list    = check_supported_selected_files(uploaded_files_list)
+    supported_files_counter = len(supported_files_list)
+    
+    print("> Uploaded files: " + str(uploaded_files_counter) + " => Supported files: " + str(supported_files_counter))
+
+    if supported_files_counter > 0:
+        global file_widget
+
+        generation_option, input_resize_factor, output_resize_factor = get_values_for_file_widget()
+
+        file_widget = FileWidget(
+            master                  = window, 
+            selected_file_list      = supported_files_list,
+            frame_generation_factor = generation_option,
+            input_resize_factor     = input_resize_factor,
+            output_resize_factor    = output_resize_factor,
+            fg_color                = background_color, 
+            bg_color                = background_color
+        )
+        file_widget.place(relx = 0.0, rely = 0.0, relwidth = 0.5, relheight = 1.0)
+        info_message.set("Ready")
+
+    else: 
+        info_message.set("Not supported files :(")
+
+def open_output_path_action() -> None:
+    asked_selected_output_path = filedialog.askdirectory()
+    if asked_selected_output_path == "":
+        selected_output_path.set(OUTPUT_PATH_CODED)
+    else:
+        selected_output_path.set(asked_selected_output_path)
+
+
+
+
+# GUI select from menus functions ---------------------------
+
+def select_AI_from_menu(selected_option: str) -> None:
+    global selected_AI_model    
+    selected_AI_model = selected_option
+
+def select_AI_precision_from_menu(selected_option: str) -> None:
+    global selected_AI_precision    
+    selected_AI_precision = selected_option
+
+def select_framegeneration_option_from_menu(selected_option: str):
+    global selected_generation_option    
+    selected_generation_option = selected_option
+    update_file_widget(1,2,3)
+
+def select_gpu_from_menu(selected_option: str) -> None:
+    global selected_gpu    
+    selected_gpu = selected_option
+
+def select_save_frame_from_menu(selected_option: str):
+    global selected_keep_frames
+    if   selected_option == "ON":  selected_keep_frames = True
+    elif selected_option == "OFF": selected_keep_frames = False
+
+def select_frames_pipeline_from_menu(selected_option: str) -> None:
+    global selected_frames_pipeline
+    selected_frames_pipeline = selected_option
+
+def select_image_extension_from_menu(selected_option: str) -> None:
+    global selected_image_extension   
+    selected_image_extension = selected_option
+
+def select_video_extension_from_menu(selected_option: str) -> None:
+    global selected_video_extension   
+    selected_video_extension = selected_option
+
+def select_video_codec_from_menu(selected_option: str) -> None:
+    global selected_video_codec
+    selected_video_codec = selected_option
+
+
+
+
+# GUI place functions ---------------------------
+
+def place_github_button():
+    
+    def opengithub() -> None: open_browser(githubme, new=1)
+
+    git_button = CTkButton(
+        master        = window,
+        command       = opengithub,
+        image         = logo_git,
+        width         = 32,
+        height        = 32,
+        border_width  = 1,
+        fg_color      = "transparent",
+        text_color    = text_color,
+        border_color  = "#404040",
+        anchor        = "center",
+        text          = "", 
+        font          = bold11,
+        corner_radius = 1
+    )
+    
+    git_button.place(relx = column_2 + 0.1, rely = 0.04, anchor = "center")
+
+def place_telegram_button():
+
+    def opentelegram() -> None: open_browser(telegramme, new=1)
+
+    telegram_button = CTkButton(
+        master        = window,
+        command       = opentelegram,
+        image         = logo_telegram,
+        width         = 32,
+        height        = 32,
+        border_width  = 1,
+        fg_color      = "transparent",
+        text_color    = text_color,
+        border_color  = "#404040",
+        anchor        = "center",
+        text          = "", 
+        font          = bold11,
+        corner_radius = 1
+    )
+
+    telegram_button.place(relx = column_2 + 0.055, rely = 0.04, anchor = "center")
+ 
+def place_loadFile_section():
+    background = CTkFrame(master = window, fg_color = background_color, corner_radius = 1)
+
+    text_drop = (" SUPPORTED FILES \n\n "
+               + "IMAGES • jpg png tif bmp webp heic \n " 
+               + "VIDEOS • mp4 webm mkv flv gif avi mov mpg qt 3gp ")
+
+    input_file_text = CTkLabel(
+        master     = window, 
+        text       = text_drop,
+        fg_color   = background_color,
+        bg_color   = background_color,
+        text_color = text_color,
+        width      = 300,
+        height     = 150,
+        font       = bold13,
+        anchor     = "center"
+    )
+    
+    input_file_button = CTkButton(
+        master       = window,
+        command      = open_files_action, 
+        text         = "SELECT FILES",
+        width        = 140,
+        height       = 30,
+        font         = bold12,
+        border_width  = 1,
+        corner_radius = 1,
+        fg_color      = "#282828",
+        text_color    = "#E0E0E0",
+        border_color  = "#0096FF"
+    )
+    
+    background.place(relx = 0.0, rely = 0.0, relwidth = 0.5, relheight = 1.0)
+    input_file_text.place(relx = 0.25, rely = 0.4,  anchor = "center")
+    input_file_button.place(relx = 0.25, rely = 0.5, anchor = "center")
+
+def place_app_name():
+    background = CTkFrame(master = window, fg_color = background_color, corner_radius = 1)
+    app_name_label = CTkLabel(
+        master     = window, 
+        text       = app_name + " " + version,
+        fg_color   = background_color, 
+        text_color = app_name_color,
+        font       = bold20,
+        anchor     = "w"
+    )
+    background.place(relx = 0.5, rely = 0.0, relwidth = 0.5, relheight = 1.0)
+    app_name_label.place(relx = column_1 - 0.05, rely = 0.04, anchor = "center")
+
+def place_AI_menu():
+
+    def open_info_AI_model():
+        option_list = [
+            "\n RIFE\n" + 
+            "   • The complete RIFE AI model\n" + 
+            "   • Excellent frame generation quality\n" + 
+            "   • Recommended GPUs with VRAM >= 4GB\n",
+
+            "\n RIFE Lite\n" + 
+            "   • Lightweight version of RIFE AI model\n" +
+            "   • High frame generation quality\n" +
+            "   • 10% faster than full model\n" + 
+            "   • Use less GPU VRAM memory\n" +
+            "   • Recommended for GPUs with VRAM < 4GB \n",
+        ]
+
+        MessageBox(
+            messageType   = "info",
+            title         = "AI model",
+            subtitle      = "This widget allows to choose between different AI models for upscaling",
+            default_value = None,
+            option_list   = option_list
+        )
+
+
+    widget_row = row1
+    background = create_option_background()
+    background.place(relx = 0.75, rely = widget_row, relwidth = 0.48, anchor = "center")
+    
+    info_button = create_info_button(open_info_AI_model, "AI model")
+    option_menu = create_option_menu(select_AI_from_menu, AI_models_list, default_AI_model)
+
+    info_button.place(relx = column_info1, rely = widget_row - 0.003, anchor = "center")
+    option_menu.place(relx = column_3_5,   rely = widget_row,         anchor = "center")
+
+def place_generation_option_menu():
+
+    def open_info_frame_generation_option():
+        option_list = [
+            "\n FRAME GENERATION\n" + 
+            "   • x2 - doubles video framerate • 30fps => 60fps\n" + 
+            "   • x4 - quadruples video framerate • 30fps => 120fps\n" + 
+            "   • x8 - octuplicate video framerate • 30fps => 240fps\n",
+
+            "\n SLOWMOTION (no audio)\n" + 
+            "   • Slowmotion x2 - slowmotion effect by a factor of 2\n" +
+            "   • Slowmotion x4 - slowmotion effect by a factor of 4\n" +
+            "   • Slowmotion x8 - slowmotion effect by a factor of 8\n"
+        ]
+        
+        MessageBox(
+            messageType   = "info",
+            title         = "AI frame generation", 
+            subtitle      = " This widget allows to choose between different AI frame generation option",
+            default_value = None,
+            option_list   = option_list
+        )
+
+    
+    widget_row  = row2
+    background = create_option_background()
+    background.place(relx = 0.75, rely = widget_row, relwidth = 0.48, anchor = "center")
+
+    info_button = create_info_button(open_info_frame_generation_option, "AI frame generation")
+    option_menu = create_option_menu(select_framegeneration_option_from_menu, generation_options_list, default_generation_option)
+
+    info_button.place(relx = column_info1, rely = widget_row - 0.003, anchor = "center")
+    option_menu.place(relx = column_3_5,   rely = widget_row,         anchor = "center")
+
+def place_input_output_resolution_textboxs():
+
+    def open_info_input_resolution():
+        option_list = [
+            " A high value (>70%) will create high quality photos/videos but will be slower",
+            " While a low value (<40%) will create good quality photos/videos but will much faster",
+
+            " \n For example, for a 1080p (1920x1080) image/video\n" + 
+            " • Input resolution 25% => input to AI 270p (480x270)\n" +
+            " • Input resolution 50% => input to AI 540p (960x540)\n" + 
+            " • Input resolution 75% => input to AI 810p (1440x810)\n" + 
+            " • Input resolution 100% => input to AI 1080p (1920x1080) \n",
+        ]
+
+        MessageBox(
+            messageType   = "info",
+            title         = "Input resolution %",
+            subtitle      = "This widget allows to choose the resolution input to the AI",
+            default_value = None,
+            option_list   = option_list
+        )
+
+    def open_info_output_resolution():
+        option_list = [
+            " TBD ",
+        ]
+
+        MessageBox(
+            messageType   = "info",
+            title         = "Output resolution %",
+            subtitle      = "This widget allows to choose upscaled files resolution",
+            default_value = None,
+            option_list   = option_list
+        )
+
+
+    widget_row = row3
+    background = create_option_background()
+    background.place(relx = 0.75, rely = widget_row, relwidth = 0.48, anchor = "center")
+
+    # Input resolution %
+    info_button = create_info_button(open_info_input_resolution, "Input resolution")
+    option_menu = create_text_box(selected_input_resize_factor, width = little_textbox_width) 
+
+    info_button.place(relx = column_info1, rely = widget_row - 0.003, anchor = "center")
+    option_menu.place(relx = column_1_5,   rely = widget_row,         anchor = "center")
+
+    # Output resolution %
+    info_button = create_info_button(open_info_output_resolution, "Output resolution")
+    option_menu = create_text_box(selected_output_resize_factor, width = little_textbox_width)  
+
+    info_button.place(relx = column_info2, rely = widget_row - 0.003, anchor = "center")
+    option_menu.place(relx = column_3,     rely = widget_row,         anchor = "center")
+
+def place_gpu_menu():
+
+    def open_info_gpu():
+        option_list = [
+            "\n It is possible to select up to 4 GPUs for AI processing\n" +
+            "  • Auto (the app will select the most powerful GPU)\n" + 
+            "  • GPU 1 (GPU 0 in Task manager)\n" + 
+            "  • GPU 2 (GPU 1 in Task manager)\n" + 
+            "  • GPU 3 (GPU 2 in Task manager)\n" + 
+            "  • GPU 4 (GPU 3 in Task manager)\n",
+
+            "\n It is also possible to run the AI on the CPU\n" +
+            "  • CPU (one thread per core, best for a single job)\n" + 
+            "  • CPU Parallel (parallel execution of independent operators)\n" + 
+            "  • CPU Low RAM (fewer threads, no memory arena, lowest memory usage)\n",
+
+            "\n NOTES\n" +
+            "  • Keep in mind that the more powerful the chosen gpu is, the faster the upscaling will be\n" +
+            "  • For optimal performance, it is essential to regularly update your GPUs drivers\n" +
+            "  • Selecting a GPU not present in the PC will cause the app to use the CPU for AI processing\n" +
+            "  • Batch size, memory budget, model stride, shape buckets, threads, execution mode,\n" +
+            "    graph optimization, memory arena and memory pattern\n" +
+            "    of each profile can be tuned in the 'default_device_profiles' preference entry\n"
+        ]
+
+        MessageBox(
+            messageType   = "info",
+            title         = "GPU",
+            subtitle      = "This widget allows to select the GPU for AI upscale",
+            default_value = None,
+            option_list   = option_list
+        )
+
+
+    def open_info_AI_precision():
+        option_list = [
+            "\n FP32\n" + 
+            "   • Original AI model precision\n" + 
+            "   • Best frame generation quality\n",
+
+            "\n FP16\n" + 
+            "   • Half precision AI model\n" + 
+            "   • Faster and lighter on GPUs\n",
+
+            "\n INT8 dynamic / INT8 static\n" + 
+            "   • Quantized AI model, fastest on CPU\n" + 
+            "   • Static quantization is calibrated on the frames of the first video\n",
+
+            "\n NOTES\n" +
+            "  • FP16 and INT8 models are created automatically the first time they are selected\n" +
+            f"  • Before being used, every model is compared with FP32 (PSNR >= {AI_PRECISION_MIN_PSNR}, SSIM >= {AI_PRECISION_MIN_SSIM})\n" +
+            "  • Models not accurate enough are discarded and FP32 is used\n"
+        ]
+
+        MessageBox(
+            messageType   = "info",
+            title         = "AI precision",
+            subtitle      = "This widget allows to choose the numeric precision of the AI model",
+            default_value = None,
+            option_list   = option_list
+        )
+
+
+    widget_row = row4
+
+    background  = create_option_background()
+    background.place(relx = 0.75, rely = widget_row, relwidth = 0.48, anchor = "center")
+
+    # GPU
+    info_button = create_info_button(open_info_gpu, "GPU")
+    option_menu = create_option_menu(select_gpu_from_menu, gpus_list, default_gpu, width = little_menu_width) 
+
+    info_button.place(relx = column_info1,        rely = widget_row - 0.003, anchor = "center")
+    option_menu.place(relx = column_1_4, rely = widget_row,  anchor = "center")
+
+    # AI precision
+    info_button = create_info_button(open_info_AI_precision, "AI precision")
+    option_menu = create_option_menu(select_AI_precision_from_menu, AI_precision_list, default_AI_precision, width = little_menu_width) 
+
+    info_button.place(relx = column_info2, rely = widget_row - 0.003, anchor = "center")
+    option_menu.place(relx = column_2_9,   rely = widget_row,         anchor = "center")
+
+def place_image_video_output_menus():
+
+    def open_info_image_output():
+        option_list = [
+            " \n PNG\n"
+            " • Very good quality\n"
+            " • Slow and heavy file\n"
+            " • Supports transparent images\n"
+            " • Lossless compression (no quality loss)\n"
+            " • Ideal for graphics, web images, and screenshots\n",
+
+            " \n JPG\n"
+            " • Good quality\n"
+            " • Fast and lightweight file\n"
+            " • Lossy compression (some quality loss)\n"
+            " • Ideal for photos and web images\n"
+            " • Does not support transparency\n",
+
+            " \n BMP\n"
+            " • Highest quality\n"
+            " • Slow and heavy file\n"
+            " • Uncompressed format (large file size)\n"
+            " • Ideal for raw images and high-detail graphics\n"
+            " • Does not support transparency\n",
+
+            " \n TIFF\n"
+            " • Highest quality\n"
+            " • Very slow and heavy file\n"
+            " • Supports both lossless and lossy compression\n"
+            " • Often used in professional photography and printing\n"
+            " • Supports multiple layers and transparency\n",
+        ]
+
+
+        MessageBox(
+            messageType   = "info",
+            title         = "Image output",
+            subtitle      = "This widget allows to choose the extension of upscaled images",
+            default_value = None,
+            option_list   = option_list
+        )
+
+    def open_info_video_extension():
+        option_list = [
+            " \n MP4\n"
+            " • Most widely supported format\n"
+            " • Good quality with efficient compression\n"
+            " • Fast and lightweight file\n"
+            " • Ideal for streaming and general use\n",
+
+            " \n MKV\n"
+            " • High-quality format with multiple audio and subtitle tracks support\n"
+            " • Larger file size compared to MP4\n"
+            " • Supports almost any codec\n"
+            " • Ideal for high-quality videos and archiving\n",
+
+            " \n AVI\n"
+            " • Older format with high compatibility\n"
+            " • Larger file size due to less efficient compression\n"
+            " • Supports multiple codecs but lacks modern features\n"
+            " • Ideal for older devices and raw video storage\n",
+
+            " \n MOV\n"
+            " • High-quality format developed by Apple\n"
+            " • Large file size due to less compression\n"
+            " • Best suited for editing and high-quality playback\n"
+            " • Compatible mainly with macOS and iOS devices\n",
+        ]
+
+        MessageBox(
+            messageType   = "info",
+            title         = "Video output",
+            subtitle      = "This widget allows to choose the extension of the upscaled video",
+            default_value = None,
+            option_list   = option_list
+        )
+
+    widget_row = row5
+
+    background = create_option_background()
+    background.place(relx = 0.75, rely = widget_row, relwidth = 0.48, anchor = "center")
+
+    # Image output
+    info_button = create_info_button(open_info_image_output, "Image output")
+    option_menu = create_option_menu(select_image_extension_from_menu, image_extension_list, default_image_extension, width = little_menu_width)
+    info_button.place(relx = column_info1,        rely = widget_row - 0.003, anchor = "center")
+    option_menu.place(relx = column_1_4, rely = widget_row,         anchor = "center")
+
+    # Video output
+    info_button = create_info_button(open_info_video_extension, "Video output")
+    option_menu = create_option_menu(select_video_extension_from_menu, video_extension_list, default_video_extension, width = little_menu_width)
+    info_button.place(relx = column_info2,      rely = widget_row - 0.003, anchor = "center")
+    option_menu.place(relx = column_2_9, rely = widget_row,         anchor = "center")
+
+def place_video_codec_keep_frames_menus():
+
+    def open_info_video_codec():
+        option_list = [
+            " \n SOFTWARE ENCODING (CPU)\n"
+            " • x264 | H.264 software encoding\n"
+            " • x265 | HEVC (H.265) software encoding\n",
+
+            " \n NVIDIA GPU ENCODING (NVENC - Optimized for NVIDIA GPU)\n"
+            " • h264_nvenc | H.264 hardware encoding\n"
+            " • hevc_nvenc | HEVC (H.265) hardware encoding\n",
+
+            " \n AMD GPU ENCODING (AMF - Optimized for AMD GPU)\n"
+            " • h264_amf | H.264 hardware encoding\n"
+            " • hevc_amf | HEVC (H.265) hardware encoding\n",
+
+            " \n INTEL GPU ENCODING (QSV - Optimized for Intel GPU)\n"
+            " • h264_qsv | H.264 hardware encoding\n"
+            " • hevc_qsv | HEVC (H.265) hardware encoding\n"
+        ]
+
+
+        MessageBox(
+            messageType   = "info",
+            title         = "Video codec",
+            subtitle      = "This widget allows to choose video codec for upscaled video",
+            default_value = None,
+            option_list   = option_list
+        )
+
+    def open_info_keep_frames():
+        option_list = [
+            "\n ON \n" + 
+            " The app does NOT delete the video frames after creating the upscaled video \n" + 
+            " Frames keep the AI resolution, the output resolution is applied only to the video \n",
+
+            "\n OFF \n" + 
+            " The app deletes the video frames after creating the upscaled video \n"
+        ]
+
+        MessageBox(
+            messageType   = "info",
+            title         = "Keep video frames",
+            subtitle      = "This widget allows to choose to keep video frames",
+            default_value = None,
+            option_list   = option_list
+        )
+
+
+    widget_row = row6
+
+    background = create_option_background()
+    background.place(relx = 0.75, rely = widget_row, relwidth = 0.48, anchor = "center")
+
+    # Video codec
+    info_button = create_info_button(open_info_video_codec, "Video codec")
+    option_menu = create_option_menu(select_video_codec_from_menu, video_codec_list, default_video_codec, width = little_menu_width)
+    info_button.place(relx = column_info1,        rely = widget_row - 0.003, anchor = "center")
+    option_menu.place(relx = column_1_4, rely = widget_row,         anchor = "center")
+
+    # Keep frames
+    info_button = create_info_button(open_info_keep_frames, "Keep frames")
+    option_menu = create_option_menu(select_save_frame_from_menu, keep_frames_list, default_keep_frames, width = little_menu_width)
+    info_button.place(relx = column_info2,      rely = widget_row - 0.003, anchor = "center")
+    option_menu.place(relx = column_2_9, rely = widget_row,         anchor = "center")
+
+def place_frames_pipeline_menu():
+
+    def open_info_frames_pipeline():
+        option_list = [
+            "\n FRAMES ON DISK\n" + 
+            "   • Video frames are extracted and generated as image files\n" + 
+            "   • Interrupted frame generation can be resumed\n" + 
+            "   • Video frames can be kept (see Keep frames)\n",
+
+            "\n FRAME STORE\n" + 
+            "   • All video frames are kept in a single raw file instead of thousands of image files\n" + 
+            "   • Interrupted frame generation can be resumed\n" + 
+            "   • With Keep frames ON, frames are exported as image files at the end\n",
+
+            "\n FRAME CACHE\n" + 
+            "   • Video frames stay in RAM, up to the budget of the 'default_frame_cache' preference entry\n" + 
+            "   • Over the budget, frames are spilled to disk (short videos never touch the disk)\n" + 
+            "   • It can not be resumed, with Keep frames ON frames are exported as image files at the end\n",
+
+            "\n STREAMING\n" + 
+            "   • Video frames flow from the decoder to the AI and to the encoder in memory\n" +
+            "   • No image files are written, only the final video touches the disk\n" +
+            "   • Faster and uses no disk space, but it can not be resumed\n",
+        ]
+
+        MessageBox(
+            messageType   = "info",
+            title         = "Frames pipeline",
+            subtitle      = "This widget allows to choose how video frames move between decoding, AI and encoding",
+            default_value = None,
+            option_list   = option_list
+        )
+
+
+    widget_row = row7
+    background = create_option_background()
+    background.place(relx = 0.75, rely = widget_row, relwidth = 0.48, anchor = "center")
+    
+    info_button = create_info_button(open_info_frames_pipeline, "Frames pipeline")
+    option_menu = create_option_menu(select_frames_pipeline_from_menu, frames_pipeline_list, default_frames_pipeline)
+
+    info_button.place(relx = column_info1, rely = widget_row - 0.003, anchor = "center")
+    option_menu.place(relx = column_3_5,   rely = widget_row,         anchor = "center")
+
+def place_output_path_textbox():
+
+    def open_info_output_path():
+        option_list = [
+              "\n The default path is defined by the input files."
+            + "\n For example: selecting a file from the Download folder,"
+            + "\n the app will save upscaled files in the Download folder \n",
+
+            " Otherwise it is possible to select the desired path using the SELECT button",
+        ]
+
+        MessageBox(
+            messageType   = "info",
+            title         = "Output path",
+            subtitle      = "This widget allows to choose upscaled files path",
+            default_value = None,
+            option_list   = option_list
+        )
+
+    background    = create_option_background()
+    info_button   = create_info_button(open_info_output_path, "Output path")
+    option_menu   = create_text_box_output_path(selected_output_path) 
+    active_button = create_active_button(command = open_output_path_action, text = "SELECT", width = 60, height = 25)
+  
+    background.place(   relx = 0.75,                 rely = row10, relwidth = 0.48, anchor = "center")
+    info_button.place(  relx = column_info1,         rely = row10 - 0.003,           anchor = "center")
+    active_button.place(relx = column_info1 + 0.052, rely = row10,                   anchor = "center")
+    option_menu.place(  relx = column_2 - 0.008,     rely = row10,                   anchor = "center")
+
+def place_message_label():
+    message_label = CTkLabel(
+        master        = window, 
+        textvariable  = info_message,
+        height        = 26,
+        width         = 220,
+        font          = bold11,
+        fg_color      = "#ffbf00",
+        text_color    = "#000000",
+        anchor        = "center",
+        corner_radius = 1
+    )
+    message_label.place(relx = 0.84, rely = 0.9495, anchor = "center")
+
+def place_stop_button(): 
+    stop_button = create_active_button(
+        command      = stop_button_command,
+        text         = "STOP",
+        icon         = stop_icon,
+        width        = 140,
+        height       = 30,
+        border_color = "#EC1D1D"
+    )
+    stop_button.place(relx = 0.75 - 0.1, rely = 0.95, anchor = "center")
+
+def place_generation_button(): 
+    generation_button = create_active_button(
+        command = generate_button_command,
+        text    = "GENERATE",
+        icon    = play_icon,
+        width   = 140,
+        height  = 30
+    )
+    generation_button.place(relx = 0.75 - 0.1, rely = 0.95, anchor = "center")
+
+
+
+
+# Main functions ---------------------------
+
+def on_app_close():
+    window.grab_release()
+    window.destroy()
+
+    global selected_AI_model
+    global selected_generation_option
+    global selected_gpu
+    
+    global selected_keep_frames
+    global selected_image_extension
+    global selected_video_extension
+    global resize_factor
+    global cpu_number
+
+    generation_option_to_save = f"{selected_generation_option}"
+    gpu_to_save               = f"{selected_gpu}"
+    keep_frames_to_save       = "Enabled" if selected_keep_frames == True else "Disabled"
+    image_extension_to_save   = f"{selected_image_extension}"
+    video_extension_to_save   = f"{selected_video_extension}"
+
+    AI_model_to_save          = f"{selected_AI_model}"
+    AI_precision_to_save      = f"{selected_AI_precision}"
+    generation_option_to_save = f"{selected_generation_option}"
+    gpu_to_save               = selected_gpu
+    image_extension_to_save   = selected_image_extension
+    video_extension_to_save   = selected_video_extension
+    video_codec_to_save       = selected_video_codec
+    frames_pipeline_to_save   = selected_frames_pipeline
+
+    if selected_keep_frames == True:
+        keep_frames_to_save = "ON"
+    else:
+        keep_frames_to_save = "OFF"
+
+    user_preference = {
+        "default_AI_model":             AI_model_to_save,
+        "default_AI_precision":         AI_precision_to_save,
+        "default_generation_option":    generation_option_to_save,
+        "default_gpu":                  gpu_to_save,
+        "default_keep_frames":          keep_frames_to_save,
+        "default_frames_pipeline":      frames_pipeline_to_save,
+        "default_image_extension":      image_extension_to_save,
+        "default_video_extension":      video_extension_to_save,
+        "default_video_codec":          video_codec_to_save,
+        "default_output_path":          selected_output_path.get(),
+        "default_input_resize_factor":  str(selected_input_resize_factor.get()),
+        "default_output_resize_factor": str(selected_output_resize_factor.get()),
+        "default_device_profiles":      get_user_preference().get("default_device_profiles", {}),
+        "default_frame_cache":          get_user_preference().get("default_frame_cache",     {}),
+    }
+    user_preference_json = json_dumps(user_preference)
+    with open(USER_PREFERENCE_PATH, "w") as preference_file:
+        preference_file.write(user_preference_json)
+
+    stop_generation_process()
+
+class App():
+    def __init__(self, window):
+        self.toplevel_window = None
+        window.protocol("WM_DELETE_WINDOW", on_app_close)
+
+        window.title('')
+        window.geometry("1000x675")
+        window.resizable(False, False)
+        window.iconbitmap(find_by_relative_path("Assets" + os_separator + "logo.ico"))
+
+        place_loadFile_section()
+
+        place_app_name()
+        place_output_path_textbox()
+        place_github_button()
+        place_telegram_button()
+
+        place_AI_menu()
+        place_generation_option_menu()
+        place_input_output_resolution_textboxs()
+
+        place_gpu_menu()
+        place_video_codec_keep_frames_menus()
+        place_frames_pipeline_menu()
+
+        place_image_video_output_menus()
+
+        place_message_label()
+        place_generation_button()
+
+def load_user_preference() -> None:
+    global default_AI_model
+    global default_AI_precision
+    global default_generation_option
+    global default_gpu
+    global default_keep_frames
+    global default_frames_pipeline
+    global default_image_extension
+    global default_video_extension
+    global default_video_codec
+    global default_output_path
+    global default_input_resize_factor
+    global default_output_resize_factor
+
+    user_preference = get_user_preference()
+
+    default_AI_model             = user_preference.get("default_AI_model",             AI_models_list[0])
+    default_AI_precision         = user_preference.get("default_AI_precision",         AI_precision_list[0])
+    default_generation_option    = user_preference.get("default_generation_option",    generation_options_list[0])
+    default_gpu                  = user_preference.get("default_gpu",                  gpus_list[0])
+    default_keep_frames          = user_preference.get("default_keep_frames",          keep_frames_list[0])
+    default_frames_pipeline      = user_preference.get("default_frames_pipeline",      frames_pipeline_list[0])
+    default_image_extension      = user_preference.get("default_image_extension",      image_extension_list[0])
+    default_video_extension      = user_preference.get("default_video_extension",      video_extension_list[0])
+    default_video_codec          = user_preference.get("default_video_codec",          video_codec_list[0])
+    default_output_path          = user_preference.get("default_output_path",          OUTPUT_PATH_CODED)
+    default_input_resize_factor  = user_preference.get("default_input_resize_factor",  str(50))
+    default_output_resize_factor = user_preference.get("default_output_resize_factor", str(100))
+
+def main() -> None:
+    global process_status_q
+    global frame_generation_command_q
+    global frame_generation_stop_event
+    global window
+    global info_message
+    global selected_output_path
+    global selected_input_resize_factor
+    global selected_output_resize_factor
+
+    global selected_file_list
+    global selected_AI_model
+    global selected_AI_precision
+    global selected_generation_option
+    global selected_gpu 
+    global selected_keep_frames
+    global selected_image_extension
+    global selected_video_extension
+    global selected_video_codec
+    global selected_frames_pipeline
+
+    global bold8, bold9, bold10, bold11, bold12, bold13, bold14, bold16
+    global bold17, bold18, bold19, bold20, bold21, bold22, bold23, bold24
+    global logo_git, logo_telegram, stop_icon, play_icon, clear_icon, info_icon
+
+    if os_path_exists(FFMPEG_EXE_PATH): 
+        print(f"[{app_name}] ffmpeg.exe found")
+    else:
+        print(f"[{app_name}] ffmpeg.exe not found, please install ffmpeg.exe following the guide")
+
+    load_user_preference()
+
+    process_status_q            = multiprocessing_Queue(maxsize=1)
+    frame_generation_command_q  = multiprocessing_Queue()
+    frame_generation_stop_event = multiprocessing_Event()
+    start_frame_generation_worker()
+
+    set_appearance_mode("Dark")
+    set_default_color_theme("dark-blue")
+
+    window = CTk() 
+
+    info_message                  = StringVar()
+    selected_output_path          = StringVar()
+    selected_input_resize_factor  = StringVar()
+    selected_output_resize_factor = StringVar()
+
+    selected_file_list = []
+
+    selected_AI_model          = default_AI_model
+    selected_AI_precision      = default_AI_precision
+    selected_generation_option = default_generation_option
+    selected_gpu               = default_gpu
+    selected_image_extension   = default_image_extension
+    selected_video_extension   = default_video_extension
+    selected_video_codec       = default_video_codec
+    selected_frames_pipeline   = default_frames_pipeline
+
+    if default_keep_frames == "ON": selected_keep_frames = True
+    else:                           selected_keep_frames = False
+
+    selected_input_resize_factor.set(default_input_resize_factor)
+    selected_output_resize_factor.set(default_output_resize_factor)
+    selected_output_path.set(default_output_path)
+
+    info_message.set("Hi :)")
+    selected_input_resize_factor.trace_add('write', update_file_widget)
+    selected_output_resize_factor.trace_add('write', update_file_widget)
+
+    font   = "Segoe UI"    
+    bold8  = CTkFont(family = font, size = 8, weight = "bold")
+    bold9  = CTkFont(family = font, size = 9, weight = "bold")
+    bold10 = CTkFont(family = font, size = 10, weight = "bold")
+    bold11 = CTkFont(family = font, size = 11, weight = "bold")
+    bold12 = CTkFont(family = font, size = 12, weight = "bold")
+    bold13 = CTkFont(family = font, size = 13, weight = "bold")
+    bold14 = CTkFont(family = font, size = 14, weight = "bold")
+    bold16 = CTkFont(family = font, size = 16, weight = "bold")
+    bold17 = CTkFont(family = font, size = 17, weight = "bold")
+    bold18 = CTkFont(family = font, size = 18, weight = "bold")
+    bold19 = CTkFont(family = font, size = 19, weight = "bold")
+    bold20 = CTkFont(family = font, size = 20, weight = "bold")
+    bold21 = CTkFont(family = font, size = 21, weight = "bold")
+    bold22 = CTkFont(family = font, size = 22, weight = "bold")
+    bold23 = CTkFont(family = font, size = 23, weight = "bold")
+    bold24 = CTkFont(family = font, size = 24, weight = "bold")
+
+    # Images
+    logo_git      = CTkImage(pillow_image_open(find_by_relative_path(f"Assets{os_separator}github_logo.png")),    size=(22, 22))
+    logo_telegram = CTkImage(pillow_image_open(find_by_relative_path(f"Assets{os_separator}telegram_logo.png")),  size=(18, 18))
+    stop_icon     = CTkImage(pillow_image_open(find_by_relative_path(f"Assets{os_separator}stop_icon.png")),      size=(15, 15))
+    play_icon     = CTkImage(pillow_image_open(find_by_relative_path(f"Assets{os_separator}upscale_icon.png")),   size=(15, 15))
+    clear_icon    = CTkImage(pillow_image_open(find_by_relative_path(f"Assets{os_separator}clear_icon.png")),     size=(15, 15))
+    info_icon     = CTkImage(pillow_image_open(find_by_relative_path(f"Assets{os_separator}info_icon.png")),      size=(18, 18))
+
+    app = App(window)
+    window.update()
+    window.mainloop()
\ No newline at end of file